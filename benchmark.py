@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*
+import os
+import sys
+import time
+import json
+import argparse
+import shutil
+import tempfile
+import subprocess
+import tracemalloc
+import glparse
+
+def bench_headers(headers, repeat):
+	"""Time `glparse._chew()` over `headers`, returning the best lines/sec of `repeat` runs per header."""
+	results = {}
+	for header in headers:
+		with open(header, 'r', encoding='utf-8') as f:
+			num_lines = len(f.read().splitlines())
+		best = None
+		for _ in range(repeat):
+			start = time.perf_counter()
+			for _ in glparse._chew(header): pass
+			elapsed = time.perf_counter() - start
+			if best is None or elapsed < best: best = elapsed
+		results[header] = (num_lines, best)
+	return results
+
+def bench_overloads(glxml, repeat):
+	"""Time `glparse._overload_check()` and the linear scan it replaced over every command in `glxml`.
+
+	Returns the number of commands and the best time of `repeat` runs of both classifiers.
+	"""
+	membernames = [funcn[len(glparse.prefix):] for funcn in glxml['funcs']]
+	times = {}
+	for name, classify in (('linear', glparse._overload_check_linear), ('regex', glparse._overload_check)):
+		best = None
+		for _ in range(repeat):
+			start = time.perf_counter()
+			for membername in membernames: classify(membername)
+			elapsed = time.perf_counter() - start
+			if best is None or elapsed < best: best = elapsed
+		times[name] = best
+	return len(membernames), times
+
+def run_pipeline(glxmlfile, headers, tokenize, measure):
+	"""Run every generation phase once, passing each one through `measure(phase_name, func)`."""
+	glxml = measure('do_parse_glxml', lambda: glparse.do_parse_glxml(glxmlfile))
+	for header in tokenize:
+		measure(f'_chew:{header}', lambda: list(glparse._chew(header)))
+	versions = measure('do_parse_headers', lambda: glparse.do_parse_headers(headers))
+	registry = measure('GLRegistry', lambda: glparse.GLRegistry(glxml))
+	results = {}
+	for target in glparse.backends:
+		results |= measure(f'do_parse:{target}', lambda: glparse.do_parse(versions, registry, targets = [target]))
+	results[f'{glparse.modname}.json'] = measure('dump_glxml_json', lambda: glparse.dump_glxml_json(glxml))
+	def write():
+		with tempfile.TemporaryDirectory() as out_dir:
+			for filename, data in results.items():
+				glparse._write_if_changed(os.path.join(out_dir, filename), data)
+	measure('write', write)
+
+def bench_pipeline(glxmlfile, headers, tokenize, repeat):
+	"""Measure each phase: the best wall and CPU time of `repeat` runs, then the peak memory of one traced run."""
+	phases = {}
+	def timed(name, func):
+		wall, cpu = time.perf_counter(), time.process_time()
+		ret = func()
+		wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+		phase = phases.setdefault(name, {'wall': wall, 'cpu': cpu})
+		phase['wall'] = min(phase['wall'], wall)
+		phase['cpu'] = min(phase['cpu'], cpu)
+		return ret
+	for _ in range(repeat):
+		run_pipeline(glxmlfile, headers, tokenize, timed)
+
+	# The peak is taken over what the phase allocated on top of what earlier phases left alive
+	def traced(name, func):
+		start = tracemalloc.get_traced_memory()[0]
+		tracemalloc.reset_peak()
+		ret = func()
+		phases[name]['peak_mem'] = tracemalloc.get_traced_memory()[1] - start
+		return ret
+	tracemalloc.start()
+	try:
+		run_pipeline(glxmlfile, headers, tokenize, traced)
+	finally:
+		tracemalloc.stop()
+	return phases
+
+def compare(phases, baseline, threshold, min_time, mem_threshold, min_mem):
+	"""Return the `(phase, metric, baseline, value, change)` whose wall or CPU time grew by more than `threshold`
+	percent over `baseline`, or whose peak memory grew by more than `mem_threshold` percent.
+
+	Times below `min_time` seconds and peaks below `min_mem` bytes in both runs are too noisy to judge and are skipped,
+	as are the metrics an older baseline doesn't have.
+	"""
+	regressions = []
+	for name, phase in phases.items():
+		base = baseline.get(name)
+		if base is None: continue
+		for metric, limit, floor in (('wall', threshold, min_time), ('cpu', threshold, min_time), ('peak_mem', mem_threshold, min_mem)):
+			if metric not in base: continue
+			if phase[metric] < floor and base[metric] < floor: continue
+			change = (phase[metric] - base[metric]) / max(base[metric], floor) * 100
+			if change > limit:
+				regressions += [(name, metric, base[metric], phase[metric], change)]
+	return regressions
+
+# The functions a typical short-lived tool context calls, for the startup benchmark
+startup_funcs = [
+	'glClear', 'glClearColor', 'glViewport', 'glEnable', 'glDisable', 'glBlendFunc', 'glGetIntegerv', 'glGetError',
+	'glGenBuffers', 'glBindBuffer', 'glBufferData', 'glDeleteBuffers', 'glGenVertexArrays', 'glBindVertexArray',
+	'glVertexAttribPointer', 'glEnableVertexAttribArray', 'glCreateShader', 'glShaderSource', 'glCompileShader',
+	'glCreateProgram', 'glAttachShader', 'glLinkProgram', 'glUseProgram', 'glDeleteProgram', 'glGetUniformLocation',
+	'glUniform1i', 'glUniformMatrix4fv', 'glGenTextures', 'glBindTexture', 'glTexImage2D', 'glTexParameteri',
+	'glActiveTexture', 'glDrawArrays', 'glDrawElements',
+]
+
+cpp_startup_main = '''#include "glcore.hpp"
+
+#include<chrono>
+#include<cstdio>
+#include<cstdlib>
+#include<cstring>
+
+using namespace GL;
+
+static size_t Lookups = 0;
+
+// Every symbol resolves to a function that does nothing, except `glGetString()` that has to report a version
+static void APIENTRY Stub() {}
+static const GLubyte* APIENTRY StubGetString(GLenum) { return reinterpret_cast<const GLubyte*>("4.6.0"); }
+static void* APIENTRY StubGetProcAddress(const char* symbol)
+{
+	Lookups++;
+	if (!strcmp(symbol, "glGetString")) return reinterpret_cast<void*>(&StubGetString);
+	return reinterpret_cast<void*>(&Stub);
+}
+
+template<typename FuncType>
+static void Call(const FuncType& Func) { Func(); }
+template<typename RetType, typename... ArgTypes>
+static void Call(RetType (APIENTRYP Func)(ArgTypes...)) { Func(ArgTypes()...); }
+%(mode_call)s
+int main(int argc, char** argv)
+{
+	int Contexts = argc > 1 ? atoi(argv[1]) : 1000;
+	double CtorTime = 0, CallTime = 0;
+	size_t CtorLookups = 0, CallLookups = 0;
+	for (int i = 0; i < Contexts; i++)
+	{
+		Lookups = 0;
+		auto t0 = std::chrono::steady_clock::now();
+		%(class_name)s gl(StubGetProcAddress);
+		auto t1 = std::chrono::steady_clock::now();
+		CtorLookups += Lookups;
+		Lookups = 0;
+%(calls)s
+		auto t2 = std::chrono::steady_clock::now();
+		CallLookups += Lookups;
+		CtorTime += std::chrono::duration<double>(t1 - t0).count();
+		CallTime += std::chrono::duration<double>(t2 - t1).count();
+	}
+	printf("%%.9f %%.9f %%zu %%zu\\n", CtorTime / Contexts, CallTime / Contexts, CtorLookups / Contexts, CallLookups / Contexts);
+	return 0;
+}
+'''
+
+# The lazy and the table loader modes both make the functions inline members
+cpp_startup_member_call = '''template<typename Object, typename Class, typename RetType, typename... ArgTypes>
+static void Call(const Object& gl, RetType (Class::*Func)(ArgTypes...) const) { (gl.*Func)(ArgTypes()...); }
+'''
+
+rs_startup_main = '''#[path = "glcore.rs"]
+mod glcore;
+use glcore::*;
+use std::{ffi::c_void, time::Instant};
+
+// Every symbol resolves to a function that does nothing, except `glGetString()` that has to report a version
+extern "system" fn stub() {}
+extern "system" fn stub_get_string(_name: GLenum) -> *const GLubyte {
+	b"4.6.0\\0".as_ptr()
+}
+
+fn main() {
+	let contexts: usize = std::env::args().nth(1).map_or(1000, |n| n.parse().unwrap());
+	let mut ctor_time = 0.0;
+	let mut lookups = 0;
+	for _ in 0..contexts {
+		let t0 = Instant::now();
+		let gl = GLCore::new(|symbol| {
+			lookups += 1;
+			if symbol == "glGetString" {stub_get_string as *const c_void} else {stub as *const c_void}
+		}).unwrap();
+		ctor_time += t0.elapsed().as_secs_f64();
+		std::hint::black_box(&gl);
+	}
+	println!("{:.9} {}", ctor_time / contexts as f64, lookups / contexts);
+}
+'''
+
+rs_calls_main = '''#[path = "glcore.rs"]
+mod glcore;
+use glcore::*;
+use std::{ffi::c_void, hint::black_box, time::Instant};
+
+// Every symbol resolves to a function that does nothing, except `glGetString()` that has to report a version and
+// `glUniform2f()` that is missing
+extern "system" fn stub() {}
+extern "system" fn stub_get_string(_name: GLenum) -> *const GLubyte {
+	b"4.6.0\\0".as_ptr()
+}
+
+// Warm up, then time `samples` batches of `iters` calls, returns the median and the fastest batch in ns per call
+fn measure(samples: usize, iters: usize, mut call: impl FnMut()) -> (f64, f64) {
+	for _ in 0..iters {
+		call();
+	}
+	let mut times: Vec<f64> = (0..samples).map(|_| {
+		let t0 = Instant::now();
+		for _ in 0..iters {
+			call();
+		}
+		t0.elapsed().as_secs_f64() * 1e9 / iters as f64
+	}).collect();
+	times.sort_by(|a, b| a.total_cmp(b));
+	(times[samples / 2], times[0])
+}
+
+fn main() {
+	let samples: usize = std::env::args().nth(1).map_or(50, |n| n.parse().unwrap());
+	let iters: usize = std::env::args().nth(2).map_or(1000000, |n| n.parse().unwrap());
+	let miss = std::env::args().nth(3).is_some();
+	let gl = GLCore::new(|symbol| match symbol {
+		"glGetString" => stub_get_string as *const c_void,
+		"glUniform2f" => std::ptr::null(),
+		_ => stub as *const c_void,
+	}).unwrap();
+	let gl = black_box(&gl);
+	let (hit, hit_min) = measure(samples, iters, || {black_box(gl.glUniform1f(black_box(0), black_box(1.0))).ok();});
+	if miss {
+		let (miss, miss_min) = measure(samples, iters, || {black_box(gl.glUniform2f(black_box(0), black_box(1.0), black_box(2.0))).ok();});
+		println!("{:.3} {:.3} {:.3} {:.3}", hit, hit_min, miss, miss_min);
+	} else {
+		println!("{:.3} {:.3}", hit, hit_min);
+	}
+}
+'''
+
+cpp_commands_main = '''#include "glcore_commandbuffer.hpp"
+
+#include<algorithm>
+#include<chrono>
+#include<cstdio>
+#include<cstdlib>
+#include<cstring>
+#include<vector>
+
+using namespace GL;
+
+// Every symbol resolves to a function that does nothing, except `glGetString()` that has to report a version
+static void APIENTRY Stub() {}
+static const GLubyte* APIENTRY StubGetString(GLenum) { return reinterpret_cast<const GLubyte*>("4.6.0"); }
+static void* APIENTRY StubGetProcAddress(const char* symbol)
+{
+	if (!strcmp(symbol, "glGetString")) return reinterpret_cast<void*>(&StubGetString);
+	return reinterpret_cast<void*>(&Stub);
+}
+
+// A bind, uniform, bind, draw pattern, the same for recording and for calling directly
+template<typename Target>
+static void Issue(Target& Commands, size_t i)
+{
+	Commands.BindBuffer(0x8892 /* GL_ARRAY_BUFFER */, GLuint(i));
+	Commands.Uniform4f(GLint(i & 15), 1.0f, 0.5f, 0.25f, float(i));
+	Commands.BindTexture(0x0DE1 /* GL_TEXTURE_2D */, GLuint(i));
+	Commands.DrawArrays(0x0004 /* GL_TRIANGLES */, 0, GLsizei(i));
+}
+
+// Warm up, then time `Samples` batches, returns the median and the fastest batch in seconds
+template<typename Func>
+static void Measure(int Samples, Func Batch, double& Median, double& Fastest)
+{
+	Batch();
+	std::vector<double> Times;
+	for (int s = 0; s < Samples; s++)
+	{
+		auto t0 = std::chrono::steady_clock::now();
+		Batch();
+		Times.push_back(std::chrono::duration<double>(std::chrono::steady_clock::now() - t0).count());
+	}
+	std::sort(Times.begin(), Times.end());
+	Median = Times[Samples / 2];
+	Fastest = Times[0];
+}
+
+int main(int argc, char** argv)
+{
+	int Samples = argc > 1 ? atoi(argv[1]) : 50;
+	size_t Iters = argc > 2 ? strtoull(argv[2], nullptr, 10) : 1000000;
+	Version46 gl(StubGetProcAddress);
+	CommandBuffer Commands;
+	double Times[6];
+	Measure(Samples, [&]() { Commands.Reset(); for (size_t i = 0; i < Iters; i += 4) Issue(Commands, i); }, Times[0], Times[1]);
+	Measure(Samples, [&]() { Commands.Replay(gl); }, Times[2], Times[3]);
+	Measure(Samples, [&]() { for (size_t i = 0; i < Iters; i += 4) Issue(gl, i); }, Times[4], Times[5]);
+	for (double Time : Times) printf("%.0f ", double(Commands.GetCount()) / Time);
+	printf("%zu %zu\\n", Commands.GetCount(), Commands.GetSize());
+	return 0;
+}
+'''
+
+# A translation unit that only needs one version, `include` pulls it in
+cpp_headers_unit = '''%(include)s
+
+void Draw(GL::%(class_name)s& gl, GL::GLuint vao, GL::GLsizei count)
+{
+	gl.BindVertexArray(vao);
+	gl.DrawArrays(GL::%(class_name)s::TRIANGLES, 0, count);
+}
+'''
+
+def _generate(versions, registry, target, options, out_dir):
+	"""Generate one backend into `out_dir`, returns the total size of the generated files."""
+	size = 0
+	for filename, data in glparse.do_parse(versions, registry, targets = [target], options = options).items():
+		glparse._write_if_changed(os.path.join(out_dir, filename), data)
+		size += len(data.encode('utf-8'))
+	return size
+
+def _build(command, exe, cwd = None):
+	"""Run a compiler command, returns the build time and the size of the built executable."""
+	start = time.perf_counter()
+	subprocess.run(command, check = True, cwd = cwd)
+	return time.perf_counter() - start, os.path.getsize(exe)
+
+def bench_cpp_startup(versions, registry, cxx, contexts):
+	"""Build the C++ output eagerly, with `cpp_lazy` and with `table_loader` against a stub `GetProcAddress` that counts lookups.
+
+	Returns, per mode, the generated and the executable sizes, the build time, the mean time to construct
+	a context and to make the first calls of `startup_funcs`, and how many symbols each of them looked up.
+	"""
+	class_name = glparse._style_change(list(versions.keys())[-1])
+	funcnames = [funcn[len(glparse.prefix):] for funcn in startup_funcs if any(funcn in curver['funcproto'] for curver in versions.values())]
+	results = {}
+	for mode, options, mode_call, calls in (
+		('eager', {}, '', ''.join(f'\t\tCall(gl.{membername});\n' for membername in funcnames)),
+		('lazy', {'cpp_lazy': True}, cpp_startup_member_call, ''.join(f'\t\tCall(gl, &{class_name}::{membername});\n' for membername in funcnames)),
+		('table', {'table_loader': True}, cpp_startup_member_call, ''.join(f'\t\tCall(gl, &{class_name}::{membername});\n' for membername in funcnames)),
+	):
+		with tempfile.TemporaryDirectory() as build_dir:
+			source_size = _generate(versions, registry, 'cpp', options, build_dir)
+			with open(os.path.join(build_dir, 'startup.cpp'), 'w', encoding='utf-8') as f:
+				f.write(cpp_startup_main % {
+					'mode_call': mode_call,
+					'class_name': class_name,
+					'calls': calls,
+				})
+			exe = os.path.join(build_dir, 'startup')
+			build_time, binary_size = _build([cxx, '-std=c++17', '-O2', '-o', exe, os.path.join(build_dir, f'{glparse.modname}.cpp'), os.path.join(build_dir, 'startup.cpp')], exe)
+			output = subprocess.run([exe, str(contexts)], check = True, capture_output = True, text = True).stdout.split()
+		results[mode] = {
+			'source': source_size,
+			'binary': binary_size,
+			'build': build_time,
+			'ctor': float(output[0]),
+			'calls': float(output[1]),
+			'ctor_lookups': int(output[2]),
+			'call_lookups': int(output[3]),
+		}
+	return results
+
+def bench_rs_startup(versions, registry, rustc, contexts):
+	"""Build the Rust output eagerly and with `rs_shared_table` against a stub `get_proc_address` that counts lookups.
+
+	Returns, per mode, the generated and the executable sizes, the build time, the mean time of `GLCore::new()`
+	and how many symbols it looked up.
+	"""
+	results = {}
+	for mode, options in (('eager', {}), ('shared', {'rs_shared_table': True})):
+		with tempfile.TemporaryDirectory() as build_dir:
+			source_size = _generate(versions, registry, 'rs', options, build_dir)
+			with open(os.path.join(build_dir, 'startup.rs'), 'w', encoding='utf-8') as f:
+				f.write(rs_startup_main)
+			exe = os.path.join(build_dir, 'startup')
+			build_time, binary_size = _build([rustc, '--edition', '2021', '-O', '-o', exe, os.path.join(build_dir, 'startup.rs')], exe)
+			output = subprocess.run([exe, str(contexts)], check = True, capture_output = True, text = True).stdout.split()
+		results[mode] = {
+			'source': source_size,
+			'binary': binary_size,
+			'build': build_time,
+			'ctor': float(output[0]),
+			'ctor_lookups': int(output[1]),
+		}
+	return results
+
+def bench_rs_calls(glxmlfile, headers, rustc, samples, iters):
+	"""Time a call through the Rust wrappers of a stub function, in each way of handling a missing function.
+
+	`plain` calls the pointer, `catch` is the `catch_nullptr` feature and `nullcheck` is `rs_nullcheck`. Returns, per
+	mode, the median and the fastest ns per call, and for `nullcheck` also of a call to a missing function. A missing
+	function aborts the `catch` mode on Rust 1.81 or newer, since a panic can't unwind out of an `extern "system"` dummy.
+	"""
+	versions = glparse.do_parse_headers(headers)
+	registry = glparse.GLRegistry(glparse.do_parse_glxml(glxmlfile))
+	results = {}
+	for mode, options, features in (('plain', {}, []), ('catch', {}, ['catch_nullptr']), ('nullcheck', {'rs_nullcheck': True}, [])):
+		with tempfile.TemporaryDirectory() as build_dir:
+			_generate(versions, registry, 'rs', options, build_dir)
+			with open(os.path.join(build_dir, 'calls.rs'), 'w', encoding='utf-8') as f:
+				f.write(rs_calls_main)
+			exe = os.path.join(build_dir, 'calls')
+			cfgs = [arg for feature in features for arg in ('--cfg', f'feature="{feature}"')]
+			_build([rustc, '--edition', '2021', '-O', *cfgs, '-o', exe, os.path.join(build_dir, 'calls.rs')], exe)
+			command = [exe, str(samples), str(iters)] + (['miss'] if mode == 'nullcheck' else [])
+			output = [float(v) for v in subprocess.run(command, check = True, capture_output = True, text = True).stdout.split()]
+		results[mode] = {'hit': output[0], 'hit_min': output[1]}
+		if len(output) > 2:
+			results[mode] |= {'miss': output[2], 'miss_min': output[3]}
+	return results
+
+def bench_cpp_commands(glxmlfile, headers, cxx, samples, iters):
+	"""Time recording a bind, uniform, bind, draw pattern into the C++ `CommandBuffer`, replaying it through stub functions, and calling them directly.
+
+	Returns, for `record`, `replay` and `direct`, the median and the fastest calls/sec, plus the recorded bytes per command.
+	"""
+	versions = glparse.do_parse_headers(headers)
+	registry = glparse.GLRegistry(glparse.do_parse_glxml(glxmlfile))
+	with tempfile.TemporaryDirectory() as build_dir:
+		_generate(versions, registry, 'cpp', {'command_buffer': True}, build_dir)
+		with open(os.path.join(build_dir, 'commands.cpp'), 'w', encoding='utf-8') as f:
+			f.write(cpp_commands_main)
+		exe = os.path.join(build_dir, 'commands')
+		_build([cxx, '-std=c++17', '-O2', '-o', exe, os.path.join(build_dir, f'{glparse.modname}.cpp'), os.path.join(build_dir, f'{glparse.modname}_commandbuffer.cpp'), os.path.join(build_dir, 'commands.cpp')], exe)
+		output = [float(v) for v in subprocess.run([exe, str(samples), str(iters)], check = True, capture_output = True, text = True).stdout.split()]
+	results = {mode: {'rate': output[i * 2], 'rate_max': output[i * 2 + 1]} for i, mode in enumerate(('record', 'replay', 'direct'))}
+	results['bytes_per_command'] = output[7] / output[6]
+	return results
+
+def bench_cpp_headers(glxmlfile, headers, cxx, repeat):
+	"""Compile a translation unit that uses OpenGL 3.3 through `glcore.hpp`, through its `cpp_split` header and by
+	importing the `cpp_module` module.
+
+	Returns, per mode, the fastest of `repeat` compiles, and the preprocessed lines of the header modes or the time to
+	build the module. The module needs `-fmodules-ts` (GCC), it is left out when the compiler doesn't build it.
+	"""
+	versions = glparse.do_parse_headers(headers)
+	registry = glparse.GLRegistry(glparse.do_parse_glxml(glxmlfile))
+	version = 'VERSION_3_3' if 'VERSION_3_3' in versions else next(iter(versions))
+	class_name = glparse._style_change(version)
+	results = {}
+	for mode, options, include in (
+		('monolithic', {}, f'#include "{glparse.modname}.hpp"'),
+		('split', {'cpp_split': True}, f'#include "{glparse.modname}_{version.lower()}.hpp"'),
+		('module', {'cpp_module': True}, f'import {glparse.modname};'),
+	):
+		with tempfile.TemporaryDirectory() as build_dir:
+			_generate(versions, registry, 'cpp', options, build_dir)
+			unit = os.path.join(build_dir, 'unit.cpp')
+			with open(unit, 'w', encoding='utf-8') as f:
+				f.write(cpp_headers_unit % {'include': include, 'class_name': class_name})
+			obj = os.path.join(build_dir, 'unit.o')
+			command = [cxx, '-std=c++20', '-O2', '-c', unit, '-o', obj]
+			if mode == 'module':
+				command[1:1] = ['-fmodules-ts']
+				try:
+					module_time, module_size = _build([cxx, '-std=c++20', '-fmodules-ts', '-O2', '-x', 'c++', '-c', f'{glparse.modname}.cppm', '-o', f'{glparse.modname}.o'], os.path.join(build_dir, f'{glparse.modname}.o'), cwd = build_dir)
+				except (subprocess.CalledProcessError, FileNotFoundError):
+					continue
+				results[mode] = {'module_build': module_time}
+			else:
+				preprocessed = subprocess.run([cxx, '-std=c++20', '-E', unit], check = True, capture_output = True, text = True).stdout
+				results[mode] = {'lines': preprocessed.count('\n')}
+			results[mode]['compile'] = min(_build(command, obj, cwd = build_dir)[0] for i in range(repeat))
+	return results
+
+def bench_startup(glxmlfile, headers, cxx, rustc, contexts):
+	"""Compare the loading modes of every backend, the ones without a compiler only report the generated size."""
+	versions = glparse.do_parse_headers(headers)
+	registry = glparse.GLRegistry(glparse.do_parse_glxml(glxmlfile))
+	results = {}
+	if shutil.which(cxx):
+		results['cpp'] = bench_cpp_startup(versions, registry, cxx, contexts)
+	if shutil.which(rustc):
+		results['rs'] = bench_rs_startup(versions, registry, rustc, contexts)
+	with tempfile.TemporaryDirectory() as build_dir:
+		results['cs'] = {mode: {'source': _generate(versions, registry, 'cs', options, build_dir)} for mode, options in (('eager', {}), ('table', {'table_loader': True}))}
+	return results
+
+if __name__ == '__main__':
+	argp = argparse.ArgumentParser(description = 'Benchmark the glparse.py generator phase by phase.')
+	argp.add_argument('headers', nargs = '*', default = ['glcore.h', 'gles32.h'], help = 'the headers to generate from, in version order (default: glcore.h gles32.h)')
+	argp.add_argument('--glxml', default = 'gl.xml', help = 'the OpenGL registry to parse (default: gl.xml)')
+	argp.add_argument('--tokenize', default = 'glcore.h,gles32.h,glcore_arb.h', help = 'comma separated headers to benchmark the tokenizer on (default: glcore.h,gles32.h,glcore_arb.h)')
+	argp.add_argument('-n', '--repeat', type = int, default = 5, help = 'runs per phase, or compiles per --cpp-headers mode, the best one is reported (default: 5)')
+	argp.add_argument('-o', '--output', help = 'write the results as JSON to this file')
+	argp.add_argument('-b', '--baseline', help = 'compare against the JSON results stored in this file')
+	argp.add_argument('--save-baseline', action = 'store_true', help = 'store the results as the new baseline instead of comparing')
+	argp.add_argument('--threshold', type = float, default = 25, help = 'percentage of wall or CPU time growth that fails the comparison (default: 25)')
+	argp.add_argument('--mem-threshold', type = float, default = 25, help = 'percentage of peak memory growth that fails the comparison (default: 25)')
+	argp.add_argument('--startup', action = 'store_true', help = 'only compare the code size, build time and context startup of the loading modes, the C++ and Rust ones need their compilers')
+	argp.add_argument('--cxx', default = 'c++', help = 'the C++ compiler for --startup, --commands and --cpp-headers (default: c++)')
+	argp.add_argument('--rustc', default = 'rustc', help = 'the Rust compiler for --startup (default: rustc)')
+	argp.add_argument('--contexts', type = int, default = 1000, help = 'contexts to create for --startup (default: 1000)')
+	argp.add_argument('--rs-calls', action = 'store_true', help = 'only compare the per call cost of the Rust wrappers with plain, `catch_nullptr` and `--rs-nullcheck` function pointers, needs rustc')
+	argp.add_argument('--commands', action = 'store_true', help = 'only compare the calls/sec of recording into the C++ `CommandBuffer`, replaying it and calling directly, against stub functions, needs the C++ compiler')
+	argp.add_argument('--cpp-headers', action = 'store_true', help = 'only compare the compile time of a translation unit that uses OpenGL 3.3 through `glcore.hpp`, its `--cpp-split` header and the `--cpp-module` module, needs the C++ compiler')
+	argp.add_argument('--samples', type = int, default = 50, help = 'timed batches per mode for --rs-calls and --commands (default: 50)')
+	argp.add_argument('--iters', type = int, default = 1000000, help = 'calls per batch for --rs-calls and --commands (default: 1000000)')
+	argp.add_argument('--min-time', type = float, default = 0.005, help = 'phases faster than this many seconds are not compared (default: 0.005)')
+	argp.add_argument('--min-mem', type = int, default = 65536, help = 'peak memory below this many bytes is not compared (default: 65536)')
+	args = argp.parse_args()
+	tokenize = [h.strip() for h in args.tokenize.split(',') if h.strip()]
+
+	if args.rs_calls:
+		results = bench_rs_calls(args.glxml, args.headers, args.rustc, args.samples, args.iters)
+		print(f'{"mode":<10} {"call ns":>8} {"min ns":>8} {"miss ns":>8} {"min ns":>8}')
+		for mode, r in results.items():
+			line = f'{mode:<10} {r["hit"]:>8.2f} {r["hit_min"]:>8.2f}'
+			if 'miss' in r:
+				line += f' {r["miss"]:>8.2f} {r["miss_min"]:>8.2f}'
+			print(line)
+		if args.output:
+			with open(args.output, 'w', encoding='utf-8') as f:
+				json.dump(results, f, indent=4)
+		sys.exit(0)
+
+	if args.commands:
+		results = bench_cpp_commands(args.glxml, args.headers, args.cxx, args.samples, args.iters)
+		print(f'{"mode":<7} {"Mcalls/s":>9} {"max":>9}')
+		for mode in ('record', 'replay', 'direct'):
+			print(f'{mode:<7} {results[mode]["rate"] / 1000000:>9.1f} {results[mode]["rate_max"] / 1000000:>9.1f}')
+		print(f'{results["bytes_per_command"]:.1f} bytes per recorded command')
+		if args.output:
+			with open(args.output, 'w', encoding='utf-8') as f:
+				json.dump(results, f, indent=4)
+		sys.exit(0)
+
+	if args.cpp_headers:
+		results = bench_cpp_headers(args.glxml, args.headers, args.cxx, args.repeat)
+		print(f'{"mode":<10} {"lines":>8} {"compile s":>10} {"module s":>9}')
+		for mode, r in results.items():
+			line = f'{mode:<10} {r.get("lines", ""):>8} {r["compile"]:>10.3f}'
+			if 'module_build' in r:
+				line += f' {r["module_build"]:>9.3f}'
+			print(line)
+		if args.output:
+			with open(args.output, 'w', encoding='utf-8') as f:
+				json.dump(results, f, indent=4)
+		sys.exit(0)
+
+	if args.startup:
+		results = bench_startup(args.glxml, args.headers, args.cxx, args.rustc, args.contexts)
+		print(f'{"target":<7} {"mode":<6} {"source KiB":>10} {"binary KiB":>10} {"build s":>8} {"ctor us":>10} {"lookups":>8} {"calls us":>10} {"lookups":>8}')
+		for target, modes in results.items():
+			for mode, r in modes.items():
+				line = f'{target:<7} {mode:<6} {r["source"] / 1024:>10.0f}'
+				if 'binary' in r:
+					line += f' {r["binary"] / 1024:>10.0f} {r["build"]:>8.1f} {r["ctor"] * 1000000:>10.2f} {r["ctor_lookups"]:>8}'
+				if 'calls' in r:
+					line += f' {r["calls"] * 1000000:>10.2f} {r["call_lookups"]:>8}'
+				print(line)
+		if args.output:
+			with open(args.output, 'w', encoding='utf-8') as f:
+				json.dump(results, f, indent=4)
+		sys.exit(0)
+
+	for header, (num_lines, elapsed) in bench_headers(tokenize, args.repeat).items():
+		print(f'{header}: {num_lines} lines, {num_lines / elapsed:,.0f} lines/sec')
+
+	num_commands, times = bench_overloads(glparse.do_parse_glxml(args.glxml), args.repeat)
+	print(f'_overload_check: {num_commands} commands, {times["regex"] * 1000:.2f} ms, linear scan {times["linear"] * 1000:.2f} ms')
+
+	phases = bench_pipeline(args.glxml, args.headers, tokenize, args.repeat)
+	print(f'{"phase":<28} {"wall ms":>10} {"cpu ms":>10} {"peak KiB":>10}')
+	for name, phase in phases.items():
+		print(f'{name:<28} {phase["wall"] * 1000:>10.2f} {phase["cpu"] * 1000:>10.2f} {phase["peak_mem"] / 1024:>10.0f}')
+
+	results = {
+		'python': sys.version.split()[0],
+		'repeat': args.repeat,
+		'phases': phases,
+	}
+	if args.output:
+		with open(args.output, 'w', encoding='utf-8') as f:
+			json.dump(results, f, indent=4)
+	if args.baseline:
+		if args.save_baseline:
+			with open(args.baseline, 'w', encoding='utf-8') as f:
+				json.dump(results, f, indent=4)
+			print(f'Baseline saved to `{args.baseline}`')
+		else:
+			with open(args.baseline, 'r', encoding='utf-8') as f:
+				baseline = json.load(f)['phases']
+			regressions = compare(phases, baseline, args.threshold, args.min_time, args.mem_threshold, args.min_mem)
+			for name, metric, base_value, value, change in regressions:
+				if metric == 'peak_mem':
+					print(f'Regression: {name} peaked at {value / 1024:.0f} KiB, {change:+.1f}% over the baseline {base_value / 1024:.0f} KiB')
+				else:
+					print(f'Regression: {name} took {value * 1000:.2f} ms of {metric} time, {change:+.1f}% over the baseline {base_value * 1000:.2f} ms')
+			if len(regressions):
+				sys.exit(1)
+			print(f'No phase regressed by more than {args.threshold:g}% in time or {args.mem_threshold:g}% in peak memory over `{args.baseline}`')
+	sys.exit(0)
@@ -1,7 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*
 import io
+import os
+import sys
+import array
+import mmap
+import struct
+import argparse
 import json
+import hashlib
+import re
+import functools
+import itertools
+import cProfile
+import pstats
+import concurrent.futures
 import xml.etree.ElementTree as ET
 
 prefix = 'gl'
@@ -12,32 +25,102 @@ PREFIX_ES_ = f'{PREFIX}_ES_'
 modname = 'glcore'
 rust_derive = '#[derive(Clone, Copy, PartialEq, Eq, Hash)]'
 rust_derive_global = '#[derive(Default, Debug, Clone, Copy, PartialEq, Eq, Hash)]'
-already_defined = set()
+# Next to the script, so a run from another directory still finds it
+cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.glcache')
+# The entries kept of each kind, so switching between a few option sets or inputs keeps hitting the cache
+cache_entries = 8
+
+def _hash_files(filenames, salt = ''):
+	h = hashlib.sha256(salt.encode('utf-8'))
+	for filename in filenames:
+		with open(filename, 'rb') as f:
+			h.update(hashlib.sha256(f.read()).digest())
+	return h.hexdigest()
+
+def _cache_load(kind, key):
+	filename = os.path.join(cache_dir, f'{kind}-{key}.json')
+	try:
+		with open(filename, 'r', encoding='utf-8') as f:
+			data = json.load(f)
+		# A hit makes the entry the most recently used one
+		os.utime(filename)
+		return data
+	except (OSError, ValueError):
+		return None
+
+def _cache_store(kind, key, data):
+	os.makedirs(cache_dir, exist_ok=True)
+	with open(os.path.join(cache_dir, f'{kind}-{key}.json'), 'w', encoding='utf-8') as f:
+		json.dump(data, f)
+	# Only the `cache_entries` most recently used entries of the kind are kept
+	entries = [os.path.join(cache_dir, entry) for entry in os.listdir(cache_dir) if entry.startswith(f'{kind}-')]
+	for stale in sorted(entries, key=os.path.getmtime, reverse=True)[cache_entries:]:
+		try:
+			os.remove(stale)
+		except OSError:
+			pass
+
+def _write_if_changed(filename, data):
+	# Text gets the newlines text mode would write, except the C++ sources that were always written with `\n`
+	if isinstance(data, str):
+		if not filename.endswith(('.hpp', '.cpp', '.cppm')): data = data.replace('\n', os.linesep)
+		data = data.encode('utf-8')
+	try:
+		with open(filename, 'rb') as f:
+			if f.read() == data: return
+	except OSError:
+		pass
+	with open(filename, 'wb') as f: f.write(data)
+
+def _iterparse_glxml(glxmlfile):
+	"""Stream the registry, yielding each GL `<enum>`, `<command>` and `<extension>` element.
+
+	Only one element is alive at a time; it's cleared as soon as the consumer
+	resumes, and every finished top-level block is dropped from the root, so
+	the whole registry DOM is never held in memory.
+	"""
+	root = None
+	depth = 0
+	in_enums = False
+	in_commands = False
+	in_extensions = False
+	commands_done = False
+	for event, elem in ET.iterparse(glxmlfile, events=('start', 'end')):
+		if event == 'start':
+			if root is None: root = elem
+			depth += 1
+			if depth == 2:
+				if elem.tag == 'enums':
+					in_enums = elem.get('namespace') == 'GL'
+				elif elem.tag == 'commands':
+					in_commands = not commands_done
+				elif elem.tag == 'extensions':
+					in_extensions = True
+			continue
+		depth -= 1
+		if depth == 2:
+			if in_enums and elem.tag == 'enum':
+				yield elem
+				elem.clear()
+			elif in_commands and elem.tag == 'command':
+				yield elem
+				elem.clear()
+			elif in_extensions and elem.tag == 'extension':
+				yield elem
+				elem.clear()
+		elif depth == 1:
+			if in_commands: commands_done = True
+			in_enums = False
+			in_commands = False
+			in_extensions = False
+			root.clear()
 
 def do_parse_glxml(glxmlfile):
 	group_data = {}
 	enums_data = {}
 	funcs_data = {}
+	extensions_data = {}
 
-	registry = ET.parse('gl.xml').getroot()
-	for enums in registry.iter('enums'):
-		try:
-			if enums.attrib['namespace'] != 'GL': continue
-		except KeyError:
-			continue
-		for enum in enums.iter('enum'):
-			enumname = enum.attrib['name']
-			enumvalue = enum.attrib['value']
-			try:
-				enumgroups = enum.attrib['group'].split(',')
-			except KeyError:
-				enumgroups = []
-			enums_data[enumname] = {'value': enumvalue, 'group': enumgroups, 'type': {}}
-			for enumgroup in enumgroups:
-				if not enumgroup in group_data: group_data[enumgroup] = []
-				group_data[enumgroup] += [enumname]
-
-	commands = next(registry.iter('commands'))
 	def parsecmd(parsetagtype, tag):
 		valtype = []
 		valname = ''
@@ -65,8 +148,21 @@ def do_parse_glxml(glxmlfile):
 			if tagproc[p.tag](p): break
 		valtype = ' '.join(valtype).replace('  ', ' ').strip()
 		return valtype, valname
-	groupname_used_in_args = set()
-	for command in commands:
+
+	def onenum(enum):
+		enumname = enum.attrib['name']
+		enumvalue = enum.attrib['value']
+		try:
+			enumgroups = enum.attrib['group'].split(',')
+		except KeyError:
+			enumgroups = []
+		enums_data[enumname] = {'value': enumvalue, 'group': enumgroups, 'type': 'GLenum'}
+		for enumgroup in enumgroups:
+			if not enumgroup in group_data: group_data[enumgroup] = []
+			group_data[enumgroup].append(enumname)
+
+	group_argtypes = {} # key: group name; value: the types of the params using it
+	def oncommand(command):
 		proto = command[0]
 		retval, funcname = parsecmd('proto', proto)
 
@@ -77,25 +173,51 @@ def do_parse_glxml(glxmlfile):
 			argdata = {'type': argtype, 'name': argname}
 			try:
 				groupname = pt['group']
-				groupname_used_in_args |= {groupname}
 			except KeyError:
 				groupname = None
 			argdata['group'] = groupname
+			# How many elements a pointer param points to, as an expression of the other params
+			argdata['len'] = pt.get('len')
 			arglist += [argdata]
 			if groupname is None:
 				continue
-			for enumname in group_data[groupname]:
-				try:
-					enums_data[enumname]['type'][argtype] |= {groupname}
-				except KeyError:
-					enums_data[enumname]['type'][argtype] = {groupname}
+			try:
+				group_argtypes[groupname].add(argtype)
+			except KeyError:
+				group_argtypes[groupname] = {argtype}
 		funcs_data[funcname] = {
 			'return': retval,
 			'params': arglist
 		}
 		#print(f'{retval} {funcname} ({", ".join(["%s %s" % (arg["type"], arg["name"]) for arg in arglist])});')
 
-	groupname_not_used_in_args = set(group_data.keys()) - groupname_used_in_args
+	def onextension(extension):
+		enumnames = []
+		funcnames = []
+		for require in extension.iter('require'):
+			# Only what the desktop core profile gets from the extension
+			if require.get('api', 'gl') != 'gl' or require.get('profile', 'core') != 'core':
+				continue
+			for item in require:
+				if item.tag == 'enum':
+					enumnames += [item.attrib['name']]
+				elif item.tag == 'command':
+					funcnames += [item.attrib['name']]
+		extensions_data[extension.attrib['name']] = {
+			'supported': extension.attrib['supported'].split('|'),
+			'enums': list(dict.fromkeys(enumnames)),
+			'funcs': list(dict.fromkeys(funcnames))
+		}
+
+	tagproc = {
+		'enum': onenum,
+		'command': oncommand,
+		'extension': onextension,
+	}
+	for elem in _iterparse_glxml(glxmlfile):
+		tagproc[elem.tag](elem)
+
+	groupname_not_used_in_args = set(group_data.keys()) - set(group_argtypes.keys())
 	#print('\n'.join(sorted(list(groupname_not_used_in_args))))
 
 	normal_groups = {}
@@ -110,51 +232,414 @@ def do_parse_glxml(glxmlfile):
 	for groupname in groupname_not_used_in_args:
 		if groupname.endswith('Mask'):
 			designated_grouptypes[groupname] = 'GLbitfield'
-	for enumname, enumdata in enums_data.items():
-		enumtype = enumdata['type']
-		if len(enumtype) == 1:
-			for at, gs in enumtype.items():
-				for g in gs:
-					normal_groups[g] = at
-		elif len(enumtype) > 1:
-			for at, g in enumtype.items():
-				special_groups |= g
-	for enumname in enums_data:
-		enums_data[enumname]['type'] = 'GLenum'
-	for groupname, grouptype in normal_groups.items():
-		for enumname in group_data[groupname]:
-			enums_data[enumname]['type'] = grouptype
-	for groupname in special_groups:
-		for enumname in group_data[groupname]:
-			enums_data[enumname]['type'] = 'GLenum'
-	for groupname, grouptype in designated_grouptypes.items():
-		for enumname in group_data[groupname]:
-			enums_data[enumname]['type'] = grouptype
+
+	# An enum passed as only one type makes its groups of that type, one passed as several types makes them GLenum
+	for enumdata in enums_data.values():
+		argtypes = {}
+		for groupname in enumdata['group']:
+			for argtype in group_argtypes.get(groupname, ()):
+				try:
+					argtypes[argtype] += [groupname]
+				except KeyError:
+					argtypes[argtype] = [groupname]
+		if len(argtypes) == 1:
+			for argtype, groupnames in argtypes.items():
+				for groupname in groupnames:
+					normal_groups[groupname] = argtype
+		elif len(argtypes) > 1:
+			for groupnames in argtypes.values():
+				special_groups |= set(groupnames)
+
+	# Then each enum takes the type of its groups: designated types first, GLenum for special groups, else the last normal group
+	normal_order = {groupname: i for i, groupname in enumerate(normal_groups)}
+	designated_order = {groupname: i for i, groupname in enumerate(designated_grouptypes)}
+	for enumdata in enums_data.values():
+		enumgroups = enumdata['group']
+		designated = [g for g in enumgroups if g in designated_order]
+		if len(designated):
+			enumdata['type'] = designated_grouptypes[max(designated, key=designated_order.get)]
+			continue
+		if any(g in special_groups for g in enumgroups):
+			continue
+		normal = [g for g in enumgroups if g in normal_order]
+		if len(normal):
+			enumdata['type'] = normal_groups[max(normal, key=normal_order.get)]
 	parsed = {
 		'enums': enums_data,
-		'funcs': funcs_data
+		'funcs': funcs_data,
+		'extensions': extensions_data
 	}
-	with open('glcore.json', 'w', encoding='utf-8') as f:
-		json.dump(parsed, f, indent=4)
 	return parsed
 
-def _is_block_begin(line, PREFIX_):
-	return \
-		line.startswith(f'#ifndef {PREFIX_}') or \
-		line.startswith(f'#ifndef {PREFIX_ES_}')
+class GLRegistry:
+	"""Compact, interned form of the `do_parse_glxml()` result.
+
+	Names are interned and indexed, types and groups are replaced by integer
+	IDs, enum values are kept as integers and group membership and params are
+	stored as offset-indexed arrays instead of thousands of small dicts.
+	Extensions refer to their enums and functions by ID the same way.
+	`enum(name)`, `func(name)`, `extension(name)` and `to_dict()` rebuild the
+	dict form on demand.
+	"""
+	__slots__ = (
+		'types', 'type_ids', 'groups', 'group_ids',
+		'enum_names', 'enum_ids', 'enum_values', 'enum_value_digits', 'enum_types', 'enum_group_offsets', 'enum_group_ids',
+		'group_offsets', 'group_enum_ids',
+		'func_names', 'func_ids', 'func_returns', 'func_param_offsets', 'param_types', 'param_names', 'param_groups', 'param_lens',
+		'ext_names', 'ext_ids', 'ext_supported', 'ext_enum_offsets', 'ext_enum_ids', 'ext_func_offsets', 'ext_func_ids',
+	)
+
+	def __init__(self, parsed):
+		self.types = []
+		self.type_ids = {}
+		self.groups = []
+		self.group_ids = {}
+		self.enum_names = []
+		self.enum_ids = {}
+		self.enum_values = array.array('Q')
+		self.enum_value_digits = array.array('b')
+		self.enum_types = array.array('H')
+		self.enum_group_offsets = array.array('I', [0])
+		self.enum_group_ids = array.array('H')
+		group_members = []
+		for enumname, enumdata in parsed['enums'].items():
+			enum_id = len(self.enum_names)
+			self.enum_ids[enumname] = enum_id
+			self.enum_names.append(sys.intern(enumname))
+			value, digits = self._encode_value(enumdata['value'])
+			self.enum_values.append(value)
+			self.enum_value_digits.append(digits)
+			self.enum_types.append(self._type_id(enumdata['type']))
+			for groupname in enumdata['group']:
+				group_id = self._group_id(groupname)
+				if group_id == len(group_members): group_members.append([])
+				group_members[group_id].append(enum_id)
+				self.enum_group_ids.append(group_id)
+			self.enum_group_offsets.append(len(self.enum_group_ids))
+		self.group_offsets = array.array('I', [0])
+		self.group_enum_ids = array.array('I')
+		for members in group_members:
+			self.group_enum_ids.extend(members)
+			self.group_offsets.append(len(self.group_enum_ids))
+
+		self.func_names = []
+		self.func_ids = {}
+		self.func_returns = array.array('H')
+		self.func_param_offsets = array.array('I', [0])
+		self.param_types = array.array('H')
+		self.param_names = []
+		self.param_groups = array.array('i')
+		self.param_lens = []
+		for funcname, funcdata in parsed['funcs'].items():
+			self.func_ids[funcname] = len(self.func_names)
+			self.func_names.append(sys.intern(funcname))
+			self.func_returns.append(self._type_id(funcdata['return']))
+			for param in funcdata['params']:
+				self.param_types.append(self._type_id(param['type']))
+				self.param_names.append(sys.intern(param['name']))
+				self.param_groups.append(-1 if param['group'] is None else self._group_id(param['group']))
+				self.param_lens.append(None if param.get('len') is None else sys.intern(param['len']))
+			self.func_param_offsets.append(len(self.param_types))
+
+		self.ext_names = []
+		self.ext_ids = {}
+		self.ext_supported = []
+		self.ext_enum_offsets = array.array('I', [0])
+		self.ext_enum_ids = array.array('I')
+		self.ext_func_offsets = array.array('I', [0])
+		self.ext_func_ids = array.array('I')
+		for extname, extdata in parsed.get('extensions', {}).items():
+			self.ext_ids[extname] = len(self.ext_names)
+			self.ext_names.append(sys.intern(extname))
+			self.ext_supported.append(tuple(sys.intern(api) for api in extdata['supported']))
+			self.ext_enum_ids.extend(self.enum_ids[enumname] for enumname in extdata['enums'])
+			self.ext_enum_offsets.append(len(self.ext_enum_ids))
+			self.ext_func_ids.extend(self.func_ids[funcname] for funcname in extdata['funcs'])
+			self.ext_func_offsets.append(len(self.ext_func_ids))
+
+	@staticmethod
+	def _encode_value(value):
+		if value.startswith('0x'):
+			number, digits = int(value, 16), len(value) - 2
+			if f'0x{number:0{digits}X}' != value:
+				raise ValueError(f'Unexpected enum value format `{value}`')
+			return number, digits
+		number = int(value)
+		if str(number) != value:
+			raise ValueError(f'Unexpected enum value format `{value}`')
+		return number & 0xffffffffffffffff, 0
+
+	def _type_id(self, typename):
+		try:
+			return self.type_ids[typename]
+		except KeyError:
+			self.type_ids[typename] = len(self.types)
+			self.types.append(sys.intern(typename))
+			return self.type_ids[typename]
+
+	def _group_id(self, groupname):
+		try:
+			return self.group_ids[groupname]
+		except KeyError:
+			self.group_ids[groupname] = len(self.groups)
+			self.groups.append(sys.intern(groupname))
+			return self.group_ids[groupname]
+
+	def enum_value(self, enumname):
+		value = self.enum_values[self.enum_ids[enumname]]
+		return value - (1 << 64) if value >= 1 << 63 else value
+
+	def enum_type(self, enumname):
+		return self.types[self.enum_types[self.enum_ids[enumname]]]
+
+	def enum_groups(self, enumname):
+		i = self.enum_ids[enumname]
+		return [self.groups[g] for g in self.enum_group_ids[self.enum_group_offsets[i]:self.enum_group_offsets[i + 1]]]
+
+	def group_members(self, groupname):
+		i = self.group_ids[groupname]
+		return [self.enum_names[e] for e in self.group_enum_ids[self.group_offsets[i]:self.group_offsets[i + 1]]]
+
+	def enum(self, enumname):
+		i = self.enum_ids[enumname]
+		value, digits = self.enum_values[i], self.enum_value_digits[i]
+		if digits:
+			value = f'0x{value:0{digits}X}'
+		else:
+			value = str(self.enum_value(enumname))
+		return {'value': value, 'group': self.enum_groups(enumname), 'type': self.types[self.enum_types[i]]}
+
+	def func(self, funcname):
+		i = self.func_ids[funcname]
+		params = []
+		for p in range(self.func_param_offsets[i], self.func_param_offsets[i + 1]):
+			group = self.param_groups[p]
+			params.append({'type': self.types[self.param_types[p]], 'name': self.param_names[p], 'group': None if group < 0 else self.groups[group], 'len': self.param_lens[p]})
+		return {'return': self.types[self.func_returns[i]], 'params': params}
+
+	def extension(self, extname):
+		i = self.ext_ids[extname]
+		return {
+			'supported': list(self.ext_supported[i]),
+			'enums': [self.enum_names[e] for e in self.ext_enum_ids[self.ext_enum_offsets[i]:self.ext_enum_offsets[i + 1]]],
+			'funcs': [self.func_names[f] for f in self.ext_func_ids[self.ext_func_offsets[i]:self.ext_func_offsets[i + 1]]],
+		}
+
+	def to_dict(self):
+		return {
+			'enums': {enumname: self.enum(enumname) for enumname in self.enum_names},
+			'funcs': {funcname: self.func(funcname) for funcname in self.func_names},
+			'extensions': {extname: self.extension(extname) for extname in self.ext_names},
+		}
+
+def dump_glxml_json(parsed):
+	"""Serialize the `do_parse_glxml()` result as the indented `glcore.json`.
+
+	It keeps the shape it had before the extensions and the param lens were parsed, so
+	those are only in `dump_glxml_compact()` and `dump_glxml_binary()`.
+	"""
+	funcs = {}
+	for funcname, funcdata in parsed['funcs'].items():
+		params = [{k: v for k, v in param.items() if k != 'len'} for param in funcdata['params']]
+		funcs[funcname] = {**funcdata, 'params': params}
+	return json.dumps({'enums': parsed['enums'], 'funcs': funcs}, indent=4)
+
+def dump_glxml_compact(parsed):
+	"""Serialize the `do_parse_glxml()` result as minified JSON with short keys.
+
+	Enums become `{'v': value, 't': type, 'g': groups}` and functions become
+	`{'r': return, 'p': [{'t': type, 'n': name, 'g': group, 'l': len}]}`; empty groups
+	and lens are omitted. Extensions become `{'s': supported APIs, 'e': enums, 'f': functions}`,
+	leaving out empty enum and function lists.
+	"""
+	enums = {}
+	for enumname, enumdata in parsed['enums'].items():
+		enum = {'v': enumdata['value'], 't': enumdata['type']}
+		if enumdata['group']: enum['g'] = enumdata['group']
+		enums[enumname] = enum
+	funcs = {}
+	for funcname, funcdata in parsed['funcs'].items():
+		params = []
+		for param in funcdata['params']:
+			p = {'t': param['type'], 'n': param['name']}
+			if param['group'] is not None: p['g'] = param['group']
+			if param.get('len') is not None: p['l'] = param['len']
+			params += [p]
+		funcs[funcname] = {'r': funcdata['return'], 'p': params}
+	extensions = {}
+	for extname, extdata in parsed.get('extensions', {}).items():
+		extension = {'s': extdata['supported']}
+		if extdata['enums']: extension['e'] = extdata['enums']
+		if extdata['funcs']: extension['f'] = extdata['funcs']
+		extensions[extname] = extension
+	return json.dumps({'e': enums, 'f': funcs, 'x': extensions}, separators=(',', ':'))
+
+# The binary registry is a string table plus three open addressing hash tables
+# (FNV-1a, linear probing) of fixed size records, so a reader can look up an
+# enum, a function or an extension by name straight from a memory map.
+#
+# header:  magic, version, enum count, enum buckets, enum table offset,
+#          func count, func buckets, func table offset, params offset, strings offset,
+#          extension count, extension buckets, extension table offset
+# enum:    name, value, type, groups (comma separated)
+# func:    name, return type, first param index, param count
+# param:   type, name, group, len
+# ext:     name, supported APIs, enums, functions (each comma separated)
+# Every string is an (offset, length) pair into the string table, with an
+# offset of 0xFFFFFFFF for a missing group or len. Empty buckets have a zero length name.
+glcore_bin_magic = b'GLCB'
+glcore_bin_version = 3
+glcore_bin_header = struct.Struct('<4s12I')
+glcore_bin_enum = struct.Struct('<8I')
+glcore_bin_func = struct.Struct('<6I')
+glcore_bin_param = struct.Struct('<8I')
+glcore_bin_ext = struct.Struct('<8I')
+
+def _fnv1a(data):
+	h = 0x811c9dc5
+	for b in data:
+		h = ((h ^ b) * 0x01000193) & 0xffffffff
+	return h
 
-def _is_block_end(line, version_name, PREFIX_):
-	return \
-		line == f'#endif /* {PREFIX_}{version_name} */' or \
-		line == f'#endif /* {PREFIX_ES_}{version_name} */'
+def _hash_buckets(count):
+	buckets = 1
+	while buckets < count * 2: buckets <<= 1
+	return buckets
+
+def dump_glxml_binary(parsed):
+	"""Serialize the `do_parse_glxml()` result into the memory mappable binary registry."""
+	strings = io.BytesIO()
+	string_offsets = {}
+	def addstr(s):
+		if s is None: return 0xffffffff, 0
+		data = s.encode('utf-8')
+		try:
+			return string_offsets[data], len(data)
+		except KeyError:
+			string_offsets[data] = strings.tell()
+			strings.write(data)
+			return string_offsets[data], len(data)
+
+	def hashtable(items, record, pack):
+		buckets = _hash_buckets(len(items))
+		table = [None] * buckets
+		for name, data in items:
+			i = _fnv1a(name.encode('utf-8')) & (buckets - 1)
+			while table[i] is not None: i = (i + 1) & (buckets - 1)
+			table[i] = pack(name, data)
+		empty = record.pack(*([0] * (record.size // 4)))
+		return buckets, b''.join(empty if r is None else r for r in table)
+
+	def pack_enum(name, data):
+		return glcore_bin_enum.pack(*addstr(name), *addstr(data['value']), *addstr(data['type']), *addstr(','.join(data['group'])))
+
+	params = io.BytesIO()
+	param_count = 0
+	def pack_func(name, data):
+		nonlocal param_count
+		first = param_count
+		for param in data['params']:
+			params.write(glcore_bin_param.pack(*addstr(param['type']), *addstr(param['name']), *addstr(param['group']), *addstr(param.get('len'))))
+			param_count += 1
+		return glcore_bin_func.pack(*addstr(name), *addstr(data['return']), first, len(data['params']))
+
+	def pack_ext(name, data):
+		return glcore_bin_ext.pack(*addstr(name), *addstr(','.join(data['supported'])), *addstr(','.join(data['enums'])), *addstr(','.join(data['funcs'])))
+
+	extensions = parsed.get('extensions', {})
+	enum_buckets, enum_table = hashtable(parsed['enums'].items(), glcore_bin_enum, pack_enum)
+	func_buckets, func_table = hashtable(parsed['funcs'].items(), glcore_bin_func, pack_func)
+	ext_buckets, ext_table = hashtable(extensions.items(), glcore_bin_ext, pack_ext)
+	enum_offset = glcore_bin_header.size
+	func_offset = enum_offset + len(enum_table)
+	ext_offset = func_offset + len(func_table)
+	params_offset = ext_offset + len(ext_table)
+	strings_offset = params_offset + params.tell()
+	header = glcore_bin_header.pack(glcore_bin_magic, glcore_bin_version,
+		len(parsed['enums']), enum_buckets, enum_offset,
+		len(parsed['funcs']), func_buckets, func_offset,
+		params_offset, strings_offset,
+		len(extensions), ext_buckets, ext_offset)
+	return header + enum_table + func_table + ext_table + params.getvalue() + strings.getvalue()
+
+class GLCoreBinary:
+	"""Memory mapped reader of the binary registry written by `dump_glxml_binary()`.
+
+	`enum(name)`, `func(name)` and `extension(name)` return the same dicts as the
+	entries of the `do_parse_glxml()` result, or `None` if the name isn't there.
+	"""
+	def __init__(self, filename):
+		with open(filename, 'rb') as f:
+			self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		magic, version, *fields = glcore_bin_header.unpack_from(self.mm, 0)
+		if magic != glcore_bin_magic or version != glcore_bin_version:
+			self.mm.close()
+			raise ValueError(f'{filename} is not a version {glcore_bin_version} binary registry')
+		self.enum_count, self.enum_buckets, self.enum_offset, self.func_count, self.func_buckets, self.func_offset, self.params_offset, self.strings_offset, self.ext_count, self.ext_buckets, self.ext_offset = fields
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
+
+	def close(self):
+		self.mm.close()
+
+	def _str(self, offset, length):
+		if offset == 0xffffffff: return None
+		offset += self.strings_offset
+		return self.mm[offset:offset + length].decode('utf-8')
+
+	def _find(self, name, record, table_offset, buckets):
+		key = name.encode('utf-8')
+		i = _fnv1a(key) & (buckets - 1)
+		while True:
+			fields = record.unpack_from(self.mm, table_offset + i * record.size)
+			name_offset, name_length = fields[0], fields[1]
+			if name_length == 0: return None
+			if name_length == len(key):
+				name_offset += self.strings_offset
+				if self.mm[name_offset:name_offset + name_length] == key: return fields
+			i = (i + 1) & (buckets - 1)
+
+	def enum(self, name):
+		fields = self._find(name, glcore_bin_enum, self.enum_offset, self.enum_buckets)
+		if fields is None: return None
+		groups = self._str(*fields[6:8])
+		return {'value': self._str(*fields[2:4]), 'group': groups.split(',') if groups else [], 'type': self._str(*fields[4:6])}
+
+	def func(self, name):
+		fields = self._find(name, glcore_bin_func, self.func_offset, self.func_buckets)
+		if fields is None: return None
+		params = []
+		for i in range(fields[4], fields[4] + fields[5]):
+			p = glcore_bin_param.unpack_from(self.mm, self.params_offset + i * glcore_bin_param.size)
+			params += [{'type': self._str(*p[0:2]), 'name': self._str(*p[2:4]), 'group': self._str(*p[4:6]), 'len': self._str(*p[6:8])}]
+		return {'return': self._str(*fields[2:4]), 'params': params}
+
+	def extension(self, name):
+		fields = self._find(name, glcore_bin_ext, self.ext_offset, self.ext_buckets)
+		if fields is None: return None
+		supported, enums, funcs = self._str(*fields[2:4]), self._str(*fields[4:6]), self._str(*fields[6:8])
+		return {'supported': supported.split(',') if supported else [], 'enums': enums.split(',') if enums else [], 'funcs': funcs.split(',') if funcs else []}
+
+_block_begins = (f'#ifndef {PREFIX_}', f'#ifndef {PREFIX_ES_}')
+_proto_begins = ('#ifdef GL_GLEXT_PROTOTYPES', '#if GL_GLES_PROTOTYPES')
+
+def _block_ends(version_name):
+	return (f'#endif /* {PREFIX_}{version_name} */', f'#endif /* {PREFIX_ES_}{version_name} */')
 
 def _dismantle_typedef(line):
-	line = line.replace('}', '} ').replace(' *', '*').replace('*', '* ').replace('* * ', '** ').replace('  ', ' ')
+	# The pointer spacing fix-ups only touch '*', and '}' is what makes a double space after the line was squeezed
+	has_ptr = '*' in line
+	if has_ptr or '}' in line:
+		line = line.replace('}', '} ').replace(' *', '*').replace('*', '* ').replace('* * ', '** ').replace('  ', ' ')
 	try:
 		rettype, rest = line.split('(', 1)
 	except ValueError:
 		# non function
-		line = line.replace('* ', '*').replace('*', ' *').replace(' * *', ' **').replace('  ', ' ')
+		if has_ptr: line = line.replace('* ', '*').replace('*', ' *').replace(' * *', ' **').replace('  ', ' ')
 		try:
 			first, more = line.split(',', 1)
 		except ValueError:
@@ -177,7 +662,7 @@ def _dismantle_typedef(line):
 
 def _dismantle_proto(line):
 	if line.startswith('GLAPI '): line = line[len('GLAPI '):]
-	line = line.replace('*', '* ').replace(' *', '*').replace('  ', ' ')
+	if '*' in line: line = line.replace('*', '* ').replace(' *', '*').replace('  ', ' ')
 	rettype_calltype_funcname, arglist = line.split('(', 1)
 	rettype, calltype, funcname = rettype_calltype_funcname.strip().rsplit(' ', 2)
 	arglist = arglist[:-1]
@@ -185,191 +670,579 @@ def _dismantle_proto(line):
 
 def _chew(filename):
 	with open(filename, 'r', encoding='utf-8') as f:
-		is_in_block = False
-		is_in_proto = False
-		for line in f:
-			line = line.strip()
-			if len(line) == 0: continue
-			while '  ' in line: line = line.replace('  ', ' ')
-			line = line.replace('GL_APICALL ', 'GLAPI ').replace('GL_APIENTRY', 'APIENTRY')
-			if not is_in_block:
-				if _is_block_begin(line, PREFIX_):
-					is_in_block = True
-					version_name = line.split('_', 1)[-1]
-					yield {'type': 'version', 'id': version_name}
-				else:
-					print(f'Unknown line: "{line}"')
-				continue
-			elif _is_block_end(line, version_name, PREFIX_):
-				if is_in_proto:
-					print('Unexpected end of version')
-					is_in_proto = False
-				yield {'type': 'version_end', 'id': version_name}
-				is_in_block = False
+		lines = f.read().splitlines()
+	is_in_block = False
+	is_in_proto = False
+	for line in lines:
+		line = line.strip()
+		if not line: continue
+		while '  ' in line: line = line.replace('  ', ' ')
+		if 'GL_API' in line: line = line.replace('GL_APICALL ', 'GLAPI ').replace('GL_APIENTRY', 'APIENTRY')
+		if not is_in_block:
+			if line.startswith(_block_begins):
+				is_in_block = True
+				version_name = line.split('_', 1)[-1]
+				block_ends = _block_ends(version_name)
+				version_define = f'{PREFIX_}{version_name} 1'
+				yield {'type': 'version', 'id': version_name}
+			else:
+				print(f'Unknown line: "{line}"')
+			continue
+		elif line in block_ends:
+			if is_in_proto:
+				print('Unexpected end of version')
+				is_in_proto = False
+			yield {'type': 'version_end', 'id': version_name}
+			is_in_block = False
+			continue
+		if not is_in_proto:
+			if line in _proto_begins:
+				is_in_proto = True
 				continue
-			if not is_in_proto:
-				if line == '#ifdef GL_GLEXT_PROTOTYPES' or line == '#if GL_GLES_PROTOTYPES':
-					is_in_proto = True
-					continue
-				if line.startswith('#define '):
-					defi = line.split(' ', 1)[-1]
-					if defi == f'{PREFIX_}{version_name} 1':
-						continue
-					try:
-						defn, defv = defi.split(' ', 1)
-					except ValueError:
-						print(f'Unknown define line: "{line}"')
-						continue
-					if not defn.startswith(PREFIX_):
-						print(f'Definition PREFIX not match: {line}')
-						continue
-					defn = defn[len(PREFIX_):]
-					yield {'type': 'define', 'id': defn, 'value': defv}
+			if line.startswith('#define '):
+				defi = line[len('#define '):]
+				if defi == version_define:
 					continue
-				if line.startswith('typedef '):
-					if line[-1] != ';':
-						print(f'Expected \';\' at the end of line "{line}"')
-						continue
-					line = line[:-1]
-					try:
-						fpdata = _dismantle_typedef(line[7:].strip())
-					except ValueError as e:
-						print(f'Parse typedef failed: {str(e)}: {line}')
-						continue
-					yield fpdata
-					continue
-				print(f'Unknown line: {line}')
-			else:
-				if line == '#endif':
-					is_in_proto = False
+				try:
+					defn, defv = defi.split(' ', 1)
+				except ValueError:
+					print(f'Unknown define line: "{line}"')
 					continue
-				if not line.startswith('GLAPI '):
-					print(f'Unknown line: {line}')
+				if not defn.startswith(PREFIX_):
+					print(f'Definition PREFIX not match: {line}')
 					continue
+				defn = defn[len(PREFIX_):]
+				yield {'type': 'define', 'id': defn, 'value': defv}
+				continue
+			if line.startswith('typedef '):
 				if line[-1] != ';':
 					print(f'Expected \';\' at the end of line "{line}"')
 					continue
 				line = line[:-1]
 				try:
-					protodata = _dismantle_proto(line)
+					fpdata = _dismantle_typedef(line[7:].strip())
 				except ValueError as e:
-					print(f'Parse function pointer failed: {str(e)}')
+					print(f'Parse typedef failed: {str(e)}: {line}')
 					continue
-				yield protodata
+				yield fpdata
 				continue
-				
-def do_parse(parsefiles, glxml):
-	enumtype = {enum: enum_data['type'] for enum, enum_data in glxml['enums'].items()}
-
-	overloadables = sorted([
-		'TexParameter',
-		'PixelStore',
-		'GetTexParameter',
-		'GetTexLevelParameter',
-		'PointParameter',
-		'GetQueryObject',
-		'Uniform',
-		'UniformMatrix',
-		'VertexAttrib',
-		'GetUniform',
-		'GetVertexAttrib',
-		'ClearBuffer',
-		'SamplerParameter',
-		'GetSamplerParameter',
-		'PatchParameter',
-		'ProgramUniform',
-		'ProgramUniformMatrix',
-		'ClearNamedFramebuffer',
-		'GetNamedBufferParameter',
-		'TextureParameter',
-		'GetTextureParameter',
-		'TextureLevelParameter',
-		'GetTextureLevelParameter',
-		'GetnUniform'
-	], key=len, reverse=True)
-
-	overload_preserve_prefix = {'N', 'I', 'L', 'P'}
-
-	type_abbrs = sorted([
-		'b', 's', 'i', 'i64',
-		'ub', 'us', 'ui', 'ui64',
-		'f', 'd'
-	], key=len, reverse=True)
-
-	mat_dims = sorted([
-		'1', '2', '3', '4', '4N',
-		'2x3', '2x4',
-		'3x2', '3x4',
-		'4x2', '4x3'
-	], key=len, reverse=True)
-
-	cppfunc_cast = "reinterpret_cast"
-
-	csharp_typeconv = {
-		'int': 'int',
-		'void': 'void',
-		'int8_t': 'sbyte',
-		'uint8_t': 'byte',
-		'int16_t': 'short',
-		'uint16_t': 'ushort',
-		'int32_t': 'int',
-		'uint32_t': 'uint',
-		'int64_t': 'long',
-		'uint64_t': 'ulong',
-		'ptrdiff_t': 'IntPtr',
-		'size_t': 'UIntPtr',
-		'GLboolean': 'bool',
-		'unsigned char': 'byte',
-		'unsigned short': 'ushort',
-		'unsigned int': 'uint',
-		'unsigned long': 'ulong',
-		'GLsync' : 'IntPtr',
-		'GLDEBUGPROC': 'GLDEBUGPROC',
-		'khronos_float_t': 'float',
-		'khronos_ssize_t': 'IntPtr',
-		'khronos_intptr_t': 'IntPtr',
-		'khronos_int8_t': 'sbyte',
-		'khronos_uint8_t': 'byte',
-		'khronos_int16_t': 'short',
-		'khronos_uint16_t': 'ushort',
-		'khronos_int32_t': 'int',
-		'khronos_uint32_t': 'uint',
-		'khronos_int64_t': 'long',
-		'khronos_uint64_t': 'ulong',
-	}
-
-	csharp_keywords = {
-		'params',
-		'ref',
-		'string',
-	}
+			print(f'Unknown line: {line}')
+		else:
+			if line == '#endif':
+				is_in_proto = False
+				continue
+			if not line.startswith('GLAPI '):
+				print(f'Unknown line: {line}')
+				continue
+			if line[-1] != ';':
+				print(f'Expected \';\' at the end of line "{line}"')
+				continue
+			line = line[:-1]
+			try:
+				protodata = _dismantle_proto(line)
+			except ValueError as e:
+				print(f'Parse function pointer failed: {str(e)}')
+				continue
+			yield protodata
+			continue
 
-	parsed = {
-		'typealias': {},
-		'define': {},
-		'functype': {},
-		'funcproto': {}
-	}
+def do_parse_headers(parsefiles):
 	versions = {}
 	version_name = None
+	already_defined = set()
+
+	def _on_version(x):
+		nonlocal version_name
+		version_name = x['id']
+		versions[version_name] = {
+			'typealias': {},
+			'define': {},
+			'functype': {},
+			'funcproto': {},
+			'type2proto': {}
+		}
+
+	def _on_typealias(x):
+		target_type = x['target_type']
+		typealias = x['alias']
+		if typealias[0] in already_defined: return
+		already_defined.add(typealias[0])
+		try:
+			versions[version_name]['typealias'][target_type] += typealias
+		except KeyError:
+			versions[version_name]['typealias'][target_type] = typealias
+
+	def _on_define(x):
+		defn = x['id']
+		defv = x['value']
+		if defn in already_defined: return
+		already_defined.add(defn)
+		versions[version_name]['define'][defn] = defv
+
+	def _on_functype(x):
+		typename = x['typename']
+		if typename in already_defined: return
+		already_defined.add(typename)
+		versions[version_name]['functype'][typename] = x
+
+	def _on_funcproto(x):
+		funcname = x['funcname']
+		versions[version_name]['funcproto'][funcname] = x
+		versions[version_name]['type2proto'][f'PFN{funcname.upper()}PROC'] = funcname
+
+	on_stomach = {
+		'version': _on_version,
+		'typealias': _on_typealias,
+		'define': _on_define,
+		'functype': _on_functype,
+		'funcproto': _on_funcproto,
+		'version_end': lambda x: None
+	}
+
+	for parsefile in parsefiles:
+		for swallow in _chew(parsefile):
+			on_stomach[swallow['type']](swallow)
+	return versions
+
+overloadables = sorted([
+	'TexParameter',
+	'PixelStore',
+	'GetTexParameter',
+	'GetTexLevelParameter',
+	'PointParameter',
+	'GetQueryObject',
+	'Uniform',
+	'UniformMatrix',
+	'VertexAttrib',
+	'GetUniform',
+	'GetVertexAttrib',
+	'ClearBuffer',
+	'SamplerParameter',
+	'GetSamplerParameter',
+	'PatchParameter',
+	'ProgramUniform',
+	'ProgramUniformMatrix',
+	'ClearNamedFramebuffer',
+	'GetNamedBufferParameter',
+	'TextureParameter',
+	'GetTextureParameter',
+	'TextureLevelParameter',
+	'GetTextureLevelParameter',
+	'GetnUniform'
+], key=len, reverse=True)
+
+overload_preserve_prefix = {'N', 'I', 'L', 'P'}
+
+type_abbrs = sorted([
+	'b', 's', 'i', 'i64',
+	'ub', 'us', 'ui', 'ui64',
+	'f', 'd'
+], key=len, reverse=True)
+
+mat_dims = sorted([
+	'1', '2', '3', '4', '4N',
+	'2x3', '2x4',
+	'3x2', '3x4',
+	'4x2', '4x3'
+], key=len, reverse=True)
+
+cppfunc_cast = "reinterpret_cast"
+
+csharp_typeconv = {
+	'int': 'int',
+	'void': 'void',
+	'int8_t': 'sbyte',
+	'uint8_t': 'byte',
+	'int16_t': 'short',
+	'uint16_t': 'ushort',
+	'int32_t': 'int',
+	'uint32_t': 'uint',
+	'int64_t': 'long',
+	'uint64_t': 'ulong',
+	'ptrdiff_t': 'IntPtr',
+	'size_t': 'UIntPtr',
+	'GLboolean': 'bool',
+	'unsigned char': 'byte',
+	'unsigned short': 'ushort',
+	'unsigned int': 'uint',
+	'unsigned long': 'ulong',
+	'GLsync' : 'IntPtr',
+	'GLDEBUGPROC': 'GLDEBUGPROC',
+	'khronos_float_t': 'float',
+	'khronos_ssize_t': 'IntPtr',
+	'khronos_intptr_t': 'IntPtr',
+	'khronos_int8_t': 'sbyte',
+	'khronos_uint8_t': 'byte',
+	'khronos_int16_t': 'short',
+	'khronos_uint16_t': 'ushort',
+	'khronos_int32_t': 'int',
+	'khronos_uint32_t': 'uint',
+	'khronos_int64_t': 'long',
+	'khronos_uint64_t': 'ulong',
+}
+
+# Types only the extensions use, added on top of `csharp_typeconv` when they are generated
+csharp_ext_typeconv = {
+	'GLint64EXT': 'long',
+	'GLuint64EXT': 'ulong',
+	'GLeglImageOES': 'IntPtr',
+	'GLDEBUGPROCARB': 'GLDEBUGPROC',
+	'GLDEBUGPROCKHR': 'GLDEBUGPROC',
+	'GLVULKANPROCNV': 'IntPtr',
+	'struct _cl_context': 'void',
+	'struct _cl_event': 'void',
+}
+
+# The managed types that aren't blittable, replaced in the signatures of the unmanaged function pointers
+csharp_blittable = {
+	'bool': 'byte',
+	'char': 'byte',
+	'GLDEBUGPROC': 'IntPtr',
+}
+
+# Pointer parameters the GL keeps past the call or reads as a buffer offset, a pinned span would dangle or mislead
+csharp_nospan_params = {
+	'indices',
+	'indirect',
+	'pointer',
+	'userParam',
+}
+
+# The tokens of a gl.xml `len` that the span overloads check, any other token leaves the span unchecked
+csharp_len_tokens = re.compile(r'[A-Za-z_][A-Za-z0-9_]*|[0-9]+|[-+*/()]')
+
+# The reserved C# keywords, a parameter named like one gets a `_` suffix
+csharp_keywords = {
+	'abstract', 'as', 'base', 'bool', 'break', 'byte', 'case', 'catch', 'char', 'checked', 'class', 'const', 'continue',
+	'decimal', 'default', 'delegate', 'do', 'double', 'else', 'enum', 'event', 'explicit', 'extern', 'false', 'finally',
+	'fixed', 'float', 'for', 'foreach', 'goto', 'if', 'implicit', 'in', 'int', 'interface', 'internal', 'is', 'lock',
+	'long', 'namespace', 'new', 'null', 'object', 'operator', 'out', 'override', 'params', 'private', 'protected',
+	'public', 'readonly', 'ref', 'return', 'sbyte', 'sealed', 'short', 'sizeof', 'stackalloc', 'static', 'string',
+	'struct', 'switch', 'this', 'throw', 'true', 'try', 'typeof', 'uint', 'ulong', 'unchecked', 'unsafe', 'ushort',
+	'using', 'virtual', 'void', 'volatile', 'while',
+}
+
+# One scan classifies a member name: the longest overloadable prefix first, then at most one of each suffix part in
+# the order of the tables above. A name needs a dimension or a type abbreviation to match, or a shorter prefix is tried.
+_overload_re = re.compile(
+	f'({"|".join(overloadables)})'
+	f'({"|".join(sorted(overload_preserve_prefix))})?'
+	f'(?:({"|".join(mat_dims)})({"|".join(type_abbrs)})?|({"|".join(type_abbrs)}))'
+)
+
+def _overload_check(membername) -> tuple:
+	m = _overload_re.match(membername)
+	if m is None:
+		return (False, '', '', '', '', False)
+	ovlname, preserve, dimension, typeabbr, typeabbr_only = m.groups(default='')
+	if membername.endswith('Pointer') and preserve == 'P':
+		preserve = ''
+	return (True, ovlname, preserve, dimension, typeabbr or typeabbr_only, membername[-1] == 'v')
+
+def _overload_check_linear(membername):
+	"""The original `_overload_check()`, a linear scan over the tables, kept as the reference to check against."""
+	preserve = ''
+	dimension = ''
+	typeabbr = ''
+	is_v = False
+	ovlname = ''
+	matched = False
+	for ovlpre in overloadables:
+		if not membername.startswith(ovlpre): continue
+		i = len(ovlpre)
+		preserve = ''
+		for pre in overload_preserve_prefix:
+			if membername[i:i + len(pre)] == pre:
+				preserve = pre
+				i += len(pre)
+				break
+		dimension = ''
+		for dim in mat_dims:
+			if membername[i:i + len(dim)] == dim:
+				dimension = dim
+				i += len(dim)
+				break
+		typeabbr = ''
+		for abr in type_abbrs:
+			if membername[i:i + len(abr)] == abr:
+				typeabbr = abr
+				i += len(abr)
+				break
+		is_v = False
+		if membername[-1] == 'v':
+			is_v = True
+		if membername.endswith('Pointer') and preserve == 'P':
+			preserve = ''
+		matched = bool(dimension or typeabbr)
+		if matched:
+			ovlname = ovlpre
+			break
+	return (matched, ovlname, preserve, dimension, typeabbr, is_v)
+
+def check_overloads(glxml):
+	"""Check `_overload_check()` against the linear scan for every command in `glxml`, returns the mismatches.
+
+	Only matches are compared in full, the linear scan leaves whatever it last tried in the other fields.
+	Each mismatch is a `(membername, expected, got)` tuple.
+	"""
+	mismatches = []
+	for funcn in glxml['funcs']:
+		membername = funcn[len(prefix):]
+		expected = _overload_check_linear(membername)
+		got = _overload_check(membername)
+		if got[0] != expected[0] or (expected[0] and got != expected):
+			mismatches += [(membername, expected, got)]
+	return mismatches
+
+def _style_change(ident):
+	ident = ident.lower()
+	for a in range(ord('a'), ord('z') + 1):
+		a = chr(a)
+		ident = ident.replace(f'_{a}', a.upper())
+	ident = ident.replace('_', '')
+	ident = f'{ident[0].upper()}{ident[1:]}'
+	if ident.startswith('Esv'): ident = f'EsV{ident[len("Esv"):]}'
+	return ident
+
+def _version_infos(versions):
+	"""Walk the parsed versions in order, yielding the names each backend derives from them."""
 	last_version = None
 	firstver_name = None
 	firstver_classname = None
-	rs_traits = []
-	rs_global_struct_name = "GLCore"
+	for version_id, curver in versions.items():
+		version_name = version_id
+		class_name = _style_change(version_id)
+		OpenGL = 'OpenGL'
+		refver = 'gl4'
+		if version_name.startswith('ES_'):
+			version_name = f'ES{version_name[len("ES_"):]}'
+			OpenGL = 'OpenGL ES'
+			refver = 'es3'
+		try:
+			major, minor, release = version_name.split('_')[1:]
+		except ValueError:
+			major, minor, release = version_name.split('_')[1:] + ['0']
+		if last_version is None:
+			firstver_name = version_name
+			firstver_classname = class_name
+		yield {
+			'id': version_id,
+			'name': version_name,
+			'class_name': class_name,
+			'l_class_name': _style_change(last_version) if last_version else None,
+			'firstver_name': firstver_name,
+			'firstver_classname': firstver_classname,
+			'OpenGL': OpenGL,
+			'refver': refver,
+			'major': major,
+			'minor': minor,
+			'release': release,
+			'is_first_ver': last_version is None,
+			'is_first_es_ver': version_name == 'ESVERSION_2_0',
+		}, curver
+		last_version = version_name
+
+def _c_type(regtype):
+	"""Spell a registry type the way the headers do, e.g. `const GLchar *const*` as `const GLchar* const*`."""
+	return ' '.join(regtype.replace('*', '* ').replace(' *', '*').split())
+
+def _extension_infos(registry, extnames):
+	"""Walk the extensions in `extnames`, yielding their names and their defines and prototypes in the headers' form."""
+	for extname in extnames:
+		ext = registry.extension(extname)
+		define = {}
+		for enumname in ext['enums']:
+			defv = registry.enum(enumname)['value']
+			# gl.xml keeps the suffix of 64-bit values in a separate attribute
+			if defv.startswith('0x') and int(defv, 16) > 0xFFFFFFFF: defv += 'ull'
+			define[enumname[len(PREFIX_):]] = defv
+		funcproto = {}
+		for funcname in ext['funcs']:
+			func = registry.func(funcname)
+			arglist = ', '.join(f"{_c_type(param['type'])} {param['name']}" for param in func['params'])
+			funcproto[funcname] = {'ret': _c_type(func['return']), 'calltype': 'APIENTRY', 'arglist': arglist or 'void'}
+		yield {
+			'id': extname,
+			'class_name': extname[len(PREFIX_):],
+			'supported': ext['supported'],
+		}, {'define': define, 'funcproto': funcproto}
+
+def _define_type(defn, defv, registry):
+	if defv.startswith('0x'):
+		if defv.endswith('ull'):
+			return 'GLuint64'
+		elif defv.endswith('ll'):
+			return 'GLint64'
+		elif defv.endswith(('u', 'ul')):
+			return 'GLuint'
+	# Groups only passed through pointers like `const GLenum *` give the pointed type to their constants
+	return registry.enum_type(f'{PREFIX_}{defn}').removeprefix('const ').rstrip(' *')
+
+def _define_types(curver, registry):
+	"""The registry types of a version's defines, to be part of its fragment key."""
+	return {defn: registry.enum_type(f'{PREFIX_}{defn}') if f'{PREFIX_}{defn}' in registry.enum_ids else None for defn in curver['define']}
+
+# The state setters the state cache drops a call of when it repeats the previous call
+state_cache_setters = (
+	'glActiveTexture',
+	'glBlendColor',
+	'glBlendEquation',
+	'glBlendEquationSeparate',
+	'glBlendFunc',
+	'glBlendFuncSeparate',
+	'glClearColor',
+	'glClearDepth',
+	'glClearDepthf',
+	'glClearStencil',
+	'glColorMask',
+	'glCullFace',
+	'glDepthFunc',
+	'glDepthMask',
+	'glDepthRange',
+	'glDepthRangef',
+	'glFrontFace',
+	'glLineWidth',
+	'glPolygonMode',
+	'glPolygonOffset',
+	'glScissor',
+	'glStencilFunc',
+	'glStencilMask',
+	'glStencilOp',
+	'glUseProgram',
+	'glViewport',
+)
+
+# The binding functions whose targets aren't independent, binding `GL_FRAMEBUFFER` binds the other two
+state_cache_aliased_targets = {
+	'glBindFramebuffer',
+}
+
+# The binding functions whose bindings belong to the active texture unit
+state_cache_per_unit = {
+	'glBindTexture',
+}
+
+# The functions that change what a cached function sets some other way, so its cache has to be dropped.
+# `glDelete<X>s` drops the cache of `glBind<X>` without being listed. The generic `GL_TRANSFORM_FEEDBACK_BUFFER`
+# binding belongs to the transform feedback object, like `GL_ELEMENT_ARRAY_BUFFER` belongs to the vertex array.
+state_cache_invalidators = {
+	'glBindBuffer': ('glBindBufferBase', 'glBindBufferRange', 'glBindBuffersBase', 'glBindBuffersRange', 'glBindVertexArray', 'glDeleteVertexArrays', 'glBindTransformFeedback', 'glDeleteTransformFeedbacks'),
+	'glBindTexture': ('glBindTextureUnit', 'glBindTextures'),
+	'glEnable': ('glEnablei', 'glDisablei'),
+	'glBlendEquation': ('glBlendEquationSeparate', 'glBlendEquationi', 'glBlendEquationSeparatei'),
+	'glBlendEquationSeparate': ('glBlendEquation', 'glBlendEquationi', 'glBlendEquationSeparatei'),
+	'glBlendFunc': ('glBlendFuncSeparate', 'glBlendFunci', 'glBlendFuncSeparatei'),
+	'glBlendFuncSeparate': ('glBlendFunc', 'glBlendFunci', 'glBlendFuncSeparatei'),
+	'glClearDepth': ('glClearDepthf',),
+	'glClearDepthf': ('glClearDepth',),
+	'glColorMask': ('glColorMaski',),
+	'glDepthRange': ('glDepthRangef', 'glDepthRangeArrayv', 'glDepthRangeIndexed'),
+	'glDepthRangef': ('glDepthRange', 'glDepthRangeArrayv', 'glDepthRangeIndexed'),
+	'glPolygonOffset': ('glPolygonOffsetClamp',),
+	'glScissor': ('glScissorArrayv', 'glScissorIndexed', 'glScissorIndexedv'),
+	'glStencilFunc': ('glStencilFuncSeparate',),
+	'glStencilMask': ('glStencilMaskSeparate',),
+	'glStencilOp': ('glStencilOpSeparate',),
+	'glViewport': ('glViewportArrayv', 'glViewportIndexedf', 'glViewportIndexedfv'),
+}
+
+def _state_cache_model(versions, registry):
+	"""Work out what the state cache filters from the parsed versions and the enum groups of the registry.
+
+	Returns the caches in version order and the functions that drop caches mapped to the caches they drop. A cache
+	has a `member` name, a `kind` and its `funcs`, each a `(funcname, arglist, value)` tuple:
+	- `keyed` caches hold one value per enum of the `group` of the first param, `slots` are the distinct `(enum, value)`s
+	  of the group the headers define. The binding functions cache their object name, `glEnable()`/`glDisable()` cache
+	  `value`. With `per_unit` there is a row of slots for each texture unit.
+	- `last` caches hold the arguments of the previous call.
+	"""
+	funcprotos = {}
+	defines = {}
+	for info, curver in _version_infos(versions):
+		for funcn, funcproto in curver['funcproto'].items():
+			funcprotos.setdefault(funcn, funcproto)
+		for defn, defv in curver['define'].items():
+			defines.setdefault(f'{PREFIX_}{defn}', defv)
+
+	def group_slots(group):
+		slots = {}
+		for enum in registry.group_members(group):
+			try:
+				slots.setdefault(int(defines[enum], 0), enum)
+			except (KeyError, ValueError):
+				pass
+		return [(enum, value) for value, enum in slots.items()]
+
+	caches = []
+	for funcn, funcproto in funcprotos.items():
+		if funcproto['ret'] != 'void': continue
+		params = [(argtype, argname) for argtype, argname, haveconst in _c_params(funcproto['arglist'])]
+		argtypes = [argtype for argtype, argname in params]
+		member = funcn[len(prefix):]
+		if funcn == f'{prefix}Enable' and f'{prefix}Disable' in funcprotos:
+			group = registry.func(funcn)['params'][0]['group']
+			funcs = [(funcn, funcproto['arglist'], 2), (f'{prefix}Disable', funcprotos[f'{prefix}Disable']['arglist'], 1)]
+			caches += [{'member': member, 'kind': 'keyed', 'funcs': funcs, 'group': group, 'slots': group_slots(group), 'per_unit': False}]
+		elif member.startswith('Bind') and argtypes == ['GLenum', 'GLuint'] and funcn not in state_cache_aliased_targets:
+			group = registry.func(funcn)['params'][0]['group']
+			if group is None: continue
+			funcs = [(funcn, funcproto['arglist'], None)]
+			caches += [{'member': member, 'kind': 'keyed', 'funcs': funcs, 'group': group, 'slots': group_slots(group), 'per_unit': funcn in state_cache_per_unit}]
+		elif (member.startswith('Bind') and argtypes in (['GLenum', 'GLuint'], ['GLuint'])) or funcn in state_cache_setters:
+			if not len(params) or any('*' in argtype for argtype in argtypes): continue
+			caches += [{'member': member, 'kind': 'last', 'funcs': [(funcn, funcproto['arglist'], None)]}]
+
+	invalidators = {}
+	for cache in caches:
+		funcn = cache['funcs'][0][0]
+		funcnames = list(state_cache_invalidators.get(funcn, ()))
+		if cache['member'].startswith('Bind'):
+			funcnames += [f'{prefix}Delete{cache["member"][len("Bind"):]}s']
+		for invalidator in funcnames:
+			if invalidator in funcprotos:
+				invalidators.setdefault(invalidator, []).append(cache['member'])
+	return caches, {funcn: (funcprotos[funcn], members) for funcn, members in invalidators.items()}
+
+def _instrument_ids(versions):
+	"""Number the functions of every version in the order they first appear, the IDs of the instrumentation table."""
+	ids = {}
+	for info, curver in _version_infos(versions):
+		for funcn in curver['funcproto']:
+			ids.setdefault(funcn, len(ids))
+	return ids
+
+def _fragment(fragments, new_fragments, key_data, emit, state = None):
+	"""Return the output of `emit()` for one version, reusing a cached fragment when possible.
+
+	The fragment is addressed by the hash of `key_data` plus the `state` carried
+	over from the previous versions; on a hit, `state` is advanced to what
+	`emit()` would have left behind.
+	"""
+	if fragments is None: return emit()
+	key = json.dumps([key_data, state], sort_keys=True)
+	key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+	frag = fragments.get(key)
+	if frag is None:
+		frag = json.loads(json.dumps({'out': emit(), 'state': state}))
+	elif state is not None:
+		state.clear()
+		state.update(json.loads(json.dumps(frag['state'])))
+	new_fragments[key] = frag
+	return frag['out']
+
+def _gen_cpp(versions, registry, fragments = None, extensions = (), options = None):
+	new_fragments = {}
+	options = options or {}
+	lazy = options.get('cpp_lazy', False)
+	table = options.get('table_loader', False) and not lazy
+	state_cache = options.get('state_cache', False)
+	command_buffer = options.get('command_buffer', False)
+	instrument = options.get('instrument', False)
+	split = options.get('cpp_split', False)
+	module = options.get('cpp_module', False)
 	OpenGL = 'OpenGL'
 	outs_hpp = io.StringIO()
 	outs_cpp = io.StringIO()
-	outs_csharp = io.StringIO()
-	outs_rs = {
-		'global': {
-			'predef': io.StringIO(),
-			'struct': io.StringIO(),
-			'impl': io.StringIO(),
-			'trait': io.StringIO(),
-			'members': [],
-		}
-	}
 
 	outs_hpp.write('#pragma once\n')
 	outs_hpp.write('\n')
@@ -377,6 +1250,23 @@ def do_parse(parsefiles, glxml):
 	outs_hpp.write('#include<cstdint>\n')
 	outs_hpp.write('#include<cstddef>\n')
 	outs_hpp.write('#include<stdexcept>\n')
+	if lazy:
+		outs_hpp.write('#include<atomic>\n')
+	# With `cpp_split` only the umbrella header includes what the extensions and the layers need
+	outs_layers = io.StringIO() if split else outs_hpp
+	if state_cache:
+		outs_layers.write('#include<cstring>\n')
+	if len(extensions):
+		outs_layers.write('#include<memory>\n')
+		outs_layers.write('#include<unordered_set>\n')
+	if instrument:
+		if not lazy: outs_layers.write('#include<atomic>\n')
+		outs_layers.write('#include<chrono>\n')
+		outs_layers.write('#include<utility>\n')
+		outs_layers.write('#include<vector>\n')
+		if module:
+			outs_layers.write('#include<algorithm>\n')
+			outs_layers.write('#include<cstdio>\n')
 	outs_hpp.write('\n')
 	outs_hpp.write('namespace GL\n')
 	outs_hpp.write('{\n')
@@ -409,10 +1299,15 @@ def do_parse(parsefiles, glxml):
 	outs_hpp.write('\t\tNullFuncPtrException(std::string what) noexcept;\n')
 	outs_hpp.write('\t};\n')
 	outs_hpp.write('\n')
-
+	if table:
+		outs_hpp.write('\t[[noreturn]] void NullFuncPtr(const char* Symbol);\n')
+		outs_hpp.write('\n')
 	outs_cpp.write(f'#include "{modname}.hpp"\n')
 	outs_cpp.write('\n')
 	outs_cpp.write('#include<cstring>\n')
+	if instrument and not module:
+		outs_cpp.write('#include<algorithm>\n')
+		outs_cpp.write('#include<cstdio>\n')
 	outs_cpp.write('\n')
 	outs_cpp.write('#ifndef GLAPI\n')
 	outs_cpp.write('#  if defined(__MINGW32__) || defined(__CYGWIN__) || (_MSC_VER >= 800) || defined(_STDCALL_SUPPORTED) || defined(__BORLANDC__)\n')
@@ -429,43 +1324,1692 @@ def do_parse(parsefiles, glxml):
 	outs_cpp.write('\t{\n')
 	outs_cpp.write('\t}\n')
 	outs_cpp.write('\n')
-	outs_cpp.write('\tstatic void NullFuncPtr()\n')
-	outs_cpp.write('\t{\n')
-	outs_cpp.write(f'\t\tthrow NullFuncPtrException("{OpenGL} function pointer is null.\\n");\n')
-	outs_cpp.write('\t}\n')
-	outs_cpp.write('\n')
+	if table:
+		outs_cpp.write('\tvoid NullFuncPtr(const char* Symbol)\n')
+		outs_cpp.write('\t{\n')
+		outs_cpp.write(f'\t\tthrow NullFuncPtrException(std::string("{OpenGL} function pointer `") + Symbol + "` is null.\\n");\n')
+		outs_cpp.write('\t}\n')
+		outs_cpp.write('\n')
+		outs_cpp.write('\t// `Names` holds the null-terminated symbols back to back, `Offsets` where each of them starts; the missing ones leave a null slot\n')
+		outs_cpp.write('\tstatic void LoadProcs(Func_GetProcAddress GetProcAddress, const char* Names, const uint16_t* Offsets, void** Procs, size_t Count)\n')
+		outs_cpp.write('\t{\n')
+		outs_cpp.write('\t\tfor (size_t i = 0; i < Count; i++)\n')
+		outs_cpp.write('\t\t{\n')
+		outs_cpp.write('\t\t\tProcs[i] = GetProcAddress(Names + Offsets[i]);\n')
+		outs_cpp.write('\t\t}\n')
+		outs_cpp.write('\t}\n')
+		outs_cpp.write('\n')
+	elif lazy:
+		outs_cpp.write('\t// Two threads resolving the same slot at once both store the same pointer, the slot is atomic so that is no data race\n')
+		outs_cpp.write('\tstatic void* ResolveProc(Func_GetProcAddress GetProcAddress, const char* Symbol, std::atomic<void*>& Proc)\n')
+		outs_cpp.write('\t{\n')
+		outs_cpp.write('\t\tvoid* ProcAddress = GetProcAddress(Symbol);\n')
+		outs_cpp.write(f'\t\tif (!ProcAddress) throw NullFuncPtrException(std::string("{OpenGL} function pointer `") + Symbol + "` is null.\\n");\n')
+		outs_cpp.write('\t\tProc.store(ProcAddress, std::memory_order_relaxed);\n')
+		outs_cpp.write('\t\treturn ProcAddress;\n')
+		outs_cpp.write('\t}\n')
+		outs_cpp.write('\n')
+	elif not lazy:
+		outs_cpp.write('\tstatic void NullFuncPtr()\n')
+		outs_cpp.write('\t{\n')
+		outs_cpp.write(f'\t\tthrow NullFuncPtrException("{OpenGL} function pointer is null.\\n");\n')
+		outs_cpp.write('\t}\n')
+		outs_cpp.write('\n')
 
-	outs_csharp.write('using System;\n')
-	outs_csharp.write('using System.Text;\n')
-	outs_csharp.write('using System.Runtime.InteropServices;\n')
-	outs_csharp.write('namespace GL\n')
-	outs_csharp.write('{\n')
-	outs_csharp.write('\tpublic class NullOpenGLFunctionPointerException : Exception\n')
-	outs_csharp.write('\t{\n')
-	outs_csharp.write('\t\tpublic NullOpenGLFunctionPointerException() {}\n')
-	outs_csharp.write('\t\tpublic NullOpenGLFunctionPointerException(string message) : base(message) {}\n')
-	outs_csharp.write('\t\tpublic NullOpenGLFunctionPointerException(string message, Exception inner) : base(message, inner) {}\n')
-	outs_csharp.write('\t}\n')
-	outs_csharp.write('\tpublic delegate IntPtr Delegate_GetProcAddress (string ProcName);\n')
+	def _on_version_end(info, curver):
+		outs_hpp = io.StringIO()
+		outs_cpp = io.StringIO()
+		version_name = info['name']
+		class_name = info['class_name']
+		l_class_name = info['l_class_name']
+		major, minor, release = info['major'], info['minor'], info['release']
+		is_first_ver = info['is_first_ver']
+		func2load = {} # functions to be loaded
+		overloads = {} # key: 'Xxxxx[1,2,3,4][N,I,P,L][s,f,i,d,ub,us,ui]'; value = (rettype, 'Xxxxx', arglist)
+		type2proto = curver['type2proto']
 
-	outs_rs['global']['predef'].write('\n')
-	outs_rs['global']['predef'].write('#![allow(dead_code)]\n')
-	outs_rs['global']['predef'].write('#![allow(non_snake_case)]\n')
-	outs_rs['global']['predef'].write('#![allow(non_camel_case_types)]\n')
-	outs_rs['global']['predef'].write('#![allow(non_upper_case_globals)]\n')
-	outs_rs['global']['predef'].write('#![allow(unpredictable_function_pointer_comparisons)]\n')
-	outs_rs['global']['predef'].write('#![allow(clippy::too_many_arguments)]\n')
-	outs_rs['global']['predef'].write('#![allow(clippy::upper_case_acronyms)]\n')
-	outs_rs['global']['predef'].write('#![allow(clippy::missing_transmute_annotations)]\n')
-	outs_rs['global']['predef'].write("use std::{\n")
-	outs_rs['global']['predef'].write("\tmem::transmute,\n")
+		for target_type, typealias in curver['typealias'].items():
+			outs_hpp.write(f'\ttypedef {target_type} {", ".join(typealias)};\n')
+
+		for functype, fpdata in curver['functype'].items():
+			if functype in type2proto: continue
+			rettype = fpdata['ret']
+			calltype = fpdata['calltype']
+			arglist = fpdata['arglist']
+			outs_hpp.write(f'\tusing {functype} = {rettype} ({calltype}) ({arglist});\n')
+		outs_hpp.write('\n')
+
+		if is_first_ver:
+			outs_hpp.write(f'\tclass {class_name}\n')
+			for funcn, funcproto in curver['funcproto'].items():
+				rettype = funcproto['ret']
+				calltype = funcproto['calltype']
+				arglist = funcproto['arglist']
+				outs_cpp.write(f'\tGLAPI {rettype} {calltype} {funcn} ({arglist});\n')
+			outs_cpp.write('\n')
+		else:
+			outs_hpp.write(f'\tclass {class_name} : public {l_class_name}\n')
+
+		outs_hpp.write('\t{\n')
+		if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+			outs_hpp.write('\tpublic:\n')
+			outs_hpp.write('\t\tinline std::string GetShadingLanguageVersion() { return ShadingLanguageVersion; }\n')
+		outs_hpp.write('\tprotected:\n')
+		for functype, fpdata in curver['functype'].items():
+			if functype not in type2proto: continue
+			rettype = fpdata['ret']
+			calltype = fpdata['calltype']
+			arglist = fpdata['arglist']
+			pproto = type2proto[functype]
+			outs_hpp.write(f'\t\tusing {functype} = {rettype} ({calltype}) ({arglist});\n')
+			if lazy or table: continue
+			outs_cpp.write(f'\tstatic {rettype} {calltype[:-1]} Null_{pproto} ({arglist})')
+			if rettype == 'void':
+				outs_cpp.write('{ NullFuncPtr(); }\n')
+			else:
+				outs_cpp.write('{ NullFuncPtr(); return 0; }\n')
+		if is_first_ver:
+			outs_hpp.write('\t\tFunc_GetProcAddress GetProcAddress;\n')
+			outs_hpp.write('\t\tint Ver_Major;\n')
+			outs_hpp.write('\t\tint Ver_Minor;\n')
+			outs_hpp.write('\t\tint Ver_Release;\n')
+			outs_hpp.write('\t\tstd::string Vendor;\n')
+			outs_hpp.write('\t\tstd::string Renderer;\n')
+			outs_hpp.write('\t\tstd::string Version;\n')
+		elif 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+			outs_hpp.write('\t\tstd::string ShadingLanguageVersion;\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\tprivate:\n')
+		outs_hpp.write('\t\tbool Available;\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\tpublic:\n')
+		if is_first_ver:
+			outs_hpp.write('\t\ttemplate<typename FuncType>\n')
+			outs_hpp.write('\t\tFuncType GetProc(const char* symbol, FuncType DefaultBehaviorFunc)\n')
+			outs_hpp.write('\t\t{\n')
+			outs_hpp.write('\t\t\tvoid *ProcAddress = GetProcAddress(symbol);\n');
+			outs_hpp.write('\t\t\tif (!ProcAddress)\n')
+			outs_hpp.write('\t\t\t{\n')
+			outs_hpp.write('\t\t\t\treturn DefaultBehaviorFunc;\n')
+			outs_hpp.write('\t\t\t}\n')
+			outs_hpp.write(f'\t\t\treturn {cppfunc_cast}<FuncType>(ProcAddress);\n')
+			outs_hpp.write('\t\t}\n')
+			outs_hpp.write('\t\tinline void GetVersion(int& Major, int& Minor, int& Release)\n')
+			outs_hpp.write('\t\t{\n')
+			outs_hpp.write('\t\t\tMajor = Ver_Major;\n')
+			outs_hpp.write('\t\t\tMinor = Ver_Minor;\n')
+			outs_hpp.write('\t\t\tRelease = Ver_Release;\n')
+			outs_hpp.write('\t\t}\n')
+			outs_hpp.write('\t\tinline std::string GetVendor() { return Vendor; }\n')
+			outs_hpp.write('\t\tinline std::string GetRenderer() { return Renderer; }\n')
+			outs_hpp.write('\t\tinline std::string GetVersion() { return Version; }\n')
+
+		outs_hpp.write(f'\t\t{class_name}() = delete;\n')
+		outs_hpp.write(f'\t\t{class_name}(Func_GetProcAddress GetProcAddress);\n')
+
+		outs_hpp.write(f'\t\tinline bool {class_name}IsAvailable() {{ return Available; }}\n')
+		outs_hpp.write('\n')
+
+		for defn, defv in curver['define'].items():
+			deft = _define_type(defn, defv, registry)
+			outs_hpp.write(f'\t\tstatic constexpr {deft} {defn} = {defv};\n')
+		outs_hpp.write('\n')
+
+		# With the table loader and the lazy mode the functions live in `Procs`, in the order of their sorted names
+		proc_index = {funcn: i for i, funcn in enumerate(sorted(curver['funcproto'].keys()))}
+		for funcn, funcproto in curver['funcproto'].items():
+			rettype = funcproto['ret']
+			arglist = funcproto['arglist']
+			functype = f'PFN{funcn.upper()}PROC'
+			membername = funcn[len(prefix):]
+			if lazy:
+				outs_hpp.write(f'\t\tinline {rettype} {membername}({arglist}) const {{ ')
+				outs_hpp.write(f'void* Proc = Procs[{proc_index[funcn]}].load(std::memory_order_relaxed); if (!Proc) Proc = Resolve({proc_index[funcn]}); ')
+				if rettype != 'void': outs_hpp.write('return ')
+				outs_hpp.write(f'{cppfunc_cast}<{functype}>(Proc)({", ".join(argname for argtype, argname, haveconst in _c_params(arglist))}); }}\n')
+			elif table:
+				outs_hpp.write(f'\t\tinline {rettype} {membername}({arglist}) const {{ ')
+				outs_hpp.write(f'if (!Procs[{proc_index[funcn]}]) NullFuncPtr("{funcn}"); ')
+				if rettype != 'void': outs_hpp.write('return ')
+				outs_hpp.write(f'{cppfunc_cast}<{functype}>(Procs[{proc_index[funcn]}])({", ".join(argname for argtype, argname, haveconst in _c_params(arglist))}); }}\n')
+			else:
+				outs_hpp.write(f'\t\t{functype} {membername};\n')
+
+			func2load[membername] = funcn
+
+			# Check overloadable functions
+			matched, ovlname, preserve, dimension, typeabbr, is_v = _overload_check(membername)
+			if matched and not is_v and preserve != 'P' and dimension != '':
+				ovlname = f'{ovlname}{preserve}{typeabbr}'
+				overloads[membername] = (functype, rettype, ovlname, arglist)
+		outs_hpp.write('\n')
+
+		for membername, ovld in overloads.items():
+			functype, rettype, ovlpre, arglist = ovld
+			outs_hpp.write(f'\t\tinline {rettype} {ovlpre}({arglist}) const {{ ')
+			if rettype != 'void': outs_hpp.write('return ')
+			outs_hpp.write(f'{membername}({", ".join([pname.strip() for ptype, pname in [param.rsplit(" ", 1) for param in arglist.split(", ")]])});}}\n')
+
+		if table and len(proc_index):
+			outs_hpp.write('\n')
+			outs_hpp.write('\tprotected:\n')
+			outs_hpp.write(f'\t\tvoid* Procs[{len(proc_index)}];\n')
+		elif lazy and len(proc_index):
+			# One word per function, null until its first call looks the symbol up
+			outs_hpp.write('\n')
+			outs_hpp.write('\tprotected:\n')
+			outs_hpp.write(f'\t\tmutable std::atomic<void*> Procs[{len(proc_index)}] = {{}};\n')
+			outs_hpp.write('\t\tvoid* Resolve(size_t Index) const;\n')
+		outs_hpp.write('\t};\n')
+
+		def load_member(membername, funcname):
+			return f'\t\t{membername}(GetProc<PFN{funcname.upper()}PROC>("{funcname}", Null_{funcname}))'
+
+		if table or lazy:
+			if len(proc_index):
+				outs_cpp.write(f'\tstatic const char {class_name}_ProcNames[] =\n')
+				outs_cpp.write('\n'.join(f'\t\t"{funcn}\\0"' for funcn in proc_index.keys()))
+				outs_cpp.write(';\n')
+				offsets = itertools.accumulate((len(funcn) + 1 for funcn in proc_index.keys()), initial = 0)
+				outs_cpp.write(f'\tstatic const uint16_t {class_name}_ProcOffsets[] = {{{", ".join(str(offset) for offset, funcn in zip(offsets, proc_index.keys()))}}};\n')
+				outs_cpp.write('\n')
+			if lazy and len(proc_index):
+				outs_cpp.write(f'\tvoid* {class_name}::Resolve(size_t Index) const\n')
+				outs_cpp.write('\t{\n')
+				outs_cpp.write(f'\t\treturn ResolveProc(GetProcAddress, {class_name}_ProcNames + {class_name}_ProcOffsets[Index], Procs[Index]);\n')
+				outs_cpp.write('\t}\n')
+				outs_cpp.write('\n')
+			load_procs = f'\t\tLoadProcs(GetProcAddress, {class_name}_ProcNames, {class_name}_ProcOffsets, Procs, {len(proc_index)});\n' if table and len(proc_index) else ''
+			func2load = {}
+		else:
+			load_procs = ''
+
+		if not is_first_ver:
+			outs_cpp.write(f'\t{class_name}::{class_name}(Func_GetProcAddress GetProcAddress):\n')
+			outs_cpp.write(f'\t\t{l_class_name}(GetProcAddress)')
+		elif len(func2load):
+			outs_cpp.write(f'\t{class_name}::{class_name}(Func_GetProcAddress GetProcAddress):\n')
+			outs_cpp.write('\t\tGetProcAddress(GetProcAddress),\n')
+		elif load_procs or lazy:
+			outs_cpp.write(f'\t{class_name}::{class_name}(Func_GetProcAddress GetProcAddress):\n')
+			outs_cpp.write('\t\tGetProcAddress(GetProcAddress)')
+
+		if is_first_ver:
+			#outs_cpp.write(",\n".join([f"\t\t{membername}({funcname})" for membername, funcname in func2load.items()] + ['\t\tVer_Major(0)', '\t\tVer_Minor(0)', '\t\tVer_Release(0)']))
+			if len(func2load):
+				outs_cpp.write(",\n".join([load_member(membername, funcname) for membername, funcname in func2load.items()]))
+			outs_cpp.write(',\n')
+			outs_cpp.write(",\n".join(['\t\tVer_Major(0)', '\t\tVer_Minor(0)', '\t\tVer_Release(0)']))
+			outs_cpp.write('\n\t{\n')
+			outs_cpp.write(load_procs)
+			outs_cpp.write('\t\tAvailable = true;\n')
+			outs_cpp.write('\t\tauto Ver = (const char*)GetString(VERSION);\n')
+			outs_cpp.write('\t\tVendor = (const char*)GetString(VENDOR);\n')
+			outs_cpp.write('\t\tRenderer = (const char*)GetString(RENDERER);\n')
+			outs_cpp.write('\t\tVersion = Ver;\n')
+			outs_cpp.write('\t\tif (Ver)\n')
+			outs_cpp.write('\t\t{\n')
+			outs_cpp.write('\t\t\tauto ch = Ver;\n')
+			outs_cpp.write('\t\t\tif (strstr(ch, "OpenGL ES")) ch += sizeof "OpenGL ES";\n')
+			outs_cpp.write('\t\t\tVer_Major = atoi(ch);\n')
+			outs_cpp.write('\t\t\twhile (isdigit(*ch)) ch++;\n')
+			outs_cpp.write("\t\t\tif (*ch == '.')\n")
+			outs_cpp.write('\t\t\t{\n')
+			outs_cpp.write('\t\t\t\tch++;\n')
+			outs_cpp.write('\t\t\t\tVer_Minor = atoi(ch);\n')
+			outs_cpp.write('\t\t\t\twhile (isdigit(*ch)) ch++;\n')
+			outs_cpp.write("\t\t\t\tif (*ch == '.')\n")
+			outs_cpp.write('\t\t\t\t{\n')
+			outs_cpp.write('\t\t\t\t\tch++;\n')
+			outs_cpp.write('\t\t\t\t\tVer_Release = atoi(ch);\n')
+			outs_cpp.write('\t\t\t\t}\n')
+			outs_cpp.write('\t\t\t}\n')
+			outs_cpp.write('\t\t}\n')
+			outs_cpp.write('\t}\n')
+		else:
+			if len(func2load):
+				outs_cpp.write(',\n')
+				outs_cpp.write(",\n".join([load_member(membername, funcname) for membername, funcname in func2load.items()]))
+			outs_cpp.write('\n\t{\n')
+			outs_cpp.write(load_procs)
+			if version_name.startswith('VERSION_'):
+				outs_cpp.write(f'\t\tAvailable = Ver_Major > {major} || (Ver_Major == {major} && (Ver_Minor > {minor} || (Ver_Minor == {minor} && Ver_Release >= {release})));\n')
+				if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+					outs_cpp.write(f'\t\tShadingLanguageVersion = reinterpret_cast<const char*>(GetString(SHADING_LANGUAGE_VERSION));\n')
+			else:
+				outs_cpp.write(f'\t\tAvailable = true;\n')
+			outs_cpp.write('\t}\n')
+		outs_cpp.write('\n')
+
+		outs_cpp.write('\n')
+		return {'hpp': outs_hpp.getvalue(), 'cpp': outs_cpp.getvalue()}
+
+	# With `cpp_split` each version gets a header that includes the one of the class it derives from, so a translation
+	# unit only parses the versions up to the one it uses. The umbrella header includes the last of them and holds the
+	# extensions and the layers
+	extra_files = {}
+	if split:
+		outs_hpp.write('};\n')
+		last_header = f'{modname}_base.hpp'
+		extra_files[last_header] = outs_hpp.getvalue()
+		outs_hpp = io.StringIO()
+	for info, curver in _version_infos(versions):
+		define_types = _define_types(curver, registry)
+		frag = _fragment(fragments, new_fragments, ['cpp', info, curver, define_types, options], lambda: _on_version_end(info, curver))
+		if split:
+			header = f"{modname}_{info['id'].lower()}.hpp"
+			extra_files[header] = f'#pragma once\n\n#include "{last_header}"\n\nnamespace GL\n{{\n{frag["hpp"]}}};\n'
+			last_header = header
+		else:
+			outs_hpp.write(frag['hpp'])
+		outs_cpp.write(frag['cpp'])
+	if split:
+		outs_hpp.write('#pragma once\n')
+		outs_hpp.write('\n')
+		outs_hpp.write(f'#include "{last_header}"\n')
+		outs_hpp.write(outs_layers.getvalue())
+		outs_hpp.write('\n')
+		outs_hpp.write('namespace GL\n')
+		outs_hpp.write('{\n')
+
+	def _on_extension(info, curext):
+		outs_hpp = io.StringIO()
+		outs_cpp = io.StringIO()
+		ext_name = info['id']
+		class_name = info['class_name']
+
+		outs_hpp.write(f'\t// {ext_name}\n')
+		outs_hpp.write(f'\tclass {class_name}\n')
+		outs_hpp.write('\t{\n')
+		outs_hpp.write('\tprotected:\n')
+		for funcn, funcproto in curext['funcproto'].items():
+			outs_hpp.write(f"\t\tusing PFN{funcn.upper()}PROC = {funcproto['ret']} (APIENTRYP) ({funcproto['arglist']});\n")
+		outs_hpp.write('\n')
+		outs_hpp.write('\tprivate:\n')
+		outs_hpp.write('\t\tbool Available;\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\tpublic:\n')
+		outs_hpp.write(f'\t\t{class_name}() = delete;\n')
+		outs_hpp.write(f'\t\t{class_name}(Func_GetProcAddress GetProcAddress);\n')
+		outs_hpp.write(f'\t\tinline bool {class_name}IsAvailable() {{ return Available; }}\n')
+		outs_hpp.write('\n')
+		for defn, defv in curext['define'].items():
+			outs_hpp.write(f'\t\tstatic constexpr {_define_type(defn, defv, registry)} {defn} = {defv};\n')
+		outs_hpp.write('\n')
+		for funcn in curext['funcproto'].keys():
+			outs_hpp.write(f'\t\tPFN{funcn.upper()}PROC {funcn[len(prefix):]};\n')
+		outs_hpp.write('\t};\n')
+		outs_hpp.write('\n')
+
+		outs_cpp.write(f'\t{class_name}::{class_name}(Func_GetProcAddress GetProcAddress)')
+		if len(curext['funcproto']):
+			outs_cpp.write(':\n')
+			outs_cpp.write(",\n".join([f'\t\t{funcn[len(prefix):]}({cppfunc_cast}<PFN{funcn.upper()}PROC>(GetProcAddress("{funcn}")))' for funcn in curext['funcproto'].keys()]))
+			outs_cpp.write('\n\t{\n')
+			outs_cpp.write('\t\tAvailable =\n')
+			outs_cpp.write(" &&\n".join([f'\t\t\t{funcn[len(prefix):]} != nullptr' for funcn in curext['funcproto'].keys()]))
+			outs_cpp.write(';\n')
+		else:
+			outs_cpp.write('\n\t{\n')
+			outs_cpp.write('\t\t(void)GetProcAddress;\n')
+			outs_cpp.write('\t\tAvailable = true;\n')
+		outs_cpp.write('\t}\n')
+		outs_cpp.write('\n')
+		return {'hpp': outs_hpp.getvalue(), 'cpp': outs_cpp.getvalue()}
+
+	if len(extensions):
+		outs_hpp.write('\ttypedef int64_t GLint64EXT;\n')
+		outs_hpp.write('\ttypedef uint64_t GLuint64EXT;\n')
+		outs_hpp.write('\ttypedef void* GLeglImageOES;\n')
+		outs_hpp.write('\tusing GLDEBUGPROCARB = GLDEBUGPROC;\n')
+		outs_hpp.write('\tusing GLDEBUGPROCKHR = GLDEBUGPROC;\n')
+		outs_hpp.write('\tusing GLVULKANPROCNV = void (APIENTRYP) (void);\n')
+		outs_hpp.write('\tstruct _cl_context;\n')
+		outs_hpp.write('\tstruct _cl_event;\n')
+		outs_hpp.write('\n')
+		ext_infos = list(_extension_infos(registry, extensions))
+		for info, curext in ext_infos:
+			ext = _on_extension(info, curext)
+			outs_hpp.write(ext['hpp'])
+			outs_cpp.write(ext['cpp'])
+
+		# The extensions the context reports are gathered once, each extension is only loaded when first asked for
+		outs_hpp.write('\t// `GetProcAddress` must also return the OpenGL 1.0 and 1.1 functions `glGetIntegerv` and `glGetString`,\n')
+		outs_hpp.write('\t// on Windows that means falling back to the exports of opengl32.dll where `wglGetProcAddress()` returns null\n')
+		outs_hpp.write('\tclass Extensions\n')
+		outs_hpp.write('\t{\n')
+		outs_hpp.write('\tprotected:\n')
+		outs_hpp.write('\t\tFunc_GetProcAddress GetProcAddress;\n')
+		outs_hpp.write('\t\tstd::unordered_set<std::string> Supported;\n')
+		for info, curext in ext_infos:
+			outs_hpp.write(f"\t\tstd::unique_ptr<{info['class_name']}> {info['class_name']}_Instance;\n")
+		outs_hpp.write('\n')
+		outs_hpp.write('\tpublic:\n')
+		outs_hpp.write('\t\tExtensions() = delete;\n')
+		outs_hpp.write('\t\tExtensions(Func_GetProcAddress GetProcAddress);\n')
+		outs_hpp.write('\t\tinline bool IsSupported(const std::string& Name) const { return Supported.count(Name) != 0; }\n')
+		outs_hpp.write('\n')
+		for info, curext in ext_infos:
+			outs_hpp.write(f"\t\t{info['class_name']}* Get_{info['class_name']}();\n")
+		outs_hpp.write('\t};\n')
+
+		outs_cpp.write('\tExtensions::Extensions(Func_GetProcAddress GetProcAddress):\n')
+		outs_cpp.write('\t\tGetProcAddress(GetProcAddress)\n')
+		outs_cpp.write('\t{\n')
+		outs_cpp.write('\t\tusing PFNGLGETINTEGERVPROC = void (APIENTRYP) (GLenum pname, GLint* data);\n')
+		outs_cpp.write('\t\tusing PFNGLGETSTRINGPROC = const GLubyte* (APIENTRYP) (GLenum name);\n')
+		outs_cpp.write('\t\tusing PFNGLGETSTRINGIPROC = const GLubyte* (APIENTRYP) (GLenum name, GLuint index);\n')
+		outs_cpp.write(f'\t\tauto GetIntegerv = {cppfunc_cast}<PFNGLGETINTEGERVPROC>(GetProcAddress("glGetIntegerv"));\n')
+		outs_cpp.write(f'\t\tauto GetStringi = {cppfunc_cast}<PFNGLGETSTRINGIPROC>(GetProcAddress("glGetStringi"));\n')
+		outs_cpp.write('\t\tif (GetIntegerv && GetStringi)\n')
+		outs_cpp.write('\t\t{\n')
+		outs_cpp.write('\t\t\tGLint NumExtensions = 0;\n')
+		outs_cpp.write(f"\t\t\tGetIntegerv({registry.enum(f'{PREFIX_}NUM_EXTENSIONS')['value']} /* {PREFIX_}NUM_EXTENSIONS */, &NumExtensions);\n")
+		outs_cpp.write('\t\t\tfor (GLint i = 0; i < NumExtensions; i++)\n')
+		outs_cpp.write('\t\t\t{\n')
+		outs_cpp.write(f"\t\t\t\tauto Name = reinterpret_cast<const char*>(GetStringi({registry.enum(f'{PREFIX_}EXTENSIONS')['value']} /* {PREFIX_}EXTENSIONS */, GLuint(i)));\n")
+		outs_cpp.write('\t\t\t\tif (Name) Supported.insert(Name);\n')
+		outs_cpp.write('\t\t\t}\n')
+		outs_cpp.write('\t\t\treturn;\n')
+		outs_cpp.write('\t\t}\n')
+		outs_cpp.write('\t\t// Before OpenGL 3.0 the extensions come as one space separated string\n')
+		outs_cpp.write(f'\t\tauto GetString = {cppfunc_cast}<PFNGLGETSTRINGPROC>(GetProcAddress("glGetString"));\n')
+		outs_cpp.write('\t\tif (!GetString) return;\n')
+		outs_cpp.write(f"\t\tauto Names = reinterpret_cast<const char*>(GetString({registry.enum(f'{PREFIX_}EXTENSIONS')['value']} /* {PREFIX_}EXTENSIONS */));\n")
+		outs_cpp.write('\t\tif (!Names) return;\n')
+		outs_cpp.write('\t\twhile (*Names)\n')
+		outs_cpp.write('\t\t{\n')
+		outs_cpp.write("\t\t\tauto End = strchr(Names, ' ');\n")
+		outs_cpp.write('\t\t\tif (!End) End = Names + strlen(Names);\n')
+		outs_cpp.write('\t\t\tif (End != Names) Supported.insert(std::string(Names, End));\n')
+		outs_cpp.write('\t\t\tNames = *End ? End + 1 : End;\n')
+		outs_cpp.write('\t\t}\n')
+		outs_cpp.write('\t}\n')
+		outs_cpp.write('\n')
+		for info, curext in ext_infos:
+			ext_name = info['id']
+			class_name = info['class_name']
+			outs_cpp.write(f'\t{class_name}* Extensions::Get_{class_name}()\n')
+			outs_cpp.write('\t{\n')
+			outs_cpp.write(f'\t\tif (!{class_name}_Instance)\n')
+			outs_cpp.write('\t\t{\n')
+			outs_cpp.write(f'\t\t\tif (!IsSupported("{ext_name}")) return nullptr;\n')
+			outs_cpp.write(f'\t\t\t{class_name}_Instance.reset(new {class_name}(GetProcAddress));\n')
+			outs_cpp.write('\t\t}\n')
+			outs_cpp.write(f'\t\treturn {class_name}_Instance->{class_name}IsAvailable() ? {class_name}_Instance.get() : nullptr;\n')
+			outs_cpp.write('\t}\n')
+			outs_cpp.write('\n')
+
+	if command_buffer:
+		commands = {}
+		for info, curver in _version_infos(versions):
+			for funcn, funcproto in curver['funcproto'].items():
+				if funcproto['ret'] != 'void' or funcn in commands: continue
+				# What a function writes through a pointer would only arrive at the replay, into memory long gone
+				if any('*' in argtype and not haveconst for argtype, argname, haveconst in _c_params(funcproto['arglist'])): continue
+				commands[funcn] = (funcproto['arglist'], info['class_name'])
+
+		def full_params(arglist):
+			# The recorded values keep their `const`s, `_c_params()` drops them
+			if arglist.strip() == 'void': return ()
+			return tuple(tuple(arg.strip().rsplit(' ', 1)) for arg in arglist.split(','))
+
+		# The recorder goes into its own header and source, so the includers of `{modname}.hpp` don't parse it
+		outs_cb_hpp = io.StringIO()
+		outs_cb_cpp = io.StringIO()
+		outs_cb_hpp.write('#pragma once\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write(f'#include "{modname}.hpp"\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write('#include<cstring>\n')
+		outs_cb_hpp.write('#include<memory>\n')
+		outs_cb_hpp.write('#include<type_traits>\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write('namespace GL\n')
+		outs_cb_hpp.write('{\n')
+		outs_cb_hpp.write(f'\t// Records the calls to the {OpenGL} functions without a return value or output pointers into a byte buffer, to be\n')
+		outs_cb_hpp.write('\t// replayed later on the thread that owns the context. Only the argument values are recorded: the memory a pointer\n')
+		outs_cb_hpp.write('\t// argument points to has to stay valid until the replay. Recording isn\'t synchronized: each recording thread needs\n')
+		outs_cb_hpp.write('\t// its own buffer, handed over to the context thread for `Replay()`.\n')
+		outs_cb_hpp.write('\tclass CommandBuffer\n')
+		outs_cb_hpp.write('\t{\n')
+		outs_cb_hpp.write('\tpublic:\n')
+		outs_cb_hpp.write('\t\tenum class Op : uint16_t\n')
+		outs_cb_hpp.write('\t\t{\n')
+		for funcn in commands:
+			outs_cb_hpp.write(f'\t\t\t{funcn[len(prefix):]},\n')
+		outs_cb_hpp.write('\t\t};\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write('\tprotected:\n')
+		outs_cb_hpp.write('\t\tstd::unique_ptr<uint8_t[]> Data;\n')
+		outs_cb_hpp.write('\t\tsize_t Used = 0;\n')
+		outs_cb_hpp.write('\t\tsize_t Capacity = 0;\n')
+		outs_cb_hpp.write('\t\tsize_t Count = 0;\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write('\t\tuint8_t* Grow(size_t Size)\n')
+		outs_cb_hpp.write('\t\t{\n')
+		outs_cb_hpp.write('\t\t\tif (Used + Size > Capacity) Reserve(Used + Size);\n')
+		outs_cb_hpp.write('\t\t\tuint8_t* Ptr = Data.get() + Used;\n')
+		outs_cb_hpp.write('\t\t\tUsed += Size;\n')
+		outs_cb_hpp.write('\t\t\tCount++;\n')
+		outs_cb_hpp.write('\t\t\treturn Ptr;\n')
+		outs_cb_hpp.write('\t\t}\n')
+		outs_cb_hpp.write('\t\t// The values are packed without padding, so they are copied in and out instead of dereferenced\n')
+		outs_cb_hpp.write('\t\ttemplate<typename T>\n')
+		outs_cb_hpp.write('\t\tstatic void Put(uint8_t*& Ptr, const T& Value) { memcpy(Ptr, &Value, sizeof Value); Ptr += sizeof Value; }\n')
+		outs_cb_hpp.write('\t\ttemplate<typename T>\n')
+		outs_cb_hpp.write('\t\tstatic T Get(const uint8_t*& Ptr) { T Value; memcpy(&Value, Ptr, sizeof Value); Ptr += sizeof Value; return Value; }\n')
+		outs_cb_hpp.write('\t\tstatic void Unavailable(const char* Symbol);\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write('\tpublic:\n')
+		outs_cb_hpp.write('\t\tCommandBuffer() = default;\n')
+		outs_cb_hpp.write('\t\tCommandBuffer(size_t InitialCapacity);\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write('\t\t// Makes room for `Size` bytes of commands in total\n')
+		outs_cb_hpp.write('\t\tvoid Reserve(size_t Size);\n')
+		outs_cb_hpp.write('\t\t// Drops the recorded commands but keeps the memory for the next recording\n')
+		outs_cb_hpp.write('\t\tvoid Reset() { Used = 0; Count = 0; }\n')
+		outs_cb_hpp.write('\t\tsize_t GetSize() const { return Used; }\n')
+		outs_cb_hpp.write('\t\tsize_t GetCount() const { return Count; }\n')
+		outs_cb_hpp.write('\n')
+		for funcn, (arglist, class_name) in commands.items():
+			proto = funcn[len(prefix):]
+			params = full_params(arglist)
+			size = ' + '.join(['sizeof(Op)'] + [f'sizeof {argname}' for argtype, argname in params])
+			outs_cb_hpp.write(f'\t\tvoid {proto}({arglist})\n')
+			outs_cb_hpp.write('\t\t{\n')
+			outs_cb_hpp.write(f'\t\t\tuint8_t* Ptr = Grow({size});\n')
+			outs_cb_hpp.write(f'\t\t\tPut(Ptr, Op::{proto});\n')
+			for argtype, argname in params:
+				outs_cb_hpp.write(f'\t\t\tPut(Ptr, {argname});\n')
+			outs_cb_hpp.write('\t\t}\n')
+		outs_cb_hpp.write('\n')
+		outs_cb_hpp.write('\t\t// Calls the recorded commands in order through any version class, or a `StateCache` of one. A command whose\n')
+		outs_cb_hpp.write('\t\t// function isn\'t part of `Version` throws `NullFuncPtrException` when it is reached.\n')
+		outs_cb_hpp.write('\t\ttemplate<typename Version>\n')
+		outs_cb_hpp.write('\t\tvoid Replay(Version& Functions) const\n')
+		outs_cb_hpp.write('\t\t{\n')
+		outs_cb_hpp.write('\t\t\tconst uint8_t* Ptr = Data.get();\n')
+		outs_cb_hpp.write('\t\t\tconst uint8_t* End = Ptr + Used;\n')
+		outs_cb_hpp.write('\t\t\twhile (Ptr < End)\n')
+		outs_cb_hpp.write('\t\t\t{\n')
+		outs_cb_hpp.write('\t\t\t\tswitch (Get<Op>(Ptr))\n')
+		outs_cb_hpp.write('\t\t\t\t{\n')
+		for funcn, (arglist, class_name) in commands.items():
+			proto = funcn[len(prefix):]
+			params = full_params(arglist)
+			outs_cb_hpp.write(f'\t\t\t\tcase Op::{proto}:\n')
+			outs_cb_hpp.write(f'\t\t\t\t\tif constexpr (std::is_base_of_v<{class_name}, Version>)\n')
+			outs_cb_hpp.write('\t\t\t\t\t{\n')
+			# The arguments are read one statement each, the evaluation order of call arguments is unspecified
+			for argtype, argname in params:
+				outs_cb_hpp.write(f'\t\t\t\t\t\tauto {argname} = Get<{argtype}>(Ptr);\n')
+			outs_cb_hpp.write(f"\t\t\t\t\t\tFunctions.{proto}({', '.join(argname for argtype, argname in params)});\n")
+			outs_cb_hpp.write('\t\t\t\t\t}\n')
+			outs_cb_hpp.write(f'\t\t\t\t\telse Unavailable("{funcn}");\n')
+			outs_cb_hpp.write('\t\t\t\t\tbreak;\n')
+		outs_cb_hpp.write('\t\t\t\t}\n')
+		outs_cb_hpp.write('\t\t\t}\n')
+		outs_cb_hpp.write('\t\t}\n')
+		outs_cb_hpp.write('\t};\n')
+		outs_cb_hpp.write('\n')
+
+		outs_cb_cpp.write(f'#include "{modname}_commandbuffer.hpp"\n')
+		outs_cb_cpp.write('\n')
+		outs_cb_cpp.write('namespace GL\n')
+		outs_cb_cpp.write('{\n')
+		outs_cb_cpp.write('\tCommandBuffer::CommandBuffer(size_t InitialCapacity)\n')
+		outs_cb_cpp.write('\t{\n')
+		outs_cb_cpp.write('\t\tReserve(InitialCapacity);\n')
+		outs_cb_cpp.write('\t}\n')
+		outs_cb_cpp.write('\n')
+		outs_cb_cpp.write('\tvoid CommandBuffer::Reserve(size_t Size)\n')
+		outs_cb_cpp.write('\t{\n')
+		outs_cb_cpp.write('\t\tif (Size <= Capacity) return;\n')
+		outs_cb_cpp.write('\t\t// Doubling keeps the recording amortized constant time per command\n')
+		outs_cb_cpp.write('\t\tsize_t NewCapacity = Capacity ? Capacity * 2 : 4096;\n')
+		outs_cb_cpp.write('\t\twhile (NewCapacity < Size) NewCapacity *= 2;\n')
+		outs_cb_cpp.write('\t\tstd::unique_ptr<uint8_t[]> NewData(new uint8_t[NewCapacity]);\n')
+		outs_cb_cpp.write('\t\tif (Used) memcpy(NewData.get(), Data.get(), Used);\n')
+		outs_cb_cpp.write('\t\tData = std::move(NewData);\n')
+		outs_cb_cpp.write('\t\tCapacity = NewCapacity;\n')
+		outs_cb_cpp.write('\t}\n')
+		outs_cb_cpp.write('\n')
+		outs_cb_cpp.write('\tvoid CommandBuffer::Unavailable(const char* Symbol)\n')
+		outs_cb_cpp.write('\t{\n')
+		outs_cb_cpp.write(f'\t\tthrow NullFuncPtrException(std::string("{OpenGL} function `") + Symbol + "` is not part of the version class the command buffer is replayed through.\\n");\n')
+		outs_cb_cpp.write('\t}\n')
+		outs_cb_hpp.write('};\n')
+		outs_cb_cpp.write('};\n')
+		extra_files[f'{modname}_commandbuffer.hpp'] = outs_cb_hpp.getvalue()
+		extra_files[f'{modname}_commandbuffer.cpp'] = outs_cb_cpp.getvalue()
+
+	if state_cache:
+		caches, invalidators = _state_cache_model(versions, registry)
+		texture0 = registry.enum(f'{PREFIX_}TEXTURE0')['value']
+		groups = {cache['group']: cache['slots'] for cache in caches if cache['kind'] == 'keyed'}
+
+		def call_args(arglist):
+			return ', '.join(argname for argtype, argname, haveconst in _c_params(arglist))
+
+		def write_invalidations(members, indent):
+			for member in members:
+				outs_hpp.write(f'{indent}Invalidate_{member}();\n')
+
+		# The template works on any version class, a function is only checked against `Base` when it's called
+		outs_hpp.write(f'\t// Drops the calls that would set the {OpenGL} state to what it already is. The state starts unknown and each\n')
+		outs_hpp.write('\t// cache is filled by the first call to its functions. Call `InvalidateStateCache()` after the state was changed\n')
+		outs_hpp.write('\t// behind its back, like by another library or through `Base` directly.\n')
+		outs_hpp.write('\t// The caches assume the calls succeed: after a call that fails, like binding a texture name to a second target,\n')
+		outs_hpp.write('\t// an identical call is dropped without raising the error again. Targets and capabilities that aren\'t in the\n')
+		outs_hpp.write('\t// enum group, and texture units past `TextureUnits`, are never cached.\n')
+		outs_hpp.write('\ttemplate<typename Base>\n')
+		outs_hpp.write('\tclass StateCache : public Base\n')
+		outs_hpp.write('\t{\n')
+		outs_hpp.write('\tprotected:\n')
+		outs_hpp.write('\t\t// The texture units of which the texture bindings are cached\n')
+		outs_hpp.write('\t\tstatic constexpr GLuint TextureUnits = 32;\n')
+		outs_hpp.write('\n')
+		for group, slots in groups.items():
+			outs_hpp.write(f'\t\tstatic int Slot_{group}(GLenum Value)\n')
+			outs_hpp.write('\t\t{\n')
+			outs_hpp.write('\t\t\tswitch (Value)\n')
+			outs_hpp.write('\t\t\t{\n')
+			for slot, (enum, value) in enumerate(slots):
+				outs_hpp.write(f'\t\t\tcase {value}: return {slot}; // {enum}\n')
+			outs_hpp.write('\t\t\tdefault: return -1;\n')
+			outs_hpp.write('\t\t\t}\n')
+			outs_hpp.write('\t\t}\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t\t// A keyed cache holds the cached value plus one, zero is unknown\n')
+		for cache in caches:
+			member = cache['member']
+			if cache['kind'] == 'keyed':
+				units = '[TextureUnits]' if cache['per_unit'] else ''
+				outs_hpp.write(f"\t\tuint64_t Cache_{member}{units}[{len(cache['slots'])}] = {{}};\n")
+			else:
+				funcn, arglist, value = cache['funcs'][0]
+				fields = ''.join(f' {argtype} {argname};' for argtype, argname, haveconst in _c_params(arglist))
+				outs_hpp.write(f'\t\tstruct {{ bool Known;{fields} }} Cache_{member} = {{}};\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\tpublic:\n')
+		outs_hpp.write('\t\tusing Base::Base;\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t\t// How many calls of each function were dropped\n')
+		outs_hpp.write('\t\tstruct\n')
+		outs_hpp.write('\t\t{\n')
+		for cache in caches:
+			for funcn, arglist, value in cache['funcs']:
+				outs_hpp.write(f'\t\t\tuint64_t {funcn[len(prefix):]} = 0;\n')
+		outs_hpp.write('\t\t} Filtered;\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t\tuint64_t FilteredTotal() const\n')
+		outs_hpp.write('\t\t{\n')
+		outs_hpp.write(f"\t\t\treturn {' + '.join(f'Filtered.{funcn[len(prefix):]}' for cache in caches for funcn, arglist, value in cache['funcs'])};\n")
+		outs_hpp.write('\t\t}\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t\tvoid InvalidateStateCache()\n')
+		outs_hpp.write('\t\t{\n')
+		write_invalidations([cache['member'] for cache in caches], '\t\t\t')
+		outs_hpp.write('\t\t}\n')
+		for cache in caches:
+			outs_hpp.write(f"\t\tvoid Invalidate_{cache['member']}() {{ memset(&Cache_{cache['member']}, 0, sizeof Cache_{cache['member']}); }}\n")
+		outs_hpp.write('\n')
+
+		for cache in caches:
+			member = cache['member']
+			for funcn, arglist, value in cache['funcs']:
+				proto = funcn[len(prefix):]
+				params = _c_params(arglist)
+				dropped = [m for m in invalidators.get(funcn, ((), []))[1]]
+				outs_hpp.write(f'\t\tvoid {proto}({arglist})\n')
+				outs_hpp.write('\t\t{\n')
+				if cache['kind'] == 'keyed':
+					key, name = params[0][1], params[-1][1]
+					cached = f'uint64_t({name}) + 1' if value is None else f'{value}'
+					outs_hpp.write(f"\t\t\tint Slot = Slot_{cache['group']}({key});\n")
+					if cache['per_unit']:
+						outs_hpp.write(f'\t\t\tGLuint Unit = Cache_ActiveTexture.texture - {texture0};\n')
+						outs_hpp.write(f'\t\t\tuint64_t* Cache = Slot >= 0 && Cache_ActiveTexture.Known && Unit < TextureUnits ? &Cache_{member}[Unit][Slot] : nullptr;\n')
+					else:
+						outs_hpp.write(f'\t\t\tuint64_t* Cache = Slot >= 0 ? &Cache_{member}[Slot] : nullptr;\n')
+					outs_hpp.write(f'\t\t\tif (Cache && *Cache == {cached}) {{ Filtered.{proto}++; return; }}\n')
+					outs_hpp.write(f'\t\t\tBase::{proto}({call_args(arglist)});\n')
+					outs_hpp.write(f'\t\t\tif (Cache) *Cache = {cached};\n')
+					if cache['per_unit']:
+						outs_hpp.write(f'\t\t\telse if (!Cache_ActiveTexture.Known) Invalidate_{member}();\n')
+				else:
+					same = ' && '.join([f'Cache_{member}.Known'] + [f'Cache_{member}.{argname} == {argname}' for argtype, argname, haveconst in params])
+					# A unit past the cached ones may be out of range, caching it would hide the error of the next call
+					known = f'{params[0][1]} - {texture0} < TextureUnits' if funcn == f'{prefix}ActiveTexture' else 'true'
+					outs_hpp.write(f'\t\t\tif ({same}) {{ Filtered.{proto}++; return; }}\n')
+					outs_hpp.write(f'\t\t\tBase::{proto}({call_args(arglist)});\n')
+					outs_hpp.write(f'\t\t\tCache_{member} = {{{known}, {call_args(arglist)}}};\n')
+				write_invalidations(dropped, '\t\t\t')
+				outs_hpp.write('\t\t}\n')
+		cached_funcs = {funcn for cache in caches for funcn, arglist, value in cache['funcs']}
+		for funcn, (funcproto, dropped) in invalidators.items():
+			if funcn in cached_funcs: continue
+			outs_hpp.write(f"\t\tvoid {funcn[len(prefix):]}({funcproto['arglist']})\n")
+			outs_hpp.write('\t\t{\n')
+			outs_hpp.write(f"\t\t\tBase::{funcn[len(prefix):]}({call_args(funcproto['arglist'])});\n")
+			write_invalidations(dropped, '\t\t\t')
+			outs_hpp.write('\t\t}\n')
+		outs_hpp.write('\t};\n')
+		outs_hpp.write('\n')
+
+	if instrument:
+		ids = _instrument_ids(versions)
+		funcprotos = {}
+		for info, curver in _version_infos(versions):
+			for funcn, funcproto in curver['funcproto'].items():
+				funcprotos.setdefault(funcn, funcproto)
+
+		outs_hpp.write('\t// The calls to one function and the time spent in them, a row of `Instrumentation::Table`\n')
+		outs_hpp.write('\tstruct CallStats\n')
+		outs_hpp.write('\t{\n')
+		outs_hpp.write('\t\tconst char* Name;\n')
+		outs_hpp.write('\t\tstd::atomic<uint64_t> Calls;\n')
+		outs_hpp.write('\t\tstd::atomic<uint64_t> Nanoseconds;\n')
+		outs_hpp.write('\t};\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t// The table that every `Instrumented` class counts its calls into, indexed by function ID\n')
+		outs_hpp.write('\tclass Instrumentation\n')
+		outs_hpp.write('\t{\n')
+		outs_hpp.write('\tpublic:\n')
+		outs_hpp.write('\t\tenum FuncID : size_t\n')
+		outs_hpp.write('\t\t{\n')
+		for funcn in ids:
+			outs_hpp.write(f'\t\t\t{funcn[len(prefix):]},\n')
+		outs_hpp.write('\t\t};\n')
+		outs_hpp.write(f'\t\tstatic constexpr size_t Functions = {len(ids)};\n')
+		if module:
+			# An importer of the module has to find the definitions in the interface, the out-of-line ones get the module
+			# attachment on some compilers and no longer link against the declarations an importer sees
+			outs_hpp.write('\t\tstatic inline CallStats Table[Functions] =\n')
+			outs_hpp.write('\t\t{\n')
+			for funcn in ids:
+				outs_hpp.write(f'\t\t\t{{"{funcn}"}},\n')
+			outs_hpp.write('\t\t};\n')
+		else:
+			outs_hpp.write('\t\tstatic CallStats Table[Functions];\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t\tstatic void Add(FuncID ID, std::chrono::steady_clock::time_point Start)\n')
+		outs_hpp.write('\t\t{\n')
+		outs_hpp.write('\t\t\tauto Elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now() - Start).count();\n')
+		outs_hpp.write('\t\t\tTable[ID].Calls.fetch_add(1, std::memory_order_relaxed);\n')
+		outs_hpp.write('\t\t\tTable[ID].Nanoseconds.fetch_add(uint64_t(Elapsed), std::memory_order_relaxed);\n')
+		outs_hpp.write('\t\t}\n')
+		outs_hpp.write('\t\t// The rows of the functions that were called, the most total time first\n')
+		outs_hpp.write('\t\tstatic std::vector<const CallStats*> Sorted();\n')
+		outs_hpp.write('\t\t// Formats `Sorted()` as a table of the calls, the total and the mean time of each function\n')
+		outs_hpp.write('\t\tstatic std::string Dump();\n')
+		outs_hpp.write('\t\tstatic void Reset();\n')
+		outs_hpp.write('\t};\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t// Counts the calls to each function and the time spent in them into `Instrumentation::Table`. Using `Base` directly\n')
+		outs_hpp.write('\t// instead leaves no trace of the instrumentation.\n')
+		outs_hpp.write('\ttemplate<typename Base>\n')
+		outs_hpp.write('\tclass Instrumented : public Base\n')
+		outs_hpp.write('\t{\n')
+		outs_hpp.write('\tprotected:\n')
+		outs_hpp.write('\t\tstruct Timer\n')
+		outs_hpp.write('\t\t{\n')
+		outs_hpp.write('\t\t\tInstrumentation::FuncID ID;\n')
+		outs_hpp.write('\t\t\tstd::chrono::steady_clock::time_point Start = std::chrono::steady_clock::now();\n')
+		outs_hpp.write('\t\t\t~Timer() { Instrumentation::Add(ID, Start); }\n')
+		outs_hpp.write('\t\t};\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\tpublic:\n')
+		outs_hpp.write('\t\tusing Base::Base;\n')
+		outs_hpp.write('\n')
+		outs_hpp.write('\t\t// Each wrapper is a template that only exists when `Base` has the function, so the desktop and the ES versions\n')
+		outs_hpp.write("\t\t// don't get the functions of each other\n")
+		for funcn, funcproto in funcprotos.items():
+			proto = funcn[len(prefix):]
+			args = ', '.join(argname for argtype, argname, haveconst in _c_params(funcproto['arglist']))
+			outs_hpp.write(f"\t\ttemplate<typename B = Base> auto {proto}({funcproto['arglist']}) -> decltype(std::declval<B&>().{proto}({args})) {{ Timer Time{{Instrumentation::{proto}}}; return B::{proto}({args}); }}\n")
+		outs_hpp.write('\t};\n')
+		outs_hpp.write('\n')
+
+		if not module:
+			outs_cpp.write('\tCallStats Instrumentation::Table[Instrumentation::Functions] =\n')
+			outs_cpp.write('\t{\n')
+			for funcn in ids:
+				outs_cpp.write(f'\t\t{{"{funcn}"}},\n')
+			outs_cpp.write('\t};\n')
+			outs_cpp.write('\n')
+		outs_impl, inline = (outs_hpp, 'inline ') if module else (outs_cpp, '')
+		outs_impl.write(f'\t{inline}std::vector<const CallStats*> Instrumentation::Sorted()\n')
+		outs_impl.write('\t{\n')
+		outs_impl.write('\t\tstd::vector<const CallStats*> Rows;\n')
+		outs_impl.write('\t\tauto Slower = [](uint64_t Nanoseconds, const CallStats* Row) { return Nanoseconds > Row->Nanoseconds.load(std::memory_order_relaxed); };\n')
+		outs_impl.write('\t\tfor (auto& Row : Table)\n')
+		outs_impl.write('\t\t\tif (Row.Calls.load(std::memory_order_relaxed))\n')
+		outs_impl.write('\t\t\t\tRows.insert(std::upper_bound(Rows.begin(), Rows.end(), Row.Nanoseconds.load(std::memory_order_relaxed), Slower), &Row);\n')
+		outs_impl.write('\t\treturn Rows;\n')
+		outs_impl.write('\t}\n')
+		outs_impl.write('\n')
+		outs_impl.write(f'\t{inline}std::string Instrumentation::Dump()\n')
+		outs_impl.write('\t{\n')
+		outs_impl.write('\t\tchar Line[256];\n')
+		outs_impl.write('\t\tsnprintf(Line, sizeof Line, "%-40s %12s %14s %10s\\n", "function", "calls", "total ms", "ns/call");\n')
+		outs_impl.write('\t\tstd::string Ret = Line;\n')
+		outs_impl.write('\t\tfor (auto Row : Sorted())\n')
+		outs_impl.write('\t\t{\n')
+		outs_impl.write('\t\t\tuint64_t Calls = Row->Calls.load(), Nanoseconds = Row->Nanoseconds.load();\n')
+		outs_impl.write('\t\t\tsnprintf(Line, sizeof Line, "%-40s %12llu %14.3f %10.1f\\n", Row->Name, (unsigned long long)Calls, Nanoseconds / 1e6, double(Nanoseconds) / Calls);\n')
+		outs_impl.write('\t\t\tRet += Line;\n')
+		outs_impl.write('\t\t}\n')
+		outs_impl.write('\t\treturn Ret;\n')
+		outs_impl.write('\t}\n')
+		outs_impl.write('\n')
+		outs_impl.write(f'\t{inline}void Instrumentation::Reset()\n')
+		outs_impl.write('\t{\n')
+		outs_impl.write('\t\tfor (auto& Row : Table)\n')
+		outs_impl.write('\t\t{\n')
+		outs_impl.write('\t\t\tRow.Calls = 0;\n')
+		outs_impl.write('\t\t\tRow.Nanoseconds = 0;\n')
+		outs_impl.write('\t\t}\n')
+		outs_impl.write('\t}\n')
+		outs_impl.write('\n')
+
+	outs_hpp.write('};\n')
+	outs_cpp.write('};\n')
+
+	if split:
+		# Forward declare the classes in namespace `GL`, for the headers that only pass them around
+		classes = ['class NullFuncPtrException']
+		classes += [f"class {info['class_name']}" for info, curver in _version_infos(versions)]
+		if len(extensions):
+			classes += [f"class {info['class_name']}" for info, curext in ext_infos] + ['class Extensions']
+		if command_buffer:
+			classes += ['class CommandBuffer']
+		if state_cache:
+			classes += ['template<typename Base> class StateCache']
+		if instrument:
+			classes += ['struct CallStats', 'class Instrumentation', 'template<typename Base> class Instrumented']
+		outs_fwd = io.StringIO()
+		outs_fwd.write('#pragma once\n')
+		outs_fwd.write('\n')
+		outs_fwd.write('namespace GL\n')
+		outs_fwd.write('{\n')
+		for decl in classes:
+			outs_fwd.write(f'\t{decl};\n')
+		outs_fwd.write('};\n')
+		extra_files[f'{modname}_fwd.hpp'] = outs_fwd.getvalue()
+
+	if module:
+		# The header is exported as it is and the implementation is compiled into the same unit, so the object file of the
+		# module replaces `{modname}.cpp` and the definitions get the attachment of the declarations, whether the compiler
+		# honors `extern "C++"` or attaches them to the module. The standard headers go into the global module fragment,
+		# which skips their includes in the purview
+		std_includes = [line for source in [*extra_files.values(), outs_hpp.getvalue(), outs_cpp.getvalue()] for line in source.splitlines() if line.startswith('#include<')]
+		outs_cppm = io.StringIO()
+		outs_cppm.write('module;\n')
+		outs_cppm.write('\n')
+		for line in dict.fromkeys(std_includes):
+			outs_cppm.write(f'{line}\n')
+		outs_cppm.write('\n')
+		outs_cppm.write(f'export module {modname};\n')
+		outs_cppm.write('\n')
+		outs_cppm.write('export extern "C++"\n')
+		outs_cppm.write('{\n')
+		outs_cppm.write(f'#include "{modname}.hpp"\n')
+		if command_buffer:
+			outs_cppm.write(f'#include "{modname}_commandbuffer.hpp"\n')
+		outs_cppm.write('}\n')
+		outs_cppm.write('\n')
+		outs_cppm.write('extern "C++"\n')
+		outs_cppm.write('{\n')
+		outs_cppm.write(f'#include "{modname}.cpp"\n')
+		if command_buffer:
+			outs_cppm.write(f'#include "{modname}_commandbuffer.cpp"\n')
+		outs_cppm.write('}\n')
+		extra_files[f'{modname}.cppm'] = outs_cppm.getvalue()
+
+	return {f'{modname}.hpp': outs_hpp.getvalue(), f'{modname}.cpp': outs_cpp.getvalue()} | extra_files, new_fragments
+
+@functools.lru_cache(maxsize=4096)
+def _c_params(arglist):
+	"""Split a C parameter list into `(type, name, is_const)` tuples with the `const`s dropped, `()` for `void`."""
+	if arglist.strip() == 'void': return ()
+	params = []
+	for arg in arglist.split(','):
+		haveconst = 'const' in arg
+		arg = arg.replace('const ', ' ').replace('const*', '*').replace('* * ', '** ').replace('  ', ' ').strip()
+		argtype, argname = arg.rsplit(' ', 1)
+		params += [(argtype, argname, haveconst)]
+	return tuple(params)
+
+def _gen_cs(versions, registry, fragments = None, extensions = (), options = None):
+	options = options or {}
+	table = options.get('table_loader', False)
+	funcptr = options.get('cs_funcptr', False)
+	new_fragments = {}
+	state = {'typeconv': dict(csharp_typeconv)}
+	outs_csharp = io.StringIO()
+
+	outs_csharp.write('using System;\n')
+	if len(extensions):
+		outs_csharp.write('using System.Collections.Generic;\n')
+	outs_csharp.write('using System.Text;\n')
+	outs_csharp.write('using System.Runtime.InteropServices;\n')
+	if len(extensions):
+		# The callback delegates are declared in the version classes, the extension classes reach them through aliases
+		for info, curver in _version_infos(versions):
+			for functype in curver['functype'].keys():
+				if functype not in curver['type2proto']:
+					outs_csharp.write(f"using {functype} = GL.{info['class_name']}.{functype};\n")
+	outs_csharp.write('namespace GL\n')
+	outs_csharp.write('{\n')
+	outs_csharp.write('\tpublic class NullOpenGLFunctionPointerException : Exception\n')
+	outs_csharp.write('\t{\n')
+	outs_csharp.write('\t\tpublic NullOpenGLFunctionPointerException() {}\n')
+	outs_csharp.write('\t\tpublic NullOpenGLFunctionPointerException(string message) : base(message) {}\n')
+	outs_csharp.write('\t\tpublic NullOpenGLFunctionPointerException(string message, Exception inner) : base(message, inner) {}\n')
+	outs_csharp.write('\t}\n')
+	outs_csharp.write('\tpublic delegate IntPtr Delegate_GetProcAddress (string ProcName);\n')
+
+	# Convert to C# arglist, the results only depend on the arguments as `state['typeconv']` is only ever extended
+	@functools.lru_cache(maxsize=8192)
+	def csargs(arglist, with_marshalas_tag=True, always_use_ref=False, always_use_list=False, always_use_intptr=False, keep_pointers=False):
+		if [always_use_ref, always_use_list, always_use_intptr].count(True) > 1:
+			raise ValueError(f'Invalid arguments')
+		cst = state['typeconv']
+		csarg = []
+		havecount = False
+		for argtype, argname, haveconst in _c_params(arglist):
+			mod = ''
+			cstype = ''
+			if argname in csharp_keywords: argname += '_'
+			if '*' in argtype:
+				levels = argtype.count('*')
+				basetype = argtype.split('*', 1)[0]
+				if keep_pointers:
+					cstype = cst[basetype] + '*' * levels
+				elif always_use_intptr:
+					cstype = 'IntPtr'
+				elif levels == 1:
+					if cst[basetype] == 'char':
+						if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPStr)] {mod}'
+						if haveconst:
+							cstype = 'string'
+						else:
+							cstype = 'StringBuilder'
+					elif havecount and not always_use_ref or always_use_list:
+						if cst[basetype] == 'void':
+							cstype = 'IntPtr'
+						else:
+							if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPArray)] {mod}'
+							cstype = f'{cst[basetype]}[]'
+					else:
+						if cst[basetype] == 'void':
+							cstype = 'IntPtr'
+						else:
+							mod = f'ref {mod}'
+							cstype = cst[basetype]
+				elif levels == 2:
+					if cst[basetype] == 'char':
+						if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPArray)] {mod}'
+						cstype = 'string[]'
+					elif havecount and not always_use_ref or always_use_list:
+						if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPArray)] {mod}'
+						if cst[basetype] == 'void':
+							cstype = 'IntPtr[]'
+						else:
+							cstype = f'{cst[basetype]}[][]'
+					else:
+						mod = f'ref {mod}'
+						if cst[basetype] == 'void':
+							cstype = 'IntPtr'
+						else:
+							cstype = f'{cst[basetype]}[]'
+				else:
+					cstype = 'IntPtr'
+			else:
+				cstype = cst[argtype]
+				if with_marshalas_tag:
+					if cstype == 'bool':
+						cstype = f'[MarshalAs(UnmanagedType.Bool)] {cstype}'
+				if argname in {'count', 'n'}: havecount = True
+				if argname.startswith('num'): havecount = True
+			csarg += [(f'{mod}{cstype}', argname)]
+		return ', '.join([f'{t} {n}' for t, n in csarg])
+	def cscallarg(csarglist):
+		return ", ".join([("ref " if 'ref' in ptype.split(' ') else "") + pname.strip() for ptype, pname in [param.rsplit(" ", 1) for param in csarglist.split(", ")]])
+	# Convert to C# rettype
+	@functools.lru_cache(maxsize=1024)
+	def csret(rettype, keep_pointers=False):
+		cst = state['typeconv']
+		try:
+			return cst[rettype]
+		except KeyError:
+			pass
+		if '*' in rettype:
+			if keep_pointers:
+				try:
+					return cst[rettype.split('*', 1)[0]] + '*' * rettype.count('*')
+				except KeyError:
+					pass
+			else:
+				return 'IntPtr';
+		raise ValueError(f"Unknown {rettype}")
+
+
+	# Convert to the blittable C# type for the unmanaged function pointers, also returns the managed type of a non-pointer
+	def csfptype(ctype):
+		ctype = ctype.removeprefix('const ')
+		cstype = state['typeconv'][ctype.split('*', 1)[0]]
+		levels = ctype.count('*')
+		return csharp_blittable.get(cstype, cstype) + '*' * levels, cstype if not levels else None
+
+	def span_checks(funcn, params, spans):
+		"""Yield `(argname, needed, capacity)` for each span whose length gl.xml gives by the scalar params, like `count*4`.
+
+		The lengths of `void` pointers are in bytes. A `COMPSIZE()` length depends on the enums and is left unchecked.
+		"""
+		if funcn not in registry.func_ids: return
+		scalars = {argname for cstype, managed, argname, haveconst in params if '*' not in cstype}
+		for param in registry.func(funcn)['params']:
+			length = param['len']
+			argname = f"{param['name']}_" if param['name'] in csharp_keywords else param['name']
+			if argname not in spans or length is None: continue
+			tokens = csharp_len_tokens.findall(length)
+			if ''.join(tokens) != length.replace(' ', ''): continue
+			names = [token for token in tokens if token[0].isalpha() or token[0] == '_']
+			if any((f'{name}_' if name in csharp_keywords else name) not in scalars for name in names): continue
+			needed = ''.join(f"(long){f'{token}_' if token in csharp_keywords else token}" if token in names else token for token in tokens)
+			capacity = f'(long){argname}.Length * sizeof(T)' if spans[argname] == 'T' else f'{argname}.Length'
+			yield argname, f'({needed})' if len(tokens) > 1 else needed, capacity
+
+	def funcptr_members(funcn, funcproto, outs_fields, outs_wrappers, inherited):
+		"""Write the unmanaged function pointer field of `funcn`, its wrapper and its `Span<T>` overload, returns the field name and type
+
+		`inherited` holds the fields and the method signatures of the earlier versions, the ones redeclared here get `new`.
+		"""
+		def hides(member):
+			if member in inherited: return 'new '
+			inherited.add(member)
+			return ''
+
+		proto = funcn[len(prefix):]
+		fieldname = f'{proto}_proc'
+		rettype, retmanaged = csfptype(funcproto['ret'])
+		params = []
+		for argtype, argname, haveconst in _c_params(funcproto['arglist']):
+			if argname in csharp_keywords: argname += '_'
+			params += [(*csfptype(argtype), argname, haveconst)]
+		fptype = f'delegate* unmanaged[Stdcall]<{"".join(f"{cstype}, " for cstype, managed, argname, haveconst in params)}{rettype}>'
+		outs_fields.write(f'\t\tpublic {hides(fieldname)}readonly {fptype} {fieldname};\n')
+
+		# `GLboolean` is a `byte` to the pointer, but a `bool` to the wrappers
+		wrapret = 'bool' if retmanaged == 'bool' else rettype
+		wrapargs = ', '.join(f'{"bool" if managed == "bool" else cstype} {argname}' for cstype, managed, argname, haveconst in params)
+		callargs = ', '.join(f'(byte)({argname} ? 1 : 0)' if managed == 'bool' else argname for cstype, managed, argname, haveconst in params)
+		wraptypes = ', '.join('bool' if managed == 'bool' else cstype for cstype, managed, argname, haveconst in params)
+		outs_wrappers.write(f'\t\tpublic {hides(f"{proto}({wraptypes})")}{wrapret} {proto}({wrapargs}) {{ ')
+		if rettype != 'void': outs_wrappers.write('return ')
+		outs_wrappers.write(f'{fieldname}({callargs}){" != 0" if retmanaged == "bool" else ""}; }}\n')
+
+		# The pointers to an element type take a span of it, the one to `void` a span of `T` if there is only one
+		spans = {argname: cstype[:-1] for cstype, managed, argname, haveconst in params if cstype.count('*') == 1 and argname not in csharp_nospan_params}
+		generic = [argname for argname, elemtype in spans.items() if elemtype == 'void']
+		if len(generic) > 1:
+			for argname in generic: del spans[argname]
+		elif len(generic):
+			spans[generic[0]] = 'T'
+		if len(spans):
+			is_generic = 'T' in spans.values()
+			spanargs = ', '.join(f'{"ReadOnlySpan" if haveconst else "Span"}<{spans[argname]}> {argname}' if argname in spans else f'{"bool" if managed == "bool" else cstype} {argname}' for cstype, managed, argname, haveconst in params)
+			spantypes = ', '.join(arg.rsplit(' ', 1)[0] for arg in spanargs.split(', '))
+			spanname = f'{proto}<T>' if is_generic else proto
+			outs_wrappers.write(f'\t\tpublic {hides(f"{spanname}({spantypes})")}{wrapret} {spanname}({spanargs}){" where T : unmanaged" if is_generic else ""} {{ ')
+			outs_wrappers.write(''.join(f'if ({needed} > {capacity}) throw new ArgumentOutOfRangeException(nameof({argname})); ' for argname, needed, capacity in span_checks(funcn, params, spans)))
+			outs_wrappers.write(''.join(f'fixed ({elemtype}* {argname}_ptr = {argname}) ' for argname, elemtype in spans.items()))
+			outs_wrappers.write('{ ')
+			if wrapret != 'void': outs_wrappers.write('return ')
+			outs_wrappers.write(f'{proto}({", ".join(f"{argname}_ptr" if argname in spans else argname for cstype, managed, argname, haveconst in params)}); }} }}\n')
+		return fieldname, fptype
+
+	def load_table(outs, outs_utilities, indent, funcnames, get_proc = 'GetProcAddress'):
+		"""Write the sorted name table and the loop that looks all of them up into `Procs` by `get_proc`, returns the slot of each name"""
+		proc_index = {funcname: i for i, funcname in enumerate(sorted(funcnames))}
+		proc_names = ', '.join(f'"{funcname}"' for funcname in proc_index.keys())
+		outs_utilities.write(f'\t\tprivate static readonly string[] ProcNames = {{{proc_names}}};\n')
+		outs.write(f'{indent}var Procs = new IntPtr[ProcNames.Length];\n')
+		outs.write(f'{indent}for (int i = 0; i < ProcNames.Length; i++)\n')
+		outs.write(f'{indent}{{\n')
+		outs.write(f'{indent}\tProcs[i] = {get_proc}(ProcNames[i]);\n')
+		outs.write(f'{indent}\tif (Procs[i] == IntPtr.Zero) Available = false;\n')
+		outs.write(f'{indent}}}\n')
+		return proc_index
+
+	def load_funcptrs(outs, outs_utilities, indent, funcptr2load, get_proc = 'GetProcAddress', get_pointer = 'GetOpenGLFunctionPointer'):
+		"""Write the lookups of the unmanaged function pointers, through the name table with `table_loader`"""
+		if table:
+			proc_index = load_table(outs, outs_utilities, indent, funcptr2load.keys(), get_proc)
+			outs.write(f'{indent}if (Available)\n')
+			outs.write(f'{indent}{{\n')
+			for funcname, (fieldname, fptype) in funcptr2load.items():
+				outs.write(f'{indent}\t{fieldname} = ({fptype})Procs[{proc_index[funcname]}];\n')
+			outs.write(f'{indent}}}\n')
+		else:
+			outs.write(f'{indent}try\n')
+			outs.write(f'{indent}{{\n')
+			for funcname, (fieldname, fptype) in funcptr2load.items():
+				outs.write(f'{indent}\t{fieldname} = ({fptype}){get_pointer}("{funcname}");\n')
+			outs.write(f'{indent}}}\n')
+			outs.write(f'{indent}catch (NullOpenGLFunctionPointerException)\n')
+			outs.write(f'{indent}{{\n')
+			outs.write(f'{indent}\tAvailable = false;\n')
+			outs.write(f'{indent}}}\n')
+
+	def load_delegates(outs, indent, func2load, get_pointer):
+		"""Look each symbol of `func2load` up once, every delegate view of it is made from the same pointer"""
+		outs.write(f'{indent}IntPtr Proc;\n')
+		funcname2members = {}
+		for membername, (functype, funcname) in func2load.items():
+			funcname2members.setdefault(funcname, []).append((membername, functype))
+		for funcname, members in funcname2members.items():
+			outs.write(f'{indent}Proc = {get_pointer(funcname)};\n')
+			for membername, functype in members:
+				outs.write(f'{indent}{membername} = Marshal.GetDelegateForFunctionPointer<{functype}>(Proc);\n')
+
+	def _on_version_end(info, curver):
+		outs_csharp = io.StringIO()
+		version_name = info['name']
+		class_name = info['class_name']
+		l_class_name = info['l_class_name']
+		major, minor, release = info['major'], info['minor'], info['release']
+		is_first_ver = info['is_first_ver']
+		type2proto = curver['type2proto']
+
+		for target_type, typealias in curver['typealias'].items():
+			for alias in typealias:
+				while alias[0] == '*':
+					alias = alias[1:]
+					target_type = target_type + "*"
+			try:
+				target_of_target = state['typeconv'][target_type]
+			except KeyError:
+				target_of_target = target_type
+			for a in typealias:
+				if a not in state['typeconv']:
+					state['typeconv'][a] = target_of_target
+		cst = state['typeconv']
+
+		csharp_func2load = {}
+		csharp_funcptr2load = {}
+		csharp_olfuncs = {}
+		def add_csharp_overload_functions(funcname, rettype, delename, csarglist, unsafe=False):
+			nonlocal csharp_olfuncs
+			funcdata = rettype, delename, csarglist, unsafe
+			if funcname not in csharp_olfuncs:
+				csharp_olfuncs[funcname] = [funcdata]
+			elif funcdata not in csharp_olfuncs[funcname]:
+				csharp_olfuncs[funcname] += [funcdata]
+
+		outs_csharp.write(f'\t#region "{PREFIX_}{version_name}"\n')
+		csharp_funcimp = io.StringIO()
+		csharp_constdef = io.StringIO()
+		csharp_deletype = io.StringIO()
+		csharp_deledef = io.StringIO()
+		csharp_delecb = io.StringIO()
+		csharp_utilities = io.StringIO()
+		csharp_ctor = io.StringIO()
+		csharp_overloads = io.StringIO()
+		csharp_funcptrs = io.StringIO()
+		csharp_wrappers = io.StringIO()
+
+		for functype, fpdata in curver['functype'].items():
+			if functype in type2proto: continue
+			rettype = fpdata['ret']
+			arglist = fpdata['arglist']
+			csharp_delecb.write(f'\t\tpublic delegate {csret(rettype)} {functype} ({csargs(arglist)});\n')
+
+		if is_first_ver:
+			outs_csharp.write(f'\t{"unsafe " if funcptr else ""}class {class_name}\n')
+			outs_csharp.write('\t{\n')
+			# The function pointer mode loads the first version through `GetProcAddress` too
+			for funcn, funcproto in ({} if funcptr else curver['funcproto']).items():
+				rettype = funcproto['ret']
+				arglist = funcproto['arglist']
+
+				csrettype = csret(rettype)
+				if '*' in arglist:
+					singlename = f'{funcn}_ref'
+					multiname = f'{funcn}_list'
+					safename = f'{funcn}_safe'
+					unmanname = f'{funcn}_unman'
+					unsafename = f'{funcn}_unsafe'
+					safeargs = csargs(arglist)
+					singleargs = csargs(arglist, always_use_ref=True)
+					multiargs = csargs(arglist, always_use_list=True)
+					unmanargs = csargs(arglist, always_use_intptr=True)
+					unsafeargs = csargs(arglist, keep_pointers=True)
+					if singleargs != multiargs:
+						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {singlename} ({singleargs});\n')
+						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {multiname} ({multiargs});\n')
+						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {unmanname} ({unmanargs});\n')
+						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+						csharp_funcimp.write(f'\t\tpublic static extern unsafe {csrettype} {unsafename} ({unsafeargs});\n')
+					else:
+						if safeargs != unmanargs:
+							csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+							csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {unmanname} ({unmanargs});\n')
+						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {safename} ({safeargs});\n')
+						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+						csharp_funcimp.write(f'\t\tpublic static extern unsafe {csrettype} {unsafename} ({unsafeargs});\n')
+				else:
+					csarglist = csargs(arglist)
+					csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
+					csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {funcn} ({csarglist});\n')
+		else:
+			outs_csharp.write(f'\t{"unsafe " if funcptr else ""}class {class_name} : {l_class_name}\n')
+			outs_csharp.write('\t{\n')
+
+		if funcptr:
+			inherited = set(state.get('funcptr_members', []))
+			for funcn, funcproto in curver['funcproto'].items():
+				csharp_funcptr2load[funcn] = funcptr_members(funcn, funcproto, csharp_funcptrs, csharp_wrappers, inherited)
+			state['funcptr_members'] = sorted(inherited)
+
+		for functype, fpdata in ({} if funcptr else curver['functype']).items():
+			if functype not in type2proto: continue
+			rettype = fpdata['ret']
+			arglist = fpdata['arglist']
+			pproto = type2proto[functype]
+			proto = pproto[len(prefix):]
+			args = [arg.strip() for arg in arglist.split(',')]
+			#if proto.startswith('Gen') and proto.endswith('s') and len(args) == 2 and args[0].endswith((' n', ' count')) and args[1].count('*') == 1 and 'const' not in args[1] and rettype == 'void':
+			if '*' in arglist:
+				csrettype = csret(rettype)
+				singlename = f'{proto}_ref'
+				singletype = f'PFN{PREFIX}{singlename.upper()}PROC'
+				multiname = f'{proto}_list'
+				multitype = f'PFN{PREFIX}{multiname.upper()}PROC'
+				unmanname = f'{proto}_unman'
+				unmantype = f'PFN{PREFIX}{unmanname.upper()}PROC'
+				unsafename = f'{proto}_unsafe'
+				unsafetype = f'PFN{PREFIX}{unsafename.upper()}PROC'
+				csarg_ref = csargs(arglist, always_use_ref=True)
+				csarg_list = csargs(arglist, always_use_list=True)
+				csarg_unman = csargs(arglist, always_use_intptr=True)
+				csarg_unsafe = csargs(arglist, keep_pointers=True)
+				if csarg_ref != csarg_list:
+					csarg_o_ref = csargs(arglist, always_use_ref=True, with_marshalas_tag=False)
+					csarg_o_list = csargs(arglist, always_use_list=True, with_marshalas_tag=False)
+					csarg_o_unman = csargs(arglist, always_use_intptr=True, with_marshalas_tag=False)
+					csarg_o_unsafe = csargs(arglist, keep_pointers=True, with_marshalas_tag=False)
+					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {singletype} ({csarg_ref});\n')
+					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {multitype} ({csarg_list});\n')
+					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {unmantype} ({csarg_unman});\n')
+					csharp_deletype.write(f'\t\tpublic unsafe delegate {csrettype} {unsafetype} ({csarg_unsafe});\n')
+					csharp_deledef.write(f'\t\tpublic readonly {singletype} {singlename};\n')
+					csharp_deledef.write(f'\t\tpublic readonly {multitype} {multiname};\n')
+					csharp_deledef.write(f'\t\tpublic readonly {unmantype} {unmanname};\n')
+					csharp_deledef.write(f'\t\tpublic readonly {unsafetype} {unsafename};\n')
+					add_csharp_overload_functions(proto, rettype, singlename, csarg_o_ref)
+					add_csharp_overload_functions(proto, rettype, multiname, csarg_o_list)
+					add_csharp_overload_functions(proto, rettype, unmanname, csarg_o_unman)
+					add_csharp_overload_functions(proto, rettype, unsafename, csarg_o_unsafe, unsafe=True)
+					if not is_first_ver:
+						csharp_func2load[singlename] = singletype, pproto
+						csharp_func2load[multiname] = multitype, pproto
+						csharp_func2load[unmanname] = unmantype, pproto
+						csharp_func2load[unsafename] = unsafetype, pproto
+					else:
+						csharp_func2load[singlename] = singletype, f'{pproto}_ref'
+						csharp_func2load[multiname] = multitype, f'{pproto}_list'
+						csharp_func2load[unmanname] = unmantype, f'{pproto}_unman'
+						csharp_func2load[unsafename] = unsafetype, f'{pproto}_unsafe'
+				else:
+					csrettype = csret(rettype, keep_pointers=True)
+					safename = f'{proto}_safe'
+					safetype = f'PFN{PREFIX}{safename.upper()}PROC'
+					unmanname = f'{proto}_unman'
+					unmantype = f'PFN{PREFIX}{unmanname.upper()}PROC'
+					unsafename = f'{proto}_unsafe'
+					unsafetype = f'PFN{PREFIX}{unsafename.upper()}PROC'
+					csarg_safe = csargs(arglist)
+					csarg_unman = csargs(arglist, always_use_intptr=True)
+					csarg_unsafe = csargs(arglist, keep_pointers=True)
+					csarg_o_safe = csargs(arglist, with_marshalas_tag=False)
+					csarg_o_unman = csargs(arglist, always_use_intptr=True, with_marshalas_tag=False)
+					csarg_o_unsafe = csargs(arglist, keep_pointers=True, with_marshalas_tag=False)
+					if csarg_safe != csarg_unman:
+						csharp_deletype.write(f'\t\tpublic delegate {csrettype} {unmantype} ({csarg_unman});\n')
+						csharp_deledef.write(f'\t\tpublic readonly {unmantype} {unmanname};\n')
+						add_csharp_overload_functions(proto, rettype, unmanname, csarg_o_unman)
+					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {safetype} ({csarg_safe});\n')
+					csharp_deletype.write(f'\t\tpublic unsafe delegate {csrettype} {unsafetype} ({csarg_unsafe});\n')
+					csharp_deledef.write(f'\t\tpublic readonly {safetype} {safename};\n')
+					csharp_deledef.write(f'\t\tpublic readonly {unsafetype} {unsafename};\n')
+					add_csharp_overload_functions(proto, rettype, safename, csarg_o_safe)
+					add_csharp_overload_functions(proto, rettype, unsafename, csarg_o_unsafe, unsafe=True)
+					if not is_first_ver:
+						if csarg_safe != csarg_unman:
+							csharp_func2load[unmanname] = unmantype, pproto
+						csharp_func2load[safename] = safetype, pproto
+						csharp_func2load[unsafename] = unsafetype, pproto
+					else:
+						if csarg_safe != csarg_unman:
+							csharp_func2load[unmanname] = unmantype, f'{pproto}_unman'
+						csharp_func2load[safename] = safetype, f'{pproto}_safe'
+						csharp_func2load[unsafename] = unsafetype, f'{pproto}_unsafe'
+			else:
+				csharp_deletype.write(f'\t\tpublic delegate {csret(rettype)} {functype} ({csargs(arglist)});\n')
+				csharp_deledef.write(f'\t\tpublic readonly {functype} {proto};\n')
+				csharp_func2load[proto] = functype, pproto
+
+		if is_first_ver:
+			csharp_utilities.write('\t\tpublic readonly Delegate_GetProcAddress GetProcAddress;\n')
+			csharp_utilities.write('\t\tpublic readonly int Ver_Major;\n')
+			csharp_utilities.write('\t\tpublic readonly int Ver_Minor;\n')
+			csharp_utilities.write('\t\tpublic readonly int Ver_Release;\n')
+			csharp_utilities.write('\t\tpublic readonly string Vendor;\n')
+			csharp_utilities.write('\t\tpublic readonly string Renderer;\n')
+			csharp_utilities.write('\t\tpublic readonly string Version;\n')
+			csharp_utilities.write('\t\tpublic IntPtr GetOpenGLFunctionPointer (string ProcName)\n')
+			csharp_utilities.write('\t\t{\n')
+			csharp_utilities.write('\t\t\tvar FuncPtr = GetProcAddress(ProcName);\n')
+			csharp_utilities.write('\t\t\tif (FuncPtr == IntPtr.Zero) throw new NullOpenGLFunctionPointerException(String.Format("Could not get OpenGL function `{0}`.", ProcName));\n')
+			csharp_utilities.write('\t\t\treturn FuncPtr;\n')
+			csharp_utilities.write('\t\t}\n')
+			csharp_utilities.write('\t\tpublic TDelegate GetOpenGLFunctionDelegate<TDelegate> (string ProcName)\n')
+			csharp_utilities.write('\t\t{\n')
+			csharp_utilities.write('\t\t\treturn Marshal.GetDelegateForFunctionPointer<TDelegate>(GetOpenGLFunctionPointer(ProcName));\n')
+			csharp_utilities.write('\t\t}\n')
+			if funcptr:
+				# Without `DllImport` the first version is looked up too, but `wglGetProcAddress()` returns null for the
+				# OpenGL 1.0 and 1.1 functions that opengl32.dll exports
+				csharp_utilities.write('\t\tprivate static IntPtr OpenGL32;\n')
+				csharp_utilities.write('\t\tprivate IntPtr GetCoreProcAddress (string ProcName)\n')
+				csharp_utilities.write('\t\t{\n')
+				csharp_utilities.write('\t\t\tvar FuncPtr = GetProcAddress(ProcName);\n')
+				csharp_utilities.write('\t\t\tif (FuncPtr == IntPtr.Zero && OperatingSystem.IsWindows())\n')
+				csharp_utilities.write('\t\t\t{\n')
+				csharp_utilities.write('\t\t\t\tif (OpenGL32 == IntPtr.Zero) NativeLibrary.TryLoad("opengl32.dll", out OpenGL32);\n')
+				csharp_utilities.write('\t\t\t\tif (OpenGL32 != IntPtr.Zero) NativeLibrary.TryGetExport(OpenGL32, ProcName, out FuncPtr);\n')
+				csharp_utilities.write('\t\t\t}\n')
+				csharp_utilities.write('\t\t\treturn FuncPtr;\n')
+				csharp_utilities.write('\t\t}\n')
+				csharp_utilities.write('\t\tprivate IntPtr GetCoreFunctionPointer (string ProcName)\n')
+				csharp_utilities.write('\t\t{\n')
+				csharp_utilities.write('\t\t\tvar FuncPtr = GetCoreProcAddress(ProcName);\n')
+				csharp_utilities.write('\t\t\tif (FuncPtr == IntPtr.Zero) throw new NullOpenGLFunctionPointerException(String.Format("Could not get OpenGL function `{0}`.", ProcName));\n')
+				csharp_utilities.write('\t\t\treturn FuncPtr;\n')
+				csharp_utilities.write('\t\t}\n')
+		elif 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+			csharp_utilities.write('\t\tpublic readonly string ShadingLanguageVersion;\n')
+
+		csharp_utilities.write('\t\tprivate readonly bool Available;\n')
+		csharp_utilities.write(f'\t\tpublic bool {class_name}IsAvailable {{get => Available;}}\n')
+
+		for defn, defv in curver['define'].items():
+			deft = _define_type(defn, defv, registry)
+			if deft == 'GLuint64':
+				csdefv = defv.replace('ull', 'ul')
+			elif deft == 'GLint64':
+				csdefv = defv.replace('ll', 'l')
+			else:
+				csdefv = defv.replace('ul', 'u')
+			csharp_constdef.write(f'\t\tpublic readonly {cst[deft]} {defn} = {csdefv};\n')
+
+		for funcn, funcproto in curver['funcproto'].items():
+			rettype = funcproto['ret']
+			arglist = funcproto['arglist']
+			membername = funcn[len(prefix):]
+
+			# Check overloadable functions
+			matched, ovlname, preserve, dimension, typeabbr, is_v = _overload_check(membername)
+			if matched:
+				if is_v:
+					ovlname = f'{ovlname}{preserve}{dimension}{typeabbr}v'
+				else:
+					ovlname = f'{ovlname}{preserve}{typeabbr}'
+				if preserve != 'P' and dimension != '' and '*' not in arglist:
+					add_csharp_overload_functions(ovlname, rettype, membername, csargs(arglist, with_marshalas_tag=False))
+
+		for proto, funcinfos in csharp_olfuncs.items():
+			for funcinfo in funcinfos:
+				rettype, membername, csarglist, unsafe = funcinfo
+				csharp_overloads.write(f'\t\tpublic {"unsafe " if unsafe else ""}{csret(rettype)} {proto}({csarglist}) {{ ')
+				if rettype != 'void': csharp_overloads.write('return ')
+				csharp_overloads.write(f'{membername}({cscallarg(csarglist)}); }}\n')
+
+		if not is_first_ver:
+			csharp_ctor.write(f'\t\tpublic {class_name}(Delegate_GetProcAddress GetProcAddress) : base(GetProcAddress)\n')
+		elif len(curver['funcproto']):
+			csharp_ctor.write(f'\t\tpublic {class_name}(Delegate_GetProcAddress GetProcAddress)\n')
+		csharp_ctor.write('\t\t{\n')
+
+		# `GetString()` returns a `byte*` as an unmanaged function pointer
+		getstring = '(IntPtr)GetString' if funcptr else 'GetString'
+		if is_first_ver:
+			csharp_ctor.write('\t\t\tthis.GetProcAddress = GetProcAddress;\n')
+			csharp_ctor.write('\t\t\tAvailable = true;\n')
+			if funcptr:
+				load_funcptrs(csharp_ctor, csharp_utilities, '\t\t\t', csharp_funcptr2load, 'GetCoreProcAddress', 'GetCoreFunctionPointer')
+				csharp_ctor.write('\t\t\tif (!Available) return;\n')
+			safe_load = []
+			unsafe_load = []
+			for membername, type_and_name in csharp_func2load.items():
+				functype, funcname = type_and_name
+				if membername.endswith('_unsafe') and funcname.endswith('_unsafe'):
+					unsafe_load += [(membername, funcname)]
+				else:
+					safe_load += [(membername, funcname)]
+			for membername, funcname in safe_load:
+				csharp_ctor.write(f'\t\t\t{membername} = {funcname};\n')
+			if len(unsafe_load):
+				csharp_ctor.write('\t\t\tunsafe\n')
+				csharp_ctor.write('\t\t\t{\n')
+				for membername, funcname in unsafe_load:
+					csharp_ctor.write(f'\t\t\t\t{membername} = {funcname};\n')
+				csharp_ctor.write('\t\t\t}\n')
+			csharp_ctor.write(f'\t\t\tvar VersionString = Marshal.PtrToStringAnsi({getstring}(VERSION));\n')
+			csharp_ctor.write(f'\t\t\tVendor = Marshal.PtrToStringAnsi({getstring}(VENDOR));\n')
+			csharp_ctor.write(f'\t\t\tRenderer = Marshal.PtrToStringAnsi({getstring}(RENDERER));\n')
+			csharp_ctor.write('\t\t\tVersion = VersionString;\n')
+			csharp_ctor.write('\t\t\tif (!string.IsNullOrWhiteSpace(VersionString))\n')
+			csharp_ctor.write('\t\t\t{\n')
+			csharp_ctor.write('\t\t\t\tstring[] VendorSplit = VersionString.Split();\n')
+			csharp_ctor.write("\t\t\t\tstring[] VersionSplit = VendorSplit[0].Split('.');\n")
+			csharp_ctor.write('\t\t\t\tVer_Major = Convert.ToInt32(VersionSplit[0]);\n')
+			csharp_ctor.write('\t\t\t\tVer_Minor = Convert.ToInt32(VersionSplit[1]);\n')
+			csharp_ctor.write('\t\t\t\tVer_Release = Convert.ToInt32(VersionSplit[2]);\n')
+			csharp_ctor.write('\t\t\t}\n')
+		else:
+			csharp_ctor.write(f'\t\t\tAvailable = Ver_Major > {major} || (Ver_Major == {major} && (Ver_Minor > {minor} || (Ver_Minor == {minor} && Ver_Release >= {release})));\n')
+			csharp_ctor.write(f'\t\t\tif (Available)\n')
+			csharp_ctor.write('\t\t\t{\n')
+			if funcptr:
+				load_funcptrs(csharp_ctor, csharp_utilities, '\t\t\t\t', csharp_funcptr2load)
+			elif table:
+				# One lookup per symbol by a loop over the sorted name table, the delegates are then created from the slots
+				proc_index = load_table(csharp_ctor, csharp_utilities, '\t\t\t\t', {funcname for functype, funcname in csharp_func2load.values()})
+				csharp_ctor.write('\t\t\t\tif (Available)\n')
+				csharp_ctor.write('\t\t\t\t{\n')
+				for membername, type_and_name in csharp_func2load.items():
+					functype, funcname = type_and_name
+					csharp_ctor.write(f'\t\t\t\t\t{membername} = Marshal.GetDelegateForFunctionPointer<{functype}>(Procs[{proc_index[funcname]}]);\n')
+				csharp_ctor.write('\t\t\t\t}\n')
+			else:
+				csharp_ctor.write('\t\t\t\ttry\n')
+				csharp_ctor.write('\t\t\t\t{\n')
+				if len(csharp_func2load):
+					load_delegates(csharp_ctor, '\t\t\t\t\t', csharp_func2load, lambda funcname: f'GetOpenGLFunctionPointer("{funcname}")')
+				csharp_ctor.write('\t\t\t\t}\n')
+				csharp_ctor.write('\t\t\t\tcatch (NullOpenGLFunctionPointerException)\n')
+				csharp_ctor.write('\t\t\t\t{\n')
+				csharp_ctor.write('\t\t\t\t\tAvailable = false;\n')
+				csharp_ctor.write('\t\t\t\t}\n')
+			if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+				csharp_ctor.write(f'\t\t\t\tShadingLanguageVersion = Marshal.PtrToStringAnsi({getstring}(SHADING_LANGUAGE_VERSION));\n')
+			csharp_ctor.write('\t\t\t}\n')
+
+		csharp_ctor.write('\t\t}\n')
+
+		def mergeinto(desc, data):
+			nonlocal outs_csharp
+			if len(data):
+				outs_csharp.write(f'\t\t#region "{desc}"\n')
+				outs_csharp.write(data)
+				if data[-1] != '\n': outs_csharp.write('\n')
+				outs_csharp.write(f'\t\t#endregion // {desc}\n')
+
+		mergeinto('Constants', csharp_constdef.getvalue())
+		mergeinto('Function import', csharp_funcimp.getvalue())
+		mergeinto('Callback delegate functions', csharp_delecb.getvalue())
+		mergeinto('Delegate function types', csharp_deletype.getvalue())
+		mergeinto('Delegate functions', csharp_deledef.getvalue())
+		mergeinto('Function pointers', csharp_funcptrs.getvalue())
+		mergeinto('Utilities', csharp_utilities.getvalue())
+		mergeinto('Constructor', csharp_ctor.getvalue())
+		mergeinto('Functions', csharp_wrappers.getvalue())
+		mergeinto('Overload functions', csharp_overloads.getvalue())
+
+		outs_csharp.write('\t}\n')
+		outs_csharp.write(f'\t#endregion // {PREFIX_}{version_name}\n')
+		return outs_csharp.getvalue()
+
+	for info, curver in _version_infos(versions):
+		define_types = _define_types(curver, registry)
+		# The span checks of `cs_funcptr` read the lengths from gl.xml, which the headers don't carry
+		param_lens = {funcn: [param['len'] for param in registry.func(funcn)['params']] for funcn in curver['funcproto'] if funcn in registry.func_ids} if funcptr else {}
+		outs_csharp.write(_fragment(fragments, new_fragments, ['cs', info, curver, define_types, options, param_lens], lambda: _on_version_end(info, curver), state))
+
+	def _on_extension(info, curext):
+		outs_csharp = io.StringIO()
+		ext_name = info['id']
+		class_name = info['class_name']
+		cst = state['typeconv']
+		csharp_constdef = io.StringIO()
+		csharp_deletype = io.StringIO()
+		csharp_deledef = io.StringIO()
+		csharp_utilities = io.StringIO()
+		csharp_ctor = io.StringIO()
+		csharp_overloads = io.StringIO()
+		csharp_func2load = {}
+
+		for defn, defv in curext['define'].items():
+			deft = _define_type(defn, defv, registry)
+			if deft == 'GLuint64':
+				csdefv = defv.replace('ull', 'ul')
+			elif deft == 'GLint64':
+				csdefv = defv.replace('ll', 'l')
+			else:
+				csdefv = defv.replace('ul', 'u')
+			csharp_constdef.write(f'\t\tpublic readonly {cst[deft]} {defn} = {csdefv};\n')
+
+		for funcn, funcproto in curext['funcproto'].items():
+			rettype = funcproto['ret']
+			arglist = funcproto['arglist']
+			proto = funcn[len(prefix):]
+			if '*' in arglist:
+				unmanname = f'{proto}_unman'
+				unmantype = f'PFN{PREFIX}{unmanname.upper()}PROC'
+				unsafename = f'{proto}_unsafe'
+				unsafetype = f'PFN{PREFIX}{unsafename.upper()}PROC'
+				csarg_o_unman = csargs(arglist, always_use_intptr=True, with_marshalas_tag=False)
+				csarg_o_unsafe = csargs(arglist, keep_pointers=True, with_marshalas_tag=False)
+				csharp_deletype.write(f'\t\tpublic delegate {csret(rettype)} {unmantype} ({csargs(arglist, always_use_intptr=True)});\n')
+				csharp_deletype.write(f'\t\tpublic unsafe delegate {csret(rettype, keep_pointers=True)} {unsafetype} ({csargs(arglist, keep_pointers=True)});\n')
+				csharp_deledef.write(f'\t\tpublic readonly {unmantype} {unmanname};\n')
+				csharp_deledef.write(f'\t\tpublic readonly {unsafetype} {unsafename};\n')
+				csharp_func2load[unmanname] = unmantype, funcn
+				csharp_func2load[unsafename] = unsafetype, funcn
+				for membername, csarglist, unsafe, csrettype in ((unmanname, csarg_o_unman, False, csret(rettype)), (unsafename, csarg_o_unsafe, True, csret(rettype, keep_pointers=True))):
+					csharp_overloads.write(f'\t\tpublic {"unsafe " if unsafe else ""}{csrettype} {proto}({csarglist}) {{ ')
+					if rettype != 'void': csharp_overloads.write('return ')
+					csharp_overloads.write(f'{membername}({cscallarg(csarglist)}); }}\n')
+			else:
+				functype = f'PFN{funcn.upper()}PROC'
+				csharp_deletype.write(f'\t\tpublic delegate {csret(rettype)} {functype} ({csargs(arglist)});\n')
+				csharp_deledef.write(f'\t\tpublic readonly {functype} {proto};\n')
+				csharp_func2load[proto] = functype, funcn
+
+		csharp_utilities.write('\t\tprivate readonly bool Available;\n')
+		csharp_utilities.write(f'\t\tpublic bool {class_name}IsAvailable {{get => Available;}}\n')
+
+		csharp_ctor.write(f'\t\tpublic {class_name}(Delegate_GetProcAddress GetProcAddress)\n')
+		csharp_ctor.write('\t\t{\n')
+		csharp_ctor.write('\t\t\tAvailable = true;\n')
+		if len(csharp_func2load):
+			csharp_ctor.write('\t\t\ttry\n')
+			csharp_ctor.write('\t\t\t{\n')
+			load_delegates(csharp_ctor, '\t\t\t\t', csharp_func2load, lambda funcname: f'Extensions.GetOpenGLFunctionPointer(GetProcAddress, "{funcname}")')
+			csharp_ctor.write('\t\t\t}\n')
+			csharp_ctor.write('\t\t\tcatch (NullOpenGLFunctionPointerException)\n')
+			csharp_ctor.write('\t\t\t{\n')
+			csharp_ctor.write('\t\t\t\tAvailable = false;\n')
+			csharp_ctor.write('\t\t\t}\n')
+		csharp_ctor.write('\t\t}\n')
+
+		def mergeinto(desc, data):
+			if len(data):
+				outs_csharp.write(f'\t\t#region "{desc}"\n')
+				outs_csharp.write(data)
+				outs_csharp.write(f'\t\t#endregion // {desc}\n')
+
+		outs_csharp.write(f'\t#region "{ext_name}"\n')
+		outs_csharp.write(f'\tclass {class_name}\n')
+		outs_csharp.write('\t{\n')
+		mergeinto('Constants', csharp_constdef.getvalue())
+		mergeinto('Delegate function types', csharp_deletype.getvalue())
+		mergeinto('Delegate functions', csharp_deledef.getvalue())
+		mergeinto('Utilities', csharp_utilities.getvalue())
+		mergeinto('Constructor', csharp_ctor.getvalue())
+		mergeinto('Overload functions', csharp_overloads.getvalue())
+		outs_csharp.write('\t}\n')
+		outs_csharp.write(f'\t#endregion // {ext_name}\n')
+		return outs_csharp.getvalue()
+
+	if len(extensions):
+		state['typeconv'] |= csharp_ext_typeconv
+		ext_infos = list(_extension_infos(registry, extensions))
+		for info, curext in ext_infos:
+			outs_csharp.write(_on_extension(info, curext))
+
+		# The extensions the context reports are gathered once, each extension is only loaded when first asked for
+		outs_csharp.write('\t#region "Extensions"\n')
+		outs_csharp.write('\tclass Extensions\n')
+		outs_csharp.write('\t{\n')
+		outs_csharp.write('\t\tpublic readonly Delegate_GetProcAddress GetProcAddress;\n')
+		outs_csharp.write('\t\tprivate readonly HashSet<string> Supported = new HashSet<string>();\n')
+		for info, curext in ext_infos:
+			outs_csharp.write(f"\t\tprivate {info['class_name']} {info['class_name']}_Instance;\n")
+		outs_csharp.write('\t\tprivate delegate void PFNGLGETINTEGERVPROC (uint pname, ref int data);\n')
+		outs_csharp.write('\t\tprivate delegate IntPtr PFNGLGETSTRINGPROC (uint name);\n')
+		outs_csharp.write('\t\tprivate delegate IntPtr PFNGLGETSTRINGIPROC (uint name, uint index);\n')
+		# `wglGetProcAddress()` returns null for the OpenGL 1.0 and 1.1 functions, they come from the exports of opengl32.dll like in the first version
+		outs_csharp.write('\t\t[DllImport("opengl32.dll", EntryPoint = "glGetIntegerv")]\n')
+		outs_csharp.write('\t\tprivate static extern void glGetIntegerv (uint pname, ref int data);\n')
+		outs_csharp.write('\t\t[DllImport("opengl32.dll", EntryPoint = "glGetString")]\n')
+		outs_csharp.write('\t\tprivate static extern IntPtr glGetString (uint name);\n')
+		outs_csharp.write('\t\tpublic static IntPtr GetOpenGLFunctionPointer (Delegate_GetProcAddress GetProcAddress, string ProcName)\n')
+		outs_csharp.write('\t\t{\n')
+		outs_csharp.write('\t\t\tvar FuncPtr = GetProcAddress(ProcName);\n')
+		outs_csharp.write('\t\t\tif (FuncPtr == IntPtr.Zero) throw new NullOpenGLFunctionPointerException(String.Format("Could not get OpenGL function `{0}`.", ProcName));\n')
+		outs_csharp.write('\t\t\treturn FuncPtr;\n')
+		outs_csharp.write('\t\t}\n')
+		outs_csharp.write('\t\tpublic static TDelegate GetOpenGLFunctionDelegate<TDelegate> (Delegate_GetProcAddress GetProcAddress, string ProcName)\n')
+		outs_csharp.write('\t\t{\n')
+		outs_csharp.write('\t\t\treturn Marshal.GetDelegateForFunctionPointer<TDelegate>(GetOpenGLFunctionPointer(GetProcAddress, ProcName));\n')
+		outs_csharp.write('\t\t}\n')
+		outs_csharp.write('\t\tpublic Extensions(Delegate_GetProcAddress GetProcAddress)\n')
+		outs_csharp.write('\t\t{\n')
+		outs_csharp.write('\t\t\tthis.GetProcAddress = GetProcAddress;\n')
+		outs_csharp.write('\t\t\tvar GetIntegervPtr = GetProcAddress("glGetIntegerv");\n')
+		outs_csharp.write('\t\t\tvar GetStringPtr = GetProcAddress("glGetString");\n')
+		outs_csharp.write('\t\t\tvar GetStringiPtr = GetProcAddress("glGetStringi");\n')
+		outs_csharp.write('\t\t\tPFNGLGETINTEGERVPROC GetIntegerv = GetIntegervPtr != IntPtr.Zero ? Marshal.GetDelegateForFunctionPointer<PFNGLGETINTEGERVPROC>(GetIntegervPtr) : glGetIntegerv;\n')
+		outs_csharp.write('\t\t\tPFNGLGETSTRINGPROC GetString = GetStringPtr != IntPtr.Zero ? Marshal.GetDelegateForFunctionPointer<PFNGLGETSTRINGPROC>(GetStringPtr) : glGetString;\n')
+		outs_csharp.write('\t\t\tif (GetStringiPtr != IntPtr.Zero)\n')
+		outs_csharp.write('\t\t\t{\n')
+		outs_csharp.write('\t\t\t\tvar GetStringi = Marshal.GetDelegateForFunctionPointer<PFNGLGETSTRINGIPROC>(GetStringiPtr);\n')
+		outs_csharp.write('\t\t\t\tint NumExtensions = 0;\n')
+		outs_csharp.write(f"\t\t\t\tGetIntegerv({registry.enum(f'{PREFIX_}NUM_EXTENSIONS')['value']} /* {PREFIX_}NUM_EXTENSIONS */, ref NumExtensions);\n")
+		outs_csharp.write('\t\t\t\tfor (int i = 0; i < NumExtensions; i++)\n')
+		outs_csharp.write('\t\t\t\t{\n')
+		outs_csharp.write(f"\t\t\t\t\tvar Name = Marshal.PtrToStringAnsi(GetStringi({registry.enum(f'{PREFIX_}EXTENSIONS')['value']} /* {PREFIX_}EXTENSIONS */, (uint)i));\n")
+		outs_csharp.write('\t\t\t\t\tif (Name != null) Supported.Add(Name);\n')
+		outs_csharp.write('\t\t\t\t}\n')
+		outs_csharp.write('\t\t\t\treturn;\n')
+		outs_csharp.write('\t\t\t}\n')
+		outs_csharp.write('\t\t\t// Before OpenGL 3.0 the extensions come as one space separated string\n')
+		outs_csharp.write(f"\t\t\tvar Names = Marshal.PtrToStringAnsi(GetString({registry.enum(f'{PREFIX_}EXTENSIONS')['value']} /* {PREFIX_}EXTENSIONS */));\n")
+		outs_csharp.write('\t\t\tif (Names == null) return;\n')
+		outs_csharp.write("\t\t\tforeach (var Name in Names.Split(new char[] {' '}, StringSplitOptions.RemoveEmptyEntries)) Supported.Add(Name);\n")
+		outs_csharp.write('\t\t}\n')
+		outs_csharp.write('\t\tpublic bool IsSupported(string Name) => Supported.Contains(Name);\n')
+		for info, curext in ext_infos:
+			ext_name = info['id']
+			class_name = info['class_name']
+			outs_csharp.write(f'\t\tpublic {class_name} Get_{class_name}()\n')
+			outs_csharp.write('\t\t{\n')
+			outs_csharp.write(f'\t\t\tif ({class_name}_Instance == null)\n')
+			outs_csharp.write('\t\t\t{\n')
+			outs_csharp.write(f'\t\t\t\tif (!IsSupported("{ext_name}")) return null;\n')
+			outs_csharp.write(f'\t\t\t\t{class_name}_Instance = new {class_name}(GetProcAddress);\n')
+			outs_csharp.write('\t\t\t}\n')
+			outs_csharp.write(f'\t\t\treturn {class_name}_Instance.{class_name}IsAvailable ? {class_name}_Instance : null;\n')
+			outs_csharp.write('\t\t}\n')
+		outs_csharp.write('\t}\n')
+		outs_csharp.write('\t#endregion // Extensions\n')
+
+	outs_csharp.write('};\n')
+	return {f'{modname}.cs': outs_csharp.getvalue()}, new_fragments
+
+def _gen_rs(versions, registry, fragments = None, extensions = (), options = None):
+	options = options or {}
+	shared = options.get('rs_shared_table', False)
+	nullcheck = options.get('rs_nullcheck', False)
+	state_cache = options.get('state_cache', False)
+	instrument = options.get('instrument', False)
+	call_ids = _instrument_ids(versions) if instrument else {}
+	new_fragments = {}
+	rs_global_struct_name = "GLCore"
+
+	# With `rs_shared_table` the version structs are views into one `GLProcs` table with a slot per unique symbol. A
+	# context only resolves its own family, desktop or ES, and each version only the symbols no earlier one of its
+	# family or the first version resolved
+	shared_procs = {}
+	shared_loads = {}
+	if shared:
+		seen = {}
+		first_funcs = None
+		for info, curver in _version_infos(versions):
+			for funcn in curver['funcproto']:
+				shared_procs.setdefault(funcn[len(prefix):].lower(), funcn)
+			if first_funcs is None:
+				first_funcs = set(curver['funcproto'])
+			family = seen.setdefault(info['OpenGL'], set(first_funcs))
+			shared_loads[info['id']] = [funcn for funcn in curver['funcproto'] if info['is_first_ver'] or funcn not in family]
+			family.update(curver['funcproto'])
+	rs_global_streams = ('predef', 'struct', 'impl', 'trait')
+	OpenGL = 'OpenGL'
+	outs_rs = {
+		'global': {k: io.StringIO() for k in rs_global_streams} | {'members': []}
+	}
+
+	outs_rs['global']['predef'].write('\n')
+	outs_rs['global']['predef'].write('#![allow(dead_code)]\n')
+	outs_rs['global']['predef'].write('#![allow(non_snake_case)]\n')
+	outs_rs['global']['predef'].write('#![allow(non_camel_case_types)]\n')
+	outs_rs['global']['predef'].write('#![allow(non_upper_case_globals)]\n')
+	outs_rs['global']['predef'].write('#![allow(unpredictable_function_pointer_comparisons)]\n')
+	outs_rs['global']['predef'].write('#![allow(clippy::too_many_arguments)]\n')
+	outs_rs['global']['predef'].write('#![allow(clippy::upper_case_acronyms)]\n')
+	outs_rs['global']['predef'].write('#![allow(clippy::missing_transmute_annotations)]\n')
+	outs_rs['global']['predef'].write("use std::{\n")
+	outs_rs['global']['predef'].write("\tmem::transmute,\n")
 	outs_rs['global']['predef'].write("\tffi::{c_void, CStr},\n")
 	outs_rs['global']['predef'].write("\tfmt::{self, Debug, Formatter},\n")
-	outs_rs['global']['predef'].write("\tptr::null,\n")
+	if not nullcheck:
+		outs_rs['global']['predef'].write("\tptr::null,\n")
+	if shared:
+		outs_rs['global']['predef'].write("\tsync::Arc,\n")
 	outs_rs['global']['predef'].write("};\n")
 	outs_rs['global']['predef'].write('\n')
-	outs_rs['global']['predef'].write('#[cfg(feature = "catch_nullptr")]\n')
-	outs_rs['global']['predef'].write("use std::panic::catch_unwind;\n")
+	if not nullcheck:
+		outs_rs['global']['predef'].write('#[cfg(feature = "catch_nullptr")]\n')
+		outs_rs['global']['predef'].write("use std::panic::catch_unwind;\n")
+		outs_rs['global']['predef'].write('\n')
+	if state_cache:
+		outs_rs['global']['predef'].write("use std::cell::Cell;\n")
+	else:
+		outs_rs['global']['predef'].write('#[cfg(feature = "diagnose")]\n')
+		outs_rs['global']['predef'].write("use std::cell::Cell;\n")
+	if instrument:
+		outs_rs['global']['predef'].write('#[cfg(feature = "instrument")]\n')
+		outs_rs['global']['predef'].write("use std::{sync::atomic::{AtomicU64, Ordering}, time::{Duration, Instant}};\n")
 	outs_rs['global']['predef'].write('\n')
 	outs_rs['global']['predef'].write(f'/// The {OpenGL} error type\n')
 	outs_rs['global']['predef'].write('#[derive(Debug, Clone, Copy)]\n')
@@ -499,6 +3043,120 @@ def do_parse(parsefiles, glxml):
 	outs_rs['global']['predef'].write('\t}\n')
 	outs_rs['global']['predef'].write('}\n')
 	outs_rs['global']['predef'].write('\n')
+	outs_rs['global']['predef'].write('/// When the `diagnose` feature checks `glGetError()` after a call. The policy belongs to the calling thread, like the current context\n')
+	outs_rs['global']['predef'].write('#[cfg(feature = "diagnose")]\n')
+	outs_rs['global']['predef'].write('#[derive(Debug, Clone, Copy, PartialEq, Eq)]\n')
+	outs_rs['global']['predef'].write('pub enum ErrorCheck {\n')
+	outs_rs['global']['predef'].write('\t/// After every call, the default\n')
+	outs_rs['global']['predef'].write('\tEveryCall,\n')
+	outs_rs['global']['predef'].write('\t/// After every Nth call, the error is attributed to the function of that call\n')
+	outs_rs['global']['predef'].write('\tEveryNth(u32),\n')
+	outs_rs['global']['predef'].write('\t/// Only at `check_errors()`, at the end of a frame or a scope, the error is attributed to the last function called\n')
+	outs_rs['global']['predef'].write('\tDeferred,\n')
+	outs_rs['global']['predef'].write('\t/// Only after the calls to the listed functions\n')
+	outs_rs['global']['predef'].write("\tListed(&'static [&'static str]),\n")
+	outs_rs['global']['predef'].write('}\n')
+	outs_rs['global']['predef'].write('\n')
+	outs_rs['global']['predef'].write('#[cfg(feature = "diagnose")]\n')
+	outs_rs['global']['predef'].write('thread_local! {\n')
+	outs_rs['global']['predef'].write('\tstatic ERROR_CHECK: Cell<ErrorCheck> = const {Cell::new(ErrorCheck::EveryCall)};\n')
+	outs_rs['global']['predef'].write('\tstatic UNCHECKED_CALLS: Cell<u32> = const {Cell::new(0)};\n')
+	outs_rs['global']['predef'].write('\tstatic LAST_CALL: Cell<&\'static str> = const {Cell::new("")};\n')
+	outs_rs['global']['predef'].write('}\n')
+	outs_rs['global']['predef'].write('\n')
+	outs_rs['global']['predef'].write('/// Set the `ErrorCheck` policy of this thread\n')
+	outs_rs['global']['predef'].write('#[cfg(feature = "diagnose")]\n')
+	outs_rs['global']['predef'].write('pub fn set_error_check(policy: ErrorCheck) {\n')
+	outs_rs['global']['predef'].write('\tERROR_CHECK.set(policy);\n')
+	outs_rs['global']['predef'].write('\tUNCHECKED_CALLS.set(0);\n')
+	outs_rs['global']['predef'].write('}\n')
+	outs_rs['global']['predef'].write('\n')
+	outs_rs['global']['predef'].write('/// Get the `ErrorCheck` policy of this thread\n')
+	outs_rs['global']['predef'].write('#[cfg(feature = "diagnose")]\n')
+	outs_rs['global']['predef'].write('pub fn error_check() -> ErrorCheck {\n')
+	outs_rs['global']['predef'].write('\tERROR_CHECK.get()\n')
+	outs_rs['global']['predef'].write('}\n')
+	outs_rs['global']['predef'].write('\n')
+	outs_rs['global']['predef'].write('/// Whether the call to `funcname` checks `glGetError()` under the policy of this thread\n')
+	outs_rs['global']['predef'].write('#[cfg(feature = "diagnose")]\n')
+	outs_rs['global']['predef'].write('#[inline(always)]\n')
+	outs_rs['global']['predef'].write("fn should_check(funcname: &'static str) -> bool {\n")
+	outs_rs['global']['predef'].write('\tlet check = match ERROR_CHECK.get() {\n')
+	outs_rs['global']['predef'].write('\t\tErrorCheck::EveryCall => true,\n')
+	outs_rs['global']['predef'].write('\t\tErrorCheck::EveryNth(n) => {\n')
+	outs_rs['global']['predef'].write('\t\t\tlet calls = UNCHECKED_CALLS.get() + 1;\n')
+	outs_rs['global']['predef'].write('\t\t\tUNCHECKED_CALLS.set(if calls >= n {0} else {calls});\n')
+	outs_rs['global']['predef'].write('\t\t\tcalls >= n\n')
+	outs_rs['global']['predef'].write('\t\t}\n')
+	outs_rs['global']['predef'].write('\t\tErrorCheck::Deferred => false,\n')
+	outs_rs['global']['predef'].write('\t\tErrorCheck::Listed(funcnames) => funcnames.contains(&funcname),\n')
+	outs_rs['global']['predef'].write('\t};\n')
+	outs_rs['global']['predef'].write('\tif !check {\n')
+	outs_rs['global']['predef'].write('\t\tLAST_CALL.set(funcname);\n')
+	outs_rs['global']['predef'].write('\t}\n')
+	outs_rs['global']['predef'].write('\tcheck\n')
+	outs_rs['global']['predef'].write('}\n')
+	outs_rs['global']['predef'].write('\n')
+	if instrument:
+		outs_rs['global']['predef'].write('/// The calls to one function and the time spent in them, counted by the `instrument` feature\n')
+		outs_rs['global']['predef'].write('#[cfg(feature = "instrument")]\n')
+		outs_rs['global']['predef'].write('#[derive(Debug)]\n')
+		outs_rs['global']['predef'].write('pub struct CallStats {\n')
+		outs_rs['global']['predef'].write("\tpub name: &'static str,\n")
+		outs_rs['global']['predef'].write('\tpub calls: AtomicU64,\n')
+		outs_rs['global']['predef'].write('\tpub nanos: AtomicU64,\n')
+		outs_rs['global']['predef'].write('}\n')
+		outs_rs['global']['predef'].write('\n')
+		outs_rs['global']['predef'].write('#[cfg(feature = "instrument")]\n')
+		outs_rs['global']['predef'].write('impl CallStats {\n')
+		outs_rs['global']['predef'].write("\tconst fn new(name: &'static str) -> Self {\n")
+		outs_rs['global']['predef'].write('\t\tSelf {name, calls: AtomicU64::new(0), nanos: AtomicU64::new(0)}\n')
+		outs_rs['global']['predef'].write('\t}\n')
+		outs_rs['global']['predef'].write('\t#[inline(always)]\n')
+		outs_rs['global']['predef'].write('\tfn add(&self, start: Instant) {\n')
+		outs_rs['global']['predef'].write('\t\tlet nanos = start.elapsed().as_nanos() as u64;\n')
+		outs_rs['global']['predef'].write('\t\tself.calls.fetch_add(1, Ordering::Relaxed);\n')
+		outs_rs['global']['predef'].write('\t\tself.nanos.fetch_add(nanos, Ordering::Relaxed);\n')
+		outs_rs['global']['predef'].write('\t}\n')
+		outs_rs['global']['predef'].write('}\n')
+		outs_rs['global']['predef'].write('\n')
+		outs_rs['global']['predef'].write('/// The `CallStats` of every function, indexed by the function ID\n')
+		outs_rs['global']['predef'].write('#[cfg(feature = "instrument")]\n')
+		outs_rs['global']['predef'].write(f'pub static CALL_STATS: [CallStats; {len(call_ids)}] = [\n')
+		for funcn in call_ids:
+			outs_rs['global']['predef'].write(f'\tCallStats::new("{funcn}"),\n')
+		outs_rs['global']['predef'].write('];\n')
+		outs_rs['global']['predef'].write('\n')
+		outs_rs['global']['predef'].write('/// The functions that were called as `(name, calls, total time)`, the most total time first\n')
+		outs_rs['global']['predef'].write('#[cfg(feature = "instrument")]\n')
+		outs_rs['global']['predef'].write("pub fn call_stats() -> Vec<(&'static str, u64, Duration)> {\n")
+		outs_rs['global']['predef'].write('\tlet mut stats: Vec<_> = CALL_STATS.iter()\n')
+		outs_rs['global']['predef'].write('\t\t.map(|row| (row.name, row.calls.load(Ordering::Relaxed), Duration::from_nanos(row.nanos.load(Ordering::Relaxed))))\n')
+		outs_rs['global']['predef'].write('\t\t.filter(|(_, calls, _)| *calls > 0)\n')
+		outs_rs['global']['predef'].write('\t\t.collect();\n')
+		outs_rs['global']['predef'].write('\tstats.sort_by(|a, b| b.2.cmp(&a.2));\n')
+		outs_rs['global']['predef'].write('\tstats\n')
+		outs_rs['global']['predef'].write('}\n')
+		outs_rs['global']['predef'].write('\n')
+		outs_rs['global']['predef'].write('/// Format `call_stats()` as a table of the calls, the total and the mean time of each function\n')
+		outs_rs['global']['predef'].write('#[cfg(feature = "instrument")]\n')
+		outs_rs['global']['predef'].write('pub fn dump_call_stats() -> String {\n')
+		outs_rs['global']['predef'].write('\tlet mut ret = format!("{:<40} {:>12} {:>14} {:>10}\\n", "function", "calls", "total ms", "ns/call");\n')
+		outs_rs['global']['predef'].write('\tfor (name, calls, total) in call_stats() {\n')
+		outs_rs['global']['predef'].write('\t\tret += &format!("{:<40} {:>12} {:>14.3} {:>10.1}\\n", name, calls, total.as_secs_f64() * 1e3, total.as_nanos() as f64 / calls as f64);\n')
+		outs_rs['global']['predef'].write('\t}\n')
+		outs_rs['global']['predef'].write('\tret\n')
+		outs_rs['global']['predef'].write('}\n')
+		outs_rs['global']['predef'].write('\n')
+		outs_rs['global']['predef'].write('/// Zero the `CallStats` of every function\n')
+		outs_rs['global']['predef'].write('#[cfg(feature = "instrument")]\n')
+		outs_rs['global']['predef'].write('pub fn reset_call_stats() {\n')
+		outs_rs['global']['predef'].write('\tfor row in CALL_STATS.iter() {\n')
+		outs_rs['global']['predef'].write('\t\trow.calls.store(0, Ordering::Relaxed);\n')
+		outs_rs['global']['predef'].write('\t\trow.nanos.store(0, Ordering::Relaxed);\n')
+		outs_rs['global']['predef'].write('\t}\n')
+		outs_rs['global']['predef'].write('}\n')
+		outs_rs['global']['predef'].write('\n')
 	outs_rs['global']['predef'].write('/// Translate the returned `Result<T>` from `std::panic::catch_unwind()` to our `Result<T>`\n')
 	outs_rs['global']['predef'].write('pub fn process_catch<T>(funcname: &\'static str, ret: std::thread::Result<T>) -> Result<T> {\n')
 	outs_rs['global']['predef'].write('\tmatch ret {\n')
@@ -540,7 +3198,7 @@ def do_parse(parsefiles, glxml):
 	outs_rs['global']['predef'].write('pub type khronos_uint64_t = u64;\n')
 	outs_rs['global']['predef'].write('\n')
 	outs_rs['global']['struct'].write(f'/// All of the OpenGL and OpenGL ES functions\n')
-	outs_rs['global']['struct'].write(f'{rust_derive_global}\n')
+	outs_rs['global']['struct'].write(f"{rust_derive_global.replace(' Copy,', '') if shared else rust_derive_global}\n")
 	outs_rs['global']['struct'].write(f'pub struct {rs_global_struct_name} {{\n')
 
 	def rs_type_conv(cpptype):
@@ -686,133 +3344,74 @@ def do_parse(parsefiles, glxml):
 			number = number[:-1] + 'u32'
 		return number
 
-	def _overload_check(membername) -> tuple:
-		preserve = ''
-		dimension = ''
-		typeabbr = ''
-		is_v = False
-		ovlname = ''
-		matched = False
-		for ovlpre in overloadables:
-			if not membername.startswith(ovlpre): continue
-			i = len(ovlpre)
-			preserve = ''
-			for pre in overload_preserve_prefix:
-				if membername[i:i + len(pre)] == pre:
-					preserve = pre
-					i += len(pre)
-					break
-			dimension = ''
-			for dim in mat_dims:
-				if membername[i:i + len(dim)] == dim:
-					dimension = dim
-					i += len(dim)
-					break
-			typeabbr = ''
-			for abr in type_abbrs:
-				if membername[i:i + len(abr)] == abr:
-					typeabbr = abr
-					i += len(abr)
-					break
-			is_v = False
-			if membername[-1] == 'v':
-				is_v = True
-			if membername.endswith('Pointer') and preserve == 'P':
-				preserve = ''
-			matched = bool(dimension or typeabbr)
-			if matched:
-				ovlname = ovlpre
-				break
-		return (matched, ovlname, preserve, dimension, typeabbr, is_v)
-
-	def _style_change(ident):
-		ident = ident.lower()
-		for a in range(ord('a'), ord('z') + 1):
-			a = chr(a)
-			ident = ident.replace(f'_{a}', a.upper())
-		ident = ident.replace('_', '')
-		ident = f'{ident[0].upper()}{ident[1:]}'
-		if ident.startswith('Esv'): ident = f'EsV{ident[len("Esv"):]}'
-		return ident
+	# With `rs_nullcheck` a function pointer is an `Option` that is `None` when it's missing, calling it is a branch
+	# that returns `GLCoreError::NullFunctionPointer` instead of a dummy function that panics
+	def rs_pfn(functype):
+		return f'Option<{functype}>' if nullcheck else functype
 
-	def _on_version(x):
-		nonlocal versions, version_name
-		version_name = x['id']
-		versions[version_name] = {
-			'typealias': {},
-			'define': {},
-			'functype': {},
-			'funcproto': {},
-			'type2proto': {}
-		}
+	def rs_field(member):
+		# `member` is a field of a version struct, or `version.field` from `GLCore`
+		if not shared: return member
+		*path, field = member.split('.')
+		return '.'.join(path + ['procs', field])
 
-	def _on_typealias(x):
-		nonlocal versions
-		target_type = x['target_type']
-		typealias = x['alias']
-		global already_defined
-		if typealias[0] in already_defined: return
-		already_defined |= {typealias[0]}
-		try:
-			versions[version_name]['typealias'][target_type] += typealias
-		except KeyError:
-			versions[version_name]['typealias'][target_type] = typealias
+	def rs_callee(member, funcn):
+		member = rs_field(member)
+		if nullcheck:
+			return f'(self.{member}.ok_or(GLCoreError::NullFunctionPointer("{funcn}"))?)'
+		return f'(self.{member})'
 
-	def _on_define(x):
-		nonlocal versions
-		defn = x['id']
-		defv = x['value']
-		global already_defined
-		if defn in already_defined: return
-		already_defined |= {defn}
-		versions[version_name]['define'][defn] = defv
+	def rs_geterror(member):
+		member = rs_field(member)
+		if nullcheck:
+			return f'self.{member}.map_or(GL_NO_ERROR, |proc| proc())'
+		return f'(self.{member})()'
 
-	def _on_functype(x):
-		nonlocal versions
-		typename = x['typename']
-		global already_defined
-		if typename in already_defined: return
-		already_defined |= {typename}
-		versions[version_name]['functype'][typename] = x
+	def rs_load_proc(funcn, functype):
+		if nullcheck:
+			return f'unsafe{{transmute(get_proc_address("{funcn}"))}}'
+		return f'{{let proc = get_proc_address("{funcn}"); if proc.is_null() {{dummy_{functype.lower()}}} else {{unsafe{{transmute(proc)}}}}}}'
+
+	def rs_catch(outs, funcn, rs_call):
+		if not nullcheck:
+			outs.write(f'\t\t#[cfg(feature = "catch_nullptr")]\n')
+			outs.write(f'\t\tlet ret = process_catch("{funcn}", catch_unwind(||{rs_call}));\n')
+			outs.write(f'\t\t#[cfg(not(feature = "catch_nullptr"))]\n')
+
+	# With `instrument` the `instrument` feature times the call to the function pointer in each wrapper into `CALL_STATS`
+	def rs_timed(outs, funcn, write_call):
+		if instrument:
+			outs.write('\t\t#[cfg(feature = "instrument")]\n')
+			outs.write('\t\tlet call_start = Instant::now();\n')
+		write_call()
+		if instrument:
+			outs.write('\t\t#[cfg(feature = "instrument")]\n')
+			outs.write(f'\t\tCALL_STATS[{call_ids[funcn]}].add(call_start);\n')
 
-	def _on_funcproto(x):
-		nonlocal versions
-		funcname = x['funcname']
-		versions[version_name]['funcproto'][funcname] = x
-		versions[version_name]['type2proto'][f'PFN{funcname.upper()}PROC'] = funcname
+	def rs_timed_return(outs, funcn, rs_call):
+		if instrument:
+			rs_timed(outs, funcn, lambda: outs.write(f'\t\tlet ret = {rs_call};\n'))
+			outs.write('\t\tret\n')
+		else:
+			outs.write(f'\t\t{rs_call}\n')
 
-	def _on_version_end(x):
-		nonlocal OpenGL, version_name, firstver_name, firstver_classname, last_version, parsed, outs_hpp, outs_cpp, outs_csharp, outs_rs, csharp_typeconv, rs_traits
-		curver = versions[version_name]
-		class_name = _style_change(version_name)
-		rs_trait_name = version_name.replace('VERSION', PREFIX)
-		rs_traits += [rs_trait_name]
-		rs_first_trait_name = None
-		if firstver_name:
-			rs_first_trait_name = firstver_name.replace('VERSION', PREFIX)
-		func2load = {} # functions to be loaded
-		overloads = {} # key: 'Xxxxx[1,2,3,4][N,I,P,L][s,f,i,d,ub,us,ui]'; value = (rettype, 'Xxxxx', arglist)
+	def _on_version_end(info, curver):
+		version_name = info['name']
+		class_name = info['class_name']
+		firstver_name = info['firstver_name']
+		OpenGL = info['OpenGL']
+		refver = info['refver']
+		major, minor, release = info['major'], info['minor'], info['release']
+		is_first_ver = info['is_first_ver']
+		is_first_es_ver = info['is_first_es_ver']
+		rs_trait_name = info['id'].replace('VERSION', PREFIX)
+		rs_first_trait_name = firstver_name.replace('VERSION', PREFIX)
 		type2proto = curver['type2proto']
-		proto2type = {v: k for k, v in type2proto.items()}
-		OpenGL = 'OpenGL'
-		refver = 'gl4'
-		if version_name.startswith('ES_'):
-			version_name = f'ES{version_name[len("ES_"):]}'
-			OpenGL = 'OpenGL ES'
-			refver = 'es3'
-		try:
-			major, minor, release = version_name.split('_')[1:]
-		except ValueError:
-			major, minor, release = version_name.split('_')[1:] + ['0']
-		is_first_ver = last_version is None
-		is_first_es_ver = version_name == 'ESVERSION_2_0'
-
-		outs_rs[class_name] = {
-			'predef': io.StringIO(),
-			'struct': io.StringIO(),
-			'impl': io.StringIO(),
-			'trait': io.StringIO(),
+		outs_rs = {
+			'global': {k: io.StringIO() for k in rs_global_streams},
+			class_name: {k: io.StringIO() for k in rs_global_streams},
 		}
+		has_geterror = not is_first_ver and not is_first_es_ver
 
 		global_member = (version_name.lower(), class_name)
 		outs_rs['global']['struct'].write(f'\t/// Functions from {OpenGL} version {major}.{minor}\n')
@@ -821,23 +3420,20 @@ def do_parse(parsefiles, glxml):
 		outs_rs['global']['impl'].write(f'impl {rs_trait_name}_g for {rs_global_struct_name} {{\n')
 		outs_rs['global']['trait'].write(f'\t/// Functions from {OpenGL} version {major}.{minor} for the struct `GLCore` without dupliacted functions.\n')
 		outs_rs['global']['trait'].write(f'pub trait {rs_trait_name}_g {{\n')
-		outs_rs['global']['members'] += [global_member]
 
 		outs_rs[class_name]['struct'].write(f'\n')
 		outs_rs[class_name]['struct'].write(f'/// Functions from {OpenGL} version {major}.{minor}\n')
-		outs_rs[class_name]['struct'].write(f'{rust_derive}\n')
+		outs_rs[class_name]['struct'].write(f"{rust_derive.replace(' Copy,', '') if shared else rust_derive}\n")
 		outs_rs[class_name]['struct'].write(f'pub struct {class_name} {{\n')
 		outs_rs[class_name]['impl'].write(f'impl {rs_trait_name} for {class_name} {{\n')
 		outs_rs[class_name]['trait'].write('\n')
 		outs_rs[class_name]['trait'].write(f'/// Functions from {OpenGL} version {major}.{minor}\n')
 		outs_rs[class_name]['trait'].write(f'pub trait {rs_trait_name} {{\n')
-		if not is_first_ver and version_name != 'ESVERSION_2_0':
+		if not is_first_ver and not is_first_es_ver:
 			outs_rs[class_name]['trait'].write(f"\t/// Reference: <https://registry.khronos.org/OpenGL-Refpages/{refver}/html/glGetError.xhtml>\n")
 			outs_rs[class_name]['trait'].write('\tfn glGetError(&self) -> GLenum;\n')
 
 		for target_type, typealias in curver['typealias'].items():
-			outs_hpp.write(f'\ttypedef {target_type} {", ".join(typealias)};\n')
-
 			for alias in typealias:
 				while alias[0] == '*':
 					alias = alias[1:]
@@ -847,194 +3443,20 @@ def do_parse(parsefiles, glxml):
 				outs_rs[class_name]['predef'].write('\n')
 				outs_rs[class_name]['predef'].write(f'/// Alias to `{rs_target_type}`\n')
 				outs_rs[class_name]['predef'].write(f'pub type {alias} = {rs_target_type};\n')
-			try:
-				target_of_target = csharp_typeconv[target_type]
-			except KeyError:
-				target_of_target = target_type
-			for a in typealias:
-				if a not in csharp_typeconv:
-					csharp_typeconv[a] = target_of_target
-		cst = csharp_typeconv
-
-		csharp_func2load = {}
-		csharp_olfuncs = {}
-		def add_csharp_overload_functions(funcname, rettype, delename, csarglist, unsafe=False):
-			nonlocal csharp_olfuncs
-			funcdata = rettype, delename, csarglist, unsafe
-			if funcname not in csharp_olfuncs:
-				csharp_olfuncs[funcname] = [funcdata]
-			elif funcdata not in csharp_olfuncs[funcname]:
-				csharp_olfuncs[funcname] += [funcdata]
-
-		outs_csharp.write(f'\t#region "{PREFIX_}{version_name}"\n')
-		csharp_funcimp = io.StringIO()
-		csharp_constdef = io.StringIO()
-		csharp_deletype = io.StringIO()
-		csharp_deledef = io.StringIO()
-		csharp_delecb = io.StringIO()
-		csharp_utilities = io.StringIO()
-		csharp_ctor = io.StringIO()
-		csharp_overloads = io.StringIO()
-
-		# Convert to C# arglist
-		def csargs(arglist, with_marshalas_tag=True, always_use_ref=False, always_use_list=False, always_use_intptr=False, keep_pointers=False):
-			if [always_use_ref, always_use_list, always_use_intptr].count(True) > 1:
-				raise ValueError(f'Invalid arguments')
-			csarg = []
-			havecount = False
-			for arg in arglist.split(','):
-				mod = ''
-				cstype = ''
-				haveconst = 'const' in arg
-				arg = arg.replace('const ', ' ').replace('const*', '*').replace('* * ', '** ').replace('  ', ' ').strip()
-				if arglist.strip() == 'void': return ""
-				argtype, argname = arg.rsplit(' ', 1)
-				if argname in csharp_keywords: argname += '_'
-				if '*' in argtype:
-					levels = argtype.count('*')
-					basetype = argtype.split('*', 1)[0]
-					if keep_pointers:
-						cstype = cst[basetype] + '*' * levels
-					elif always_use_intptr:
-						cstype = 'IntPtr'
-					elif levels == 1:
-						if cst[basetype] == 'char':
-							if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPStr)] {mod}'
-							if haveconst:
-								cstype = 'string'
-							else:
-								cstype = 'StringBuilder'
-						elif havecount and not always_use_ref or always_use_list:
-							if cst[basetype] == 'void':
-								cstype = 'IntPtr'
-							else:
-								if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPArray)] {mod}'
-								cstype = f'{cst[basetype]}[]'
-						else:
-							if cst[basetype] == 'void':
-								cstype = 'IntPtr'
-							else:
-								mod = f'ref {mod}'
-								cstype = cst[basetype]
-					elif levels == 2:
-						if cst[basetype] == 'char':
-							if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPArray)] {mod}'
-							cstype = 'string[]'
-						elif havecount and not always_use_ref or always_use_list:
-							if with_marshalas_tag: mod = f'[MarshalAs(UnmanagedType.LPArray)] {mod}'
-							if cst[basetype] == 'void':
-								cstype = 'IntPtr[]'
-							else:
-								cstype = f'{cst[basetype]}[][]'
-						else:
-							mod = f'ref {mod}'
-							if cst[basetype] == 'void':
-								cstype = 'IntPtr'
-							else:
-								cstype = f'{cst[basetype]}[]'
-					else:
-						cstype = 'IntPtr'
-				else:
-					cstype = cst[argtype]
-					if with_marshalas_tag:
-						if cstype == 'bool':
-							cstype = f'[MarshalAs(UnmanagedType.Bool)] {cstype}'
-					if argname in {'count', 'n'}: havecount = True
-					if argname.startswith('num'): havecount = True
-				csarg += [(f'{mod}{cstype}', argname)]
-			return ', '.join([f'{t} {n}' for t, n in csarg])
-		def cscallarg(csarglist):
-			return ", ".join([("ref " if 'ref' in ptype.split(' ') else "") + pname.strip() for ptype, pname in [param.rsplit(" ", 1) for param in csarglist.split(", ")]])
-		# Convert to C# rettype
-		def csret(rettype, keep_pointers=False):
-			try:
-				return cst[rettype]
-			except KeyError:
-				pass
-			if '*' in rettype:
-				if keep_pointers:
-					try:
-						return cst[rettype.split('*', 1)[0]] + '*' * rettype.count('*')
-					except KeyError:
-						pass
-				else:
-					return 'IntPtr';
-			raise ValueError(f"Unknown {rettype}")
 
 		for functype, fpdata in curver['functype'].items():
 			if functype in type2proto: continue
 			rettype = fpdata['ret']
-			calltype = fpdata['calltype']
 			arglist = fpdata['arglist']
-			outs_hpp.write(f'\tusing {functype} = {rettype} ({calltype}) ({arglist});\n')
 			outs_rs['global']['predef'].write('\n')
 			outs_rs['global']['predef'].write(f'/// The prototype to the {OpenGL} callback function `{functype}`\n')
 			outs_rs['global']['predef'].write(f'pub type {functype} = extern "system" fn({rs_arg_fp(arglist)}){rs_ret(rettype, use_result = False)};\n')
-			csharp_delecb.write(f'\t\tpublic delegate {csret(rettype)} {functype} ({csargs(arglist)});\n')
-		outs_hpp.write('\n')
-
-		l_class_name = None
-		if is_first_ver:
-			firstver_name = version_name
-			firstver_classname = class_name
-			outs_hpp.write(f'\tclass {class_name}\n')
-			outs_csharp.write(f'\tclass {class_name}\n')
-			outs_csharp.write('\t{\n')
-			#static_const_aliases = []
-			for funcn, funcproto in curver['funcproto'].items():
-				rettype = funcproto['ret']
-				calltype = funcproto['calltype']
-				arglist = funcproto['arglist']
-				membername = funcn[len(prefix):]
-				#static_const_aliases += [f'\tconst {class_name}::PFN{funcn.upper()}PROC {class_name}::{membername} = {funcn};']
 
-				outs_cpp.write(f'\tGLAPI {rettype} {calltype} {funcn} ({arglist});\n')
-
-				csrettype = csret(rettype)
-				if '*' in arglist:
-					singlename = f'{funcn}_ref'
-					multiname = f'{funcn}_list'
-					safename = f'{funcn}_safe'
-					unmanname = f'{funcn}_unman'
-					unsafename = f'{funcn}_unsafe'
-					safeargs = csargs(arglist)
-					singleargs = csargs(arglist, always_use_ref=True)
-					multiargs = csargs(arglist, always_use_list=True)
-					unmanargs = csargs(arglist, always_use_intptr=True)
-					unsafeargs = csargs(arglist, keep_pointers=True)
-					if singleargs != multiargs:
-						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {singlename} ({singleargs});\n')
-						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {multiname} ({multiargs});\n')
-						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {unmanname} ({unmanargs});\n')
-						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-						csharp_funcimp.write(f'\t\tpublic static extern unsafe {csrettype} {unsafename} ({unsafeargs});\n')
-					else:
-						if safeargs != unmanargs:
-							csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-							csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {unmanname} ({unmanargs});\n')
-						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-						csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {safename} ({safeargs});\n')
-						csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-						csharp_funcimp.write(f'\t\tpublic static extern unsafe {csrettype} {unsafename} ({unsafeargs});\n')
-				else:
-					csarglist = csargs(arglist)
-					csharp_funcimp.write(f'\t\t[DllImport("opengl32.dll", EntryPoint = "{funcn}")]\n')
-					csharp_funcimp.write(f'\t\tpublic static extern {csrettype} {funcn} ({csarglist});\n')
-			#outs_cpp.write('\n'.join(static_const_aliases))
-			outs_cpp.write('\n')
-		else:
-			l_class_name = _style_change(last_version)
-			outs_hpp.write(f'\tclass {class_name} : public {l_class_name}\n')
-			outs_csharp.write(f'\tclass {class_name} : {l_class_name}\n')
-			outs_csharp.write('\t{\n')
 		if not is_first_ver and not is_first_es_ver:
 			outs_rs[class_name]['impl'].write(f"\t/// Reference: <https://registry.khronos.org/OpenGL-Refpages/{refver}/html/glGetError.xhtml>\n")
 			outs_rs[class_name]['impl'].write("\t#[inline(always)]\n")
 			outs_rs[class_name]['impl'].write(f"\tfn glGetError(&self) -> GLenum {{\n")
-			outs_rs[class_name]['impl'].write(f'\t\t(self.geterror)()\n')
+			rs_timed_return(outs_rs[class_name]['impl'], 'glGetError', rs_geterror("geterror"))
 			outs_rs[class_name]['impl'].write('\t}\n')
 		for funcn, funcproto in curver['funcproto'].items():
 			rettype = funcproto['ret']
@@ -1044,14 +3466,16 @@ def do_parse(parsefiles, glxml):
 			functype = f'PFN{funcn.upper()}PROC'
 
 			rs_ret_type = rs_ret(rettype, use_result = False)
-			rs_call_from_class = f'(self.{membername.lower()})({rs_call_arg(arglist)})'
-			rs_call_from_global = f'(self.{version_name.lower()}.{membername.lower()})({rs_call_arg(arglist)})'
+			rs_call_from_class = f'{rs_callee(membername.lower(), funcn)}({rs_call_arg(arglist)})'
+			rs_call_from_global = f'{rs_callee(f"{version_name.lower()}.{membername.lower()}", funcn)}({rs_call_arg(arglist)})'
 			if "*const GLubyte" in rs_ret_type:
 				rs_ret_type = " -> Result<&'static str>"
 				rs_call_from_class = "unsafe{CStr::from_ptr(" + rs_call_from_class + " as *const i8)}.to_str().unwrap()"
 				rs_call_from_global = "unsafe{CStr::from_ptr(" + rs_call_from_global + " as *const i8)}.to_str().unwrap()"
 			elif membername == 'GetError':
 				rs_ret_type = " -> GLenum"
+				rs_call_from_class = rs_geterror(membername.lower())
+				rs_call_from_global = rs_geterror(f'{version_name.lower()}.{membername.lower()}')
 			else:
 				rs_ret_type = rs_ret(rettype, use_result = True)
 			outs_rs[class_name]['trait'].write("\n")
@@ -1060,21 +3484,21 @@ def do_parse(parsefiles, glxml):
 			if membername == 'GetError':
 				outs_rs[class_name]['impl'].write("\t#[inline(always)]\n")
 				outs_rs[class_name]['impl'].write(f"\tfn {funcn}({rs_arg(arglist)}){rs_ret_type} {{\n")
-				outs_rs[class_name]['impl'].write(f'\t\t{rs_call_from_class}\n')
+				rs_timed_return(outs_rs[class_name]['impl'], funcn, rs_call_from_class)
 				outs_rs[class_name]['impl'].write('\t}\n')
 			else:
 				outs_rs[class_name]['impl'].write("\t#[inline(always)]\n")
 				outs_rs[class_name]['impl'].write(f"\tfn {funcn}({rs_arg(arglist)}){rs_ret_type} {{\n")
-				outs_rs[class_name]['impl'].write(f'\t\t#[cfg(feature = "catch_nullptr")]\n')
-				outs_rs[class_name]['impl'].write(f'\t\tlet ret = process_catch("{funcn}", catch_unwind(||{rs_call_from_class}));\n')
-				outs_rs[class_name]['impl'].write(f'\t\t#[cfg(not(feature = "catch_nullptr"))]\n')
-				if rs_ret_type == ' -> Result<()>':
-					outs_rs[class_name]['impl'].write(f'\t\tlet ret = {{{rs_call_from_class}; Ok(())}};\n')
-				else:
-					outs_rs[class_name]['impl'].write(f'\t\tlet ret = Ok({rs_call_from_class});\n')
+				def write_call():
+					rs_catch(outs_rs[class_name]['impl'], funcn, rs_call_from_class)
+					if rs_ret_type == ' -> Result<()>':
+						outs_rs[class_name]['impl'].write(f'\t\tlet ret = {{{rs_call_from_class}; Ok(())}};\n')
+					else:
+						outs_rs[class_name]['impl'].write(f'\t\tlet ret = Ok({rs_call_from_class});\n')
+				rs_timed(outs_rs[class_name]['impl'], funcn, write_call)
 				outs_rs[class_name]['impl'].write(f'\t\t#[cfg(feature = "diagnose")]\n')
 				outs_rs[class_name]['impl'].write(f'\t\tif let Ok(ret) = ret {{\n')
-				outs_rs[class_name]['impl'].write(f'\t\t\treturn to_result("{funcn}", ret, self.glGetError());\n')
+				outs_rs[class_name]['impl'].write(f'\t\t\treturn if should_check("{funcn}") {{to_result("{funcn}", ret, self.glGetError())}} else {{Ok(ret)}};\n')
 				outs_rs[class_name]['impl'].write('\t\t} else {\n')
 				outs_rs[class_name]['impl'].write('\t\t\treturn ret\n')
 				outs_rs[class_name]['impl'].write('\t\t}\n')
@@ -1129,6 +3553,9 @@ def do_parse(parsefiles, glxml):
 		outs_rs[class_name]['impl'].write(f"impl {class_name} {{\n")
 		if is_first_ver:
 			outs_rs[class_name]['impl'].write("\tpub fn new(mut get_proc_address: impl FnMut(&'static str) -> *const c_void) -> Result<Self> {\n")
+			if shared:
+				outs_rs[class_name]['impl'].write("\t\tlet mut procs = GLProcs::default();\n")
+				outs_rs[class_name]['impl'].write(f"\t\tprocs.load_{version_name.lower()}(&mut get_proc_address);\n")
 			outs_rs[class_name]['impl'].write("\t\tlet mut ret = Self {\n")
 			outs_rs[class_name]['impl'].write("\t\t\tavailable: true,\n")
 			outs_rs[class_name]['impl'].write('\t\t\tspec: "unknown",\n')
@@ -1154,8 +3581,13 @@ def do_parse(parsefiles, glxml):
 			outs_rs['global']['trait'].write("\tfn get_renderer(&self) -> &'static str;\n")
 			outs_rs['global']['trait'].write(f"\t/// Get the {OpenGL} version string\n")
 			outs_rs['global']['trait'].write("\tfn get_versionstr(&self) -> &'static str;\n")
+		elif shared:
+			outs_rs[class_name]['impl'].write(f"\tpub fn new(base: &{info['firstver_classname']}) -> Self {{\n")
+			outs_rs[class_name]['impl'].write("\t\tlet (spec, major, minor, release) = base.get_version();\n")
+			outs_rs[class_name]['impl'].write(f"\t\tlet available = spec.starts_with(\"OpenGL ES\") == {'true' if OpenGL == 'OpenGL ES' else 'false'} && (major, minor, release) >= ({major}, {minor}, {release});\n")
+			outs_rs[class_name]['impl'].write("\t\tSelf {\n")
+			outs_rs[class_name]['impl'].write("\t\t\tavailable,\n")
 		else:
-			l_class_name = _style_change(last_version)
 			outs_rs[class_name]['impl'].write(f"\tpub fn new(base: impl {rs_first_trait_name}, mut get_proc_address: impl FnMut(&'static str) -> *const c_void) -> Self {{\n")
 			outs_rs[class_name]['impl'].write("\t\tlet (_spec, major, minor, release) = base.get_version();\n")
 			outs_rs[class_name]['impl'].write(f"\t\tif (major, minor, release) < ({major}, {minor}, {release}) {{\n")
@@ -1163,135 +3595,71 @@ def do_parse(parsefiles, glxml):
 			outs_rs[class_name]['impl'].write("\t\t}\n")
 			outs_rs[class_name]['impl'].write("\t\tSelf {\n")
 			outs_rs[class_name]['impl'].write("\t\t\tavailable: true,\n")
-		if not is_first_ver and not is_first_es_ver:
-			outs_rs[class_name]['impl'].write('\t\t\tgeterror: {let proc = get_proc_address("glGetError"); if proc.is_null() {dummy_pfnglgeterrorproc} else {unsafe{transmute(proc)}}},\n')
-		for funcn, funcproto in curver['funcproto'].items():
-			membername = funcn[len(prefix):]
-			functype = f'PFN{funcn.upper()}PROC'
-			outs_rs[class_name]['impl'].write(f'\t\t\t{membername.lower()}: {{let proc = get_proc_address("{funcn}"); if proc.is_null() {{dummy_{functype.lower()}}} else {{unsafe{{transmute(proc)}}}}}},\n')
-		if is_first_ver:
-			outs_rs[class_name]['impl'].write('\t\t};\n')
-			outs_rs[class_name]['impl'].write('\t\tret.fetch_version()?;\n')
-			outs_rs[class_name]['impl'].write('\t\tOk(ret)\n')
+		if shared:
+			if is_first_ver:
+				outs_rs[class_name]['impl'].write('\t\t\tprocs: Arc::new(procs),\n')
+				outs_rs[class_name]['impl'].write('\t\t};\n')
+				outs_rs[class_name]['impl'].write('\t\tret.fetch_version()?;\n')
+				outs_rs[class_name]['impl'].write('\t\tlet version = (ret.major_version, ret.minor_version, ret.release_version);\n')
+				outs_rs[class_name]['impl'].write('\t\tif let Some(procs) = Arc::get_mut(&mut ret.procs) {\n')
+				outs_rs[class_name]['impl'].write('\t\t\tprocs.load_context(ret.spec.starts_with("OpenGL ES"), version, &mut get_proc_address);\n')
+				outs_rs[class_name]['impl'].write('\t\t}\n')
+				outs_rs[class_name]['impl'].write('\t\tOk(ret)\n')
+			else:
+				outs_rs[class_name]['impl'].write('\t\t\tprocs: base.procs.clone(),\n')
+				if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+					outs_rs[class_name]['impl'].write('\t\t\tshading_language_version: if available {base.glGetString(GL_SHADING_LANGUAGE_VERSION).unwrap()} else {"unknown"},\n')
+				outs_rs[class_name]['impl'].write('\t\t}\n')
+			outs_rs[class_name]['impl'].write('\t}\n')
+			outs_rs[class_name]['impl'].write('}\n')
+			outs_rs[class_name]['impl'].write('\n')
+			outs_rs[class_name]['impl'].write('impl GLProcs {\n')
+			outs_rs[class_name]['impl'].write(f"\tfn load_{version_name.lower()}(&mut self, get_proc_address: &mut impl FnMut(&'static str) -> *const c_void) {{\n")
+			for funcn in shared_loads[info['id']]:
+				outs_rs[class_name]['impl'].write(f"\t\tself.{funcn[len(prefix):].lower()} = {rs_load_proc(funcn, f'PFN{funcn.upper()}PROC')};\n")
 		else:
-			if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
-				outs_rs[class_name]['impl'].write('\t\t\tshading_language_version: base.glGetString(GL_SHADING_LANGUAGE_VERSION).unwrap(),\n')
-			outs_rs[class_name]['impl'].write('\t\t}\n')
+			if has_geterror:
+				outs_rs[class_name]['impl'].write(f'\t\t\tgeterror: {rs_load_proc("glGetError", "PFNGLGETERRORPROC")},\n')
+			for funcn, funcproto in curver['funcproto'].items():
+				membername = funcn[len(prefix):]
+				functype = f'PFN{funcn.upper()}PROC'
+				outs_rs[class_name]['impl'].write(f'\t\t\t{membername.lower()}: {rs_load_proc(funcn, functype)},\n')
+			if is_first_ver:
+				outs_rs[class_name]['impl'].write('\t\t};\n')
+				outs_rs[class_name]['impl'].write('\t\tret.fetch_version()?;\n')
+				outs_rs[class_name]['impl'].write('\t\tOk(ret)\n')
+			else:
+				if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+					outs_rs[class_name]['impl'].write('\t\t\tshading_language_version: base.glGetString(GL_SHADING_LANGUAGE_VERSION).unwrap(),\n')
+				outs_rs[class_name]['impl'].write('\t\t}\n')
 		outs_rs[class_name]['impl'].write('\t}\n')
+		if shared:
+			outs_rs[class_name]['impl'].write('}\n')
+			outs_rs[class_name]['impl'].write('\n')
+			outs_rs[class_name]['impl'].write(f'impl {class_name} {{\n')
 
-		outs_hpp.write('\t{\n')
-		if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
-			outs_hpp.write('\tpublic:\n')
-			outs_hpp.write('\t\tinline std::string GetShadingLanguageVersion() { return ShadingLanguageVersion; }\n')
-		outs_hpp.write('\tprotected:\n')
 		for functype, fpdata in curver['functype'].items():
 			if functype not in type2proto: continue
 			rettype = fpdata['ret']
-			calltype = fpdata['calltype']
 			arglist = fpdata['arglist']
 			pproto = type2proto[functype]
 			proto = pproto[len(prefix):]
 			membername = proto
 			funcn = pproto
-			outs_hpp.write(f'\t\tusing {functype} = {rettype} ({calltype}) ({arglist});\n')
-			outs_cpp.write(f'\tstatic {rettype} {calltype[:-1]} Null_{pproto} ({arglist})')
-			if rettype == 'void':
-				outs_cpp.write('{ NullFuncPtr(); }\n')
-			else:
-				outs_cpp.write('{ NullFuncPtr(); return 0; }\n')
 			outs_rs[class_name]['predef'].write('\n')
 			outs_rs[class_name]['predef'].write(f'/// The prototype to the OpenGL function `{proto}`\n')
 			outs_rs[class_name]['predef'].write(f'type {functype} = extern "system" fn({rs_arg_fp(arglist)}){rs_ret(rettype, use_result = False)};\n')
-			args = [arg.strip() for arg in arglist.split(',')]
-			#if proto.startswith('Gen') and proto.endswith('s') and len(args) == 2 and args[0].endswith((' n', ' count')) and args[1].count('*') == 1 and 'const' not in args[1] and rettype == 'void':
-			if '*' in arglist:
-				csrettype = csret(rettype)
-				singlename = f'{proto}_ref'
-				singletype = f'PFN{PREFIX}{singlename.upper()}PROC'
-				multiname = f'{proto}_list'
-				multitype = f'PFN{PREFIX}{multiname.upper()}PROC'
-				unmanname = f'{proto}_unman'
-				unmantype = f'PFN{PREFIX}{unmanname.upper()}PROC'
-				unsafename = f'{proto}_unsafe'
-				unsafetype = f'PFN{PREFIX}{unsafename.upper()}PROC'
-				csarg_ref = csargs(arglist, always_use_ref=True)
-				csarg_list = csargs(arglist, always_use_list=True)
-				csarg_unman = csargs(arglist, always_use_intptr=True)
-				csarg_unsafe = csargs(arglist, keep_pointers=True)
-				if csarg_ref != csarg_list:
-					csarg_o_ref = csargs(arglist, always_use_ref=True, with_marshalas_tag=False)
-					csarg_o_list = csargs(arglist, always_use_list=True, with_marshalas_tag=False)
-					csarg_o_unman = csargs(arglist, always_use_intptr=True, with_marshalas_tag=False)
-					csarg_o_unsafe = csargs(arglist, keep_pointers=True, with_marshalas_tag=False)
-					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {singletype} ({csarg_ref});\n')
-					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {multitype} ({csarg_list});\n')
-					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {unmantype} ({csarg_unman});\n')
-					csharp_deletype.write(f'\t\tpublic unsafe delegate {csrettype} {unsafetype} ({csarg_unsafe});\n')
-					csharp_deledef.write(f'\t\tpublic readonly {singletype} {singlename};\n')
-					csharp_deledef.write(f'\t\tpublic readonly {multitype} {multiname};\n')
-					csharp_deledef.write(f'\t\tpublic readonly {unmantype} {unmanname};\n')
-					csharp_deledef.write(f'\t\tpublic readonly {unsafetype} {unsafename};\n')
-					add_csharp_overload_functions(proto, rettype, singlename, csarg_o_ref)
-					add_csharp_overload_functions(proto, rettype, multiname, csarg_o_list)
-					add_csharp_overload_functions(proto, rettype, unmanname, csarg_o_unman)
-					add_csharp_overload_functions(proto, rettype, unsafename, csarg_o_unsafe, unsafe=True)
-					if not is_first_ver:
-						csharp_func2load[singlename] = singletype, pproto
-						csharp_func2load[multiname] = multitype, pproto
-						csharp_func2load[unmanname] = unmantype, pproto
-						csharp_func2load[unsafename] = unsafetype, pproto
-					else:
-						csharp_func2load[singlename] = singletype, f'{pproto}_ref'
-						csharp_func2load[multiname] = multitype, f'{pproto}_list'
-						csharp_func2load[unmanname] = unmantype, f'{pproto}_unman'
-						csharp_func2load[unsafename] = unsafetype, f'{pproto}_unsafe'
-				else:
-					csrettype = csret(rettype, keep_pointers=True)
-					safename = f'{proto}_safe'
-					safetype = f'PFN{PREFIX}{safename.upper()}PROC'
-					unmanname = f'{proto}_unman'
-					unmantype = f'PFN{PREFIX}{unmanname.upper()}PROC'
-					unsafename = f'{proto}_unsafe'
-					unsafetype = f'PFN{PREFIX}{unsafename.upper()}PROC'
-					csarg_safe = csargs(arglist)
-					csarg_unman = csargs(arglist, always_use_intptr=True)
-					csarg_unsafe = csargs(arglist, keep_pointers=True)
-					csarg_o_safe = csargs(arglist, with_marshalas_tag=False)
-					csarg_o_unman = csargs(arglist, always_use_intptr=True, with_marshalas_tag=False)
-					csarg_o_unsafe = csargs(arglist, keep_pointers=True, with_marshalas_tag=False)
-					if csarg_safe != csarg_unman:
-						csharp_deletype.write(f'\t\tpublic delegate {csrettype} {unmantype} ({csarg_unman});\n')
-						csharp_deledef.write(f'\t\tpublic readonly {unmantype} {unmanname};\n')
-						add_csharp_overload_functions(proto, rettype, unmanname, csarg_o_unman)
-					csharp_deletype.write(f'\t\tpublic delegate {csrettype} {safetype} ({csarg_safe});\n')
-					csharp_deletype.write(f'\t\tpublic unsafe delegate {csrettype} {unsafetype} ({csarg_unsafe});\n')
-					csharp_deledef.write(f'\t\tpublic readonly {safetype} {safename};\n')
-					csharp_deledef.write(f'\t\tpublic readonly {unsafetype} {unsafename};\n')
-					add_csharp_overload_functions(proto, rettype, safename, csarg_o_safe)
-					add_csharp_overload_functions(proto, rettype, unsafename, csarg_o_unsafe, unsafe=True)
-					if not is_first_ver:
-						if csarg_safe != csarg_unman:
-							csharp_func2load[unmanname] = unmantype, pproto
-						csharp_func2load[safename] = safetype, pproto
-						csharp_func2load[unsafename] = unsafetype, pproto
-					else:
-						if csarg_safe != csarg_unman:
-							csharp_func2load[unmanname] = unmantype, f'{pproto}_unman'
-						csharp_func2load[safename] = safetype, f'{pproto}_safe'
-						csharp_func2load[unsafename] = unsafetype, f'{pproto}_unsafe'
-			else:
-				csharp_deletype.write(f'\t\tpublic delegate {csret(rettype)} {functype} ({csargs(arglist)});\n')
-				csharp_deledef.write(f'\t\tpublic readonly {functype} {proto};\n')
-				csharp_func2load[proto] = functype, pproto
 			rs_ret_type = rs_ret(rettype, use_result = False)
-			rs_call_from_class = f'(self.{membername.lower()})({rs_call_arg(arglist)})'
-			rs_call_from_global = f'(self.{version_name.lower()}.{membername.lower()})({rs_call_arg(arglist)})'
+			rs_call_from_class = f'{rs_callee(membername.lower(), funcn)}({rs_call_arg(arglist)})'
+			rs_call_from_global = f'{rs_callee(f"{version_name.lower()}.{membername.lower()}", funcn)}({rs_call_arg(arglist)})'
 			if "*const GLubyte" in rs_ret_type:
 				rs_ret_type = " -> Result<&'static str>"
 				rs_call_from_class = "unsafe{CStr::from_ptr(" + rs_call_from_class + " as *const i8)}.to_str().unwrap()"
 				rs_call_from_global = "unsafe{CStr::from_ptr(" + rs_call_from_global + " as *const i8)}.to_str().unwrap()"
 			elif membername == 'GetError':
 				rs_ret_type = " -> GLenum"
+				rs_call_from_class = rs_geterror(membername.lower())
+				rs_call_from_global = rs_geterror(f'{version_name.lower()}.{membername.lower()}')
 			else:
 				rs_ret_type = rs_ret(rettype, use_result = True)
 			outs_rs['global']['trait'].write("\n")
@@ -1300,21 +3668,21 @@ def do_parse(parsefiles, glxml):
 			if funcn == 'glGetError':
 				outs_rs['global']['impl'].write("\t#[inline(always)]\n")
 				outs_rs['global']['impl'].write(f"\tfn {funcn}({rs_arg(arglist)}){rs_ret_type} {{\n")
-				outs_rs['global']['impl'].write(f'\t\t{rs_call_from_global}\n')
+				rs_timed_return(outs_rs['global']['impl'], funcn, rs_call_from_global)
 				outs_rs['global']['impl'].write('\t}\n')
 			else:
 				outs_rs['global']['impl'].write("\t#[inline(always)]\n")
 				outs_rs['global']['impl'].write(f"\tfn {funcn}({rs_arg(arglist)}){rs_ret_type} {{\n")
-				outs_rs['global']['impl'].write(f'\t\t#[cfg(feature = "catch_nullptr")]\n')
-				outs_rs['global']['impl'].write(f'\t\tlet ret = process_catch("{funcn}", catch_unwind(||{rs_call_from_global}));\n')
-				outs_rs['global']['impl'].write(f'\t\t#[cfg(not(feature = "catch_nullptr"))]\n')
-				if rs_ret_type == ' -> Result<()>':
-					outs_rs['global']['impl'].write(f'\t\tlet ret = {{{rs_call_from_global}; Ok(())}};\n')
-				else:
-					outs_rs['global']['impl'].write(f'\t\tlet ret = Ok({rs_call_from_global});\n')
+				def write_call():
+					rs_catch(outs_rs['global']['impl'], funcn, rs_call_from_global)
+					if rs_ret_type == ' -> Result<()>':
+						outs_rs['global']['impl'].write(f'\t\tlet ret = {{{rs_call_from_global}; Ok(())}};\n')
+					else:
+						outs_rs['global']['impl'].write(f'\t\tlet ret = Ok({rs_call_from_global});\n')
+				rs_timed(outs_rs['global']['impl'], funcn, write_call)
 				outs_rs['global']['impl'].write(f'\t\t#[cfg(feature = "diagnose")]\n')
 				outs_rs['global']['impl'].write(f'\t\tif let Ok(ret) = ret {{\n')
-				outs_rs['global']['impl'].write(f'\t\t\treturn to_result("{funcn}", ret, (self.{version_name.lower()}.geterror)());\n')
+				outs_rs['global']['impl'].write(f'\t\t\treturn if should_check("{funcn}") {{to_result("{funcn}", ret, {rs_geterror(f"{version_name.lower()}.geterror")})}} else {{Ok(ret)}};\n')
 				outs_rs['global']['impl'].write('\t\t} else {\n')
 				outs_rs['global']['impl'].write('\t\t\treturn ret\n')
 				outs_rs['global']['impl'].write('\t\t}\n')
@@ -1324,26 +3692,6 @@ def do_parse(parsefiles, glxml):
 		outs_rs['global']['trait'].write('}\n\n')
 		outs_rs['global']['impl'].write('}\n\n')
 		if is_first_ver:
-			outs_hpp.write('\t\tFunc_GetProcAddress GetProcAddress;\n')
-			outs_hpp.write('\t\tint Ver_Major;\n')
-			outs_hpp.write('\t\tint Ver_Minor;\n')
-			outs_hpp.write('\t\tint Ver_Release;\n')
-			outs_hpp.write('\t\tstd::string Vendor;\n')
-			outs_hpp.write('\t\tstd::string Renderer;\n')
-			outs_hpp.write('\t\tstd::string Version;\n')
-			csharp_utilities.write('\t\tpublic readonly Delegate_GetProcAddress GetProcAddress;\n')
-			csharp_utilities.write('\t\tpublic readonly int Ver_Major;\n')
-			csharp_utilities.write('\t\tpublic readonly int Ver_Minor;\n')
-			csharp_utilities.write('\t\tpublic readonly int Ver_Release;\n')
-			csharp_utilities.write('\t\tpublic readonly string Vendor;\n')
-			csharp_utilities.write('\t\tpublic readonly string Renderer;\n')
-			csharp_utilities.write('\t\tpublic readonly string Version;\n')
-			csharp_utilities.write('\t\tpublic TDelegate GetOpenGLFunctionDelegate<TDelegate> (string ProcName)\n')
-			csharp_utilities.write('\t\t{\n')
-			csharp_utilities.write('\t\t\tvar FuncPtr = GetProcAddress(ProcName);\n')
-			csharp_utilities.write('\t\t\tif (FuncPtr == IntPtr.Zero) throw new NullOpenGLFunctionPointerException(String.Format("Could not get OpenGL function `{0}`.", ProcName));\n')
-			csharp_utilities.write('\t\t\treturn Marshal.GetDelegateForFunctionPointer<TDelegate>(FuncPtr);\n')
-			csharp_utilities.write('\t\t}\n')
 			outs_rs[class_name]['struct'].write("\tspec: &'static str,\n")
 			outs_rs[class_name]['struct'].write('\tmajor_version: u32,\n')
 			outs_rs[class_name]['struct'].write('\tminor_version: u32,\n')
@@ -1373,17 +3721,16 @@ def do_parse(parsefiles, glxml):
 			outs_rs[class_name]['impl'].write('\t\tself.release_version = v[2].parse().unwrap();\n')
 			outs_rs[class_name]['impl'].write('\t\tOk(())\n')
 			outs_rs[class_name]['impl'].write('\t}\n')
-		elif 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
-			outs_hpp.write('\t\tstd::string ShadingLanguageVersion;\n')
-			outs_rs[class_name]['struct'].write(f'\t/// The version of the {OpenGL} shading language\n')
-			outs_rs[class_name]['struct'].write("\tshading_language_version: &'static str,\n")
-			outs_rs[class_name]['struct'].write('\n')
-			csharp_utilities.write('\t\tpublic readonly string ShadingLanguageVersion;\n')
-		outs_hpp.write('\n')
-		outs_hpp.write('\tprivate:\n')
-		outs_hpp.write('\t\tbool Available;\n')
-		outs_hpp.write('\n')
-		outs_hpp.write('\tpublic:\n')
+			outs_rs[class_name]['impl'].write('\t/// Check `glGetError()` now, like at the end of a frame or a scope with `ErrorCheck::Deferred`. The error is attributed to the last function called without a check\n')
+			outs_rs[class_name]['impl'].write('\t#[cfg(feature = "diagnose")]\n')
+			outs_rs[class_name]['impl'].write('\tpub fn check_errors(&self) -> Result<()> {\n')
+			outs_rs[class_name]['impl'].write('\t\tUNCHECKED_CALLS.set(0);\n')
+			outs_rs[class_name]['impl'].write('\t\tto_result(LAST_CALL.replace(""), (), self.glGetError())\n')
+			outs_rs[class_name]['impl'].write('\t}\n')
+		elif 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
+			outs_rs[class_name]['struct'].write(f'\t/// The version of the {OpenGL} shading language\n')
+			outs_rs[class_name]['struct'].write("\tshading_language_version: &'static str,\n")
+			outs_rs[class_name]['struct'].write('\n')
 		outs_rs[class_name]['struct'].write(f'\t/// Is {OpenGL} version {major}.{minor} available\n')
 		outs_rs[class_name]['struct'].write("\tavailable: bool,\n")
 		outs_rs[class_name]['struct'].write('\n')
@@ -1391,42 +3738,16 @@ def do_parse(parsefiles, glxml):
 		outs_rs[class_name]['impl'].write("\tpub fn get_available(&self) -> bool {\n")
 		outs_rs[class_name]['impl'].write(f'\t\tself.available\n')
 		outs_rs[class_name]['impl'].write('\t}\n')
-		if is_first_ver:
-			outs_hpp.write('\t\ttemplate<typename FuncType>\n')
-			outs_hpp.write('\t\tFuncType GetProc(const char* symbol, FuncType DefaultBehaviorFunc)\n')
-			outs_hpp.write('\t\t{\n')
-			outs_hpp.write('\t\t\tvoid *ProcAddress = GetProcAddress(symbol);\n');
-			outs_hpp.write('\t\t\tif (!ProcAddress)\n')
-			outs_hpp.write('\t\t\t{\n')
-			outs_hpp.write('\t\t\t\treturn DefaultBehaviorFunc;\n')
-			outs_hpp.write('\t\t\t}\n')
-			outs_hpp.write(f'\t\t\treturn {cppfunc_cast}<FuncType>(ProcAddress);\n')
-			outs_hpp.write('\t\t}\n')
-			outs_hpp.write('\t\tinline void GetVersion(int& Major, int& Minor, int& Release)\n')
-			outs_hpp.write('\t\t{\n')
-			outs_hpp.write('\t\t\tMajor = Ver_Major;\n')
-			outs_hpp.write('\t\t\tMinor = Ver_Minor;\n')
-			outs_hpp.write('\t\t\tRelease = Ver_Release;\n')
-			outs_hpp.write('\t\t}\n')
-			outs_hpp.write('\t\tinline std::string GetVendor() { return Vendor; }\n')
-			outs_hpp.write('\t\tinline std::string GetRenderer() { return Renderer; }\n')
-			outs_hpp.write('\t\tinline std::string GetVersion() { return Version; }\n')
-		elif not is_first_es_ver:
+		if shared:
+			outs_rs[class_name]['struct'].write('\t/// The function pointers, shared with the other versions of the context\n')
+			outs_rs[class_name]['struct'].write('\tpub procs: Arc<GLProcs>,\n')
+		elif has_geterror:
 			outs_rs[class_name]['struct'].write('\t/// The function pointer to `glGetError()`\n')
 			outs_rs[class_name]['struct'].write(f"\t/// * Reference: <https://registry.khronos.org/OpenGL-Refpages/{refver}/html/glGetError.xhtml>\n")
-			outs_rs[class_name]['struct'].write("\tpub geterror: PFNGLGETERRORPROC,\n")
-
-		csharp_utilities.write('\t\tprivate readonly bool Available;\n')
-
-		outs_hpp.write(f'\t\t{class_name}() = delete;\n')
-		outs_hpp.write(f'\t\t{class_name}(Func_GetProcAddress GetProcAddress);\n')
-
-		outs_hpp.write(f'\t\tinline bool {class_name}IsAvailable() {{ return Available; }}\n')
-		outs_hpp.write('\n')
-		csharp_utilities.write(f'\t\tpublic bool {class_name}IsAvailable {{get => Available;}}\n')
+			outs_rs[class_name]['struct'].write(f"\tpub geterror: {rs_pfn('PFNGLGETERRORPROC')},\n")
 
 		for functype, fpdata in curver['functype'].items():
-			if functype not in type2proto: continue
+			if functype not in type2proto or nullcheck: continue
 			rettype = fpdata['ret']
 			calltype = fpdata['calltype']
 			arglist = fpdata['arglist']
@@ -1439,179 +3760,21 @@ def do_parse(parsefiles, glxml):
 			outs_rs[class_name]['predef'].write('}\n')
 
 		for defn, defv in curver['define'].items():
-			if defv.startswith('0x'):
-				if defv.endswith('ull'):
-					deft = 'GLuint64'
-				elif defv.endswith('ll'):
-					deft = 'GLint64'
-				elif defv.endswith(('u', 'ul')):
-					deft = 'GLuint'
-				else:
-					deft = enumtype[f'{PREFIX_}{defn}']
-			else:
-				deft = enumtype[f'{PREFIX_}{defn}']
-			outs_hpp.write(f'\t\tstatic constexpr {deft} {defn} = {defv};\n')
+			deft = _define_type(defn, defv, registry)
 			outs_rs[class_name]['predef'].write(f'/// Constant value defined from {OpenGL} {major}.{minor}\n')
 			outs_rs[class_name]['predef'].write(f"pub const GL_{defn}: {deft} = {rs_const_value(defv)};\n")
 			outs_rs[class_name]['predef'].write('\n')
-			if deft == 'GLuint64':
-				csdefv = defv.replace('ull', 'ul')
-			elif deft == 'GLint64':
-				csdefv = defv.replace('ll', 'l')
-			else:
-				csdefv = defv.replace('ul', 'u')
-			csharp_constdef.write(f'\t\tpublic readonly {cst[deft]} {defn} = {csdefv};\n')
-		outs_hpp.write('\n')
 
-		for funcn, funcproto in curver['funcproto'].items():
-			rettype = funcproto['ret']
-			calltype = funcproto['calltype']
-			arglist = funcproto['arglist']
+		for funcn in curver['funcproto']:
+			if shared: break
 			functype = f'PFN{funcn.upper()}PROC'
 			membername = funcn[len(prefix):]
-			outs_hpp.write(f'\t\t{functype} {membername};\n')
 			outs_rs[class_name]['struct'].write('\n')
 			outs_rs[class_name]['struct'].write(f'\t/// The function pointer to `{funcn}()`\n')
 			outs_rs[class_name]['struct'].write(f"\t/// * Reference: <https://registry.khronos.org/OpenGL-Refpages/{refver}/html/{funcn}.xhtml>\n")
-			outs_rs[class_name]['struct'].write(f"\tpub {membername.lower()}: {functype},\n")
-
-			func2load[membername] = funcn
-
-			# Check overloadable functions
-			matched, ovlname, preserve, dimension, typeabbr, is_v = _overload_check(membername)
-			if matched:
-				if is_v:
-					ovlname = f'{ovlname}{preserve}{dimension}{typeabbr}v'
-				else:
-					ovlname = f'{ovlname}{preserve}{typeabbr}'
-				if preserve != 'P' and dimension != '':
-					if not is_v:
-						overloads[membername] = (functype, rettype, ovlname, arglist)
-					if '*' not in arglist:
-						add_csharp_overload_functions(ovlname, rettype, membername, csargs(arglist, with_marshalas_tag=False))
-		outs_hpp.write('\n')
-
-		for membername, ovld in overloads.items():
-			functype, rettype, ovlpre, arglist = ovld
-			outs_hpp.write(f'\t\tinline {rettype} {ovlpre}({arglist}) const {{ ')
-			if rettype != 'void': outs_hpp.write('return ')
-			outs_hpp.write(f'{membername}({", ".join([pname.strip() for ptype, pname in [param.rsplit(" ", 1) for param in arglist.split(", ")]])});}}\n')
-
-		for proto, funcinfos in csharp_olfuncs.items():
-			for funcinfo in funcinfos:
-				rettype, membername, csarglist, unsafe = funcinfo
-				csharp_overloads.write(f'\t\tpublic {"unsafe " if unsafe else ""}{csret(rettype)} {proto}({csarglist}) {{ ')
-				if rettype != 'void': csharp_overloads.write('return ')
-				csharp_overloads.write(f'{membername}({cscallarg(csarglist)}); }}\n')
-
-		outs_hpp.write('\t};\n')
+			outs_rs[class_name]['struct'].write(f"\tpub {membername.lower()}: {rs_pfn(functype)},\n")
 		outs_rs[class_name]['struct'].write("}\n")
 
-		if last_version:
-			csharp_ctor.write(f'\t\tpublic {class_name}(Delegate_GetProcAddress GetProcAddress) : base(GetProcAddress)\n')
-			outs_cpp.write(f'\t{class_name}::{class_name}(Func_GetProcAddress GetProcAddress):\n')
-			outs_cpp.write(f'\t\t{l_class_name}(GetProcAddress)')
-		elif len(func2load):
-			csharp_ctor.write(f'\t\tpublic {class_name}(Delegate_GetProcAddress GetProcAddress)\n')
-			outs_cpp.write(f'\t{class_name}::{class_name}(Func_GetProcAddress GetProcAddress):\n')
-			outs_cpp.write('\t\tGetProcAddress(GetProcAddress),\n')
-		csharp_ctor.write('\t\t{\n')
-		
-		if not last_version:
-			#outs_cpp.write(",\n".join([f"\t\t{membername}({funcname})" for membername, funcname in func2load.items()] + ['\t\tVer_Major(0)', '\t\tVer_Minor(0)', '\t\tVer_Release(0)']))
-			if len(func2load):
-				outs_cpp.write(",\n".join([f'\t\t{membername}(GetProc<PFN{funcname.upper()}PROC>("{funcname}", Null_{funcname}))' for membername, funcname in func2load.items()]))
-			outs_cpp.write(',\n')
-			outs_cpp.write(",\n".join(['\t\tVer_Major(0)', '\t\tVer_Minor(0)', '\t\tVer_Release(0)']))
-			outs_cpp.write('\n\t{\n')
-			outs_cpp.write('\t\tAvailable = true;\n')
-			outs_cpp.write('\t\tauto Ver = (const char*)GetString(VERSION);\n')
-			outs_cpp.write('\t\tVendor = (const char*)GetString(VENDOR);\n')
-			outs_cpp.write('\t\tRenderer = (const char*)GetString(RENDERER);\n')
-			outs_cpp.write('\t\tVersion = Ver;\n')
-			outs_cpp.write('\t\tif (Ver)\n')
-			outs_cpp.write('\t\t{\n')
-			outs_cpp.write('\t\t\tauto ch = Ver;\n')
-			outs_cpp.write('\t\t\tif (strstr(ch, "OpenGL ES")) ch += sizeof "OpenGL ES";\n')
-			outs_cpp.write('\t\t\tVer_Major = atoi(ch);\n')
-			outs_cpp.write('\t\t\twhile (isdigit(*ch)) ch++;\n')
-			outs_cpp.write("\t\t\tif (*ch == '.')\n")
-			outs_cpp.write('\t\t\t{\n')
-			outs_cpp.write('\t\t\t\tch++;\n')
-			outs_cpp.write('\t\t\t\tVer_Minor = atoi(ch);\n')
-			outs_cpp.write('\t\t\t\twhile (isdigit(*ch)) ch++;\n')
-			outs_cpp.write("\t\t\t\tif (*ch == '.')\n")
-			outs_cpp.write('\t\t\t\t{\n')
-			outs_cpp.write('\t\t\t\t\tch++;\n')
-			outs_cpp.write('\t\t\t\t\tVer_Release = atoi(ch);\n')
-			outs_cpp.write('\t\t\t\t}\n')
-			outs_cpp.write('\t\t\t}\n')
-			outs_cpp.write('\t\t}\n')
-			outs_cpp.write('\t}\n')
-			csharp_ctor.write('\t\t\tthis.GetProcAddress = GetProcAddress;\n')
-			csharp_ctor.write('\t\t\tAvailable = true;\n')
-			safe_load = []
-			unsafe_load = []
-			for membername, type_and_name in csharp_func2load.items():
-				functype, funcname = type_and_name
-				if membername.endswith('_unsafe') and funcname.endswith('_unsafe'):
-					unsafe_load += [(membername, funcname)]
-				else:
-					safe_load += [(membername, funcname)]
-			for membername, funcname in safe_load:
-				csharp_ctor.write(f'\t\t\t{membername} = {funcname};\n')
-			if len(unsafe_load):
-				csharp_ctor.write('\t\t\tunsafe\n')
-				csharp_ctor.write('\t\t\t{\n')
-				for membername, funcname in unsafe_load:
-					csharp_ctor.write(f'\t\t\t\t{membername} = {funcname};\n')
-				csharp_ctor.write('\t\t\t}\n')
-			csharp_ctor.write('\t\t\tvar VersionString = Marshal.PtrToStringAnsi(GetString(VERSION));\n')
-			csharp_ctor.write('\t\t\tVendor = Marshal.PtrToStringAnsi(GetString(VENDOR));\n')
-			csharp_ctor.write('\t\t\tRenderer = Marshal.PtrToStringAnsi(GetString(RENDERER));\n')
-			csharp_ctor.write('\t\t\tVersion = VersionString;\n')
-			csharp_ctor.write('\t\t\tif (!string.IsNullOrWhiteSpace(VersionString))\n')
-			csharp_ctor.write('\t\t\t{\n')
-			csharp_ctor.write('\t\t\t\tstring[] VendorSplit = VersionString.Split();\n')
-			csharp_ctor.write("\t\t\t\tstring[] VersionSplit = VendorSplit[0].Split('.');\n")
-			csharp_ctor.write('\t\t\t\tVer_Major = Convert.ToInt32(VersionSplit[0]);\n')
-			csharp_ctor.write('\t\t\t\tVer_Minor = Convert.ToInt32(VersionSplit[1]);\n')
-			csharp_ctor.write('\t\t\t\tVer_Release = Convert.ToInt32(VersionSplit[2]);\n')
-			csharp_ctor.write('\t\t\t}\n')
-		else:
-			if len(func2load):
-				outs_cpp.write(',\n')
-				outs_cpp.write(",\n".join([f'\t\t{membername}(GetProc<PFN{funcname.upper()}PROC>("{funcname}", Null_{funcname}))' for membername, funcname in func2load.items()]))
-			outs_cpp.write('\n\t{\n')
-			if version_name.startswith('VERSION_'):
-				outs_cpp.write(f'\t\tAvailable = Ver_Major > {major} || (Ver_Major == {major} && (Ver_Minor > {minor} || (Ver_Minor == {minor} && Ver_Release >= {release})));\n')
-				if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
-					outs_cpp.write(f'\t\tShadingLanguageVersion = reinterpret_cast<const char*>(GetString(SHADING_LANGUAGE_VERSION));\n')
-			else:
-				outs_cpp.write(f'\t\tAvailable = true;\n')
-			outs_cpp.write('\t}\n')
-
-			csharp_ctor.write(f'\t\t\tAvailable = Ver_Major > {major} || (Ver_Major == {major} && (Ver_Minor > {minor} || (Ver_Minor == {minor} && Ver_Release >= {release})));\n')
-			csharp_ctor.write(f'\t\t\tif (Available)\n')
-			csharp_ctor.write('\t\t\t{\n')
-			csharp_ctor.write('\t\t\t\ttry\n')
-			csharp_ctor.write('\t\t\t\t{\n')
-			for membername, type_and_name in csharp_func2load.items():
-				functype, funcname = type_and_name
-				csharp_ctor.write(f'\t\t\t\t\t{membername} = GetOpenGLFunctionDelegate<{functype}>("{funcname}");\n')
-			csharp_ctor.write('\t\t\t\t}\n')
-			csharp_ctor.write('\t\t\t\tcatch (NullOpenGLFunctionPointerException)\n')
-			csharp_ctor.write('\t\t\t\t{\n')
-			csharp_ctor.write('\t\t\t\t\tAvailable = false;\n')
-			csharp_ctor.write('\t\t\t\t}\n')
-			if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
-				csharp_ctor.write('\t\t\t\tShadingLanguageVersion = Marshal.PtrToStringAnsi(GetString(SHADING_LANGUAGE_VERSION));\n')
-			csharp_ctor.write('\t\t\t}\n')
-		outs_cpp.write('\n')
-
-		csharp_ctor.write('\t\t}\n')
-
-		outs_cpp.write('\n')
 		outs_rs[class_name]['impl'].write("}\n\n")
 		outs_rs[class_name]['trait'].write("}\n")
 
@@ -1629,15 +3792,17 @@ def do_parse(parsefiles, glxml):
 			outs_rs[class_name]['impl'].write('\t\t\trenderer: "unknown",\n')
 			outs_rs[class_name]['impl'].write('\t\t\tversion: "unknown",\n')
 		else:
-			l_class_name = _style_change(last_version)
 			outs_rs[class_name]['impl'].write("\t\tSelf {\n")
 			outs_rs[class_name]['impl'].write("\t\t\tavailable: false,\n")
-		if not is_first_ver and not is_first_es_ver:
-			outs_rs[class_name]['impl'].write(f'\t\t\tgeterror: dummy_pfnglgeterrorproc,\n')
-		for funcn, funcproto in curver['funcproto'].items():
-			membername = funcn[len(prefix):]
-			functype = f'PFN{funcn.upper()}PROC'
-			outs_rs[class_name]['impl'].write(f'\t\t\t{membername.lower()}: dummy_{functype.lower()},\n')
+		if shared:
+			outs_rs[class_name]['impl'].write('\t\t\tprocs: Arc::default(),\n')
+		else:
+			if not is_first_ver and not is_first_es_ver:
+				outs_rs[class_name]['impl'].write(f'\t\t\tgeterror: {"None" if nullcheck else "dummy_pfnglgeterrorproc"},\n')
+			for funcn, funcproto in curver['funcproto'].items():
+				membername = funcn[len(prefix):]
+				functype = f'PFN{funcn.upper()}PROC'
+				outs_rs[class_name]['impl'].write(f'\t\t\t{membername.lower()}: {"None" if nullcheck else f"dummy_{functype.lower()}"},\n')
 		if 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
 			outs_rs[class_name]['impl'].write('\t\t\tshading_language_version: "unknown",\n')
 
@@ -1661,9 +3826,13 @@ def do_parse(parsefiles, glxml):
 		elif 'SHADING_LANGUAGE_VERSION' in curver['define'].keys():
 			outs_rs[class_name]['impl'].write(f'\t\t\t.field("shading_language_version", &self.shading_language_version)\n')
 		for funcn, funcproto in curver['funcproto'].items():
+			if shared: break
 			membername = funcn[len(prefix):].lower()
 			functype = f'PFN{funcn.upper()}PROC'
 			dummyfunc = f'dummy_{functype.lower()}'
+			if nullcheck:
+				outs_rs[class_name]['impl'].write(f'\t\t\t.field("{membername}", &self.{membername})\n')
+				continue
 			outs_rs[class_name]['impl'].write(f'\t\t\t.field("{membername}", unsafe' + '{' + f'if transmute::<_, *const c_void>(self.{membername}) == ({dummyfunc} as *const c_void) ' + '{' + f'&null::<{functype}>()' + '} else {' + f'&self.{membername}' + '}})\n')
 		outs_rs[class_name]['impl'].write(f'\t\t\t.finish()\n')
 		outs_rs[class_name]['impl'].write('\t\t} else {\n')
@@ -1673,50 +3842,70 @@ def do_parse(parsefiles, glxml):
 		outs_rs[class_name]['impl'].write('\t\t}\n')
 		outs_rs[class_name]['impl'].write('\t}\n')
 		outs_rs[class_name]['impl'].write('}\n\n')
+		return {
+			'global': {k: outs_rs['global'][k].getvalue() for k in rs_global_streams},
+			'version': {k: outs_rs[class_name][k].getvalue() for k in rs_global_streams},
+		}
 
-		def mergeinto(desc, data):
-			nonlocal outs_csharp
-			if len(data):
-				outs_csharp.write(f'\t\t#region "{desc}"\n')
-				outs_csharp.write(data)
-				if data[-1] != '\n': outs_csharp.write('\n')
-				outs_csharp.write(f'\t\t#endregion // {desc}\n')
-
-		mergeinto('Constants', csharp_constdef.getvalue())
-		mergeinto('Function import', csharp_funcimp.getvalue())
-		mergeinto('Callback delegate functions', csharp_delecb.getvalue())
-		mergeinto('Delegate function types', csharp_deletype.getvalue())
-		mergeinto('Delegate functions', csharp_deledef.getvalue())
-		mergeinto('Utilities', csharp_utilities.getvalue())
-		mergeinto('Constructor', csharp_ctor.getvalue())
-		mergeinto('Overload functions', csharp_overloads.getvalue())
-
-		outs_csharp.write('\t}\n')
-		outs_csharp.write(f'\t#endregion // {PREFIX_}{version_name}\n')
-
-		parsed['typealias'] |= curver['typealias']
-		parsed['define'] |= curver['define']
-		parsed['functype'] |= curver['functype']
-		last_version = version_name
-
-	on_stomach = {
-		'version': _on_version,
-		'typealias': _on_typealias,
-		'define': _on_define,
-		'functype': _on_functype,
-		'funcproto': _on_funcproto,
-		'version_end': _on_version_end
-	}
-
-	for parsefile in parsefiles:
-		for swallow in _chew(parsefile):
-			on_stomach[swallow['type']](swallow)
+	rs_items = []
+	for info, curver in _version_infos(versions):
+		define_types = _define_types(curver, registry)
+		version_ids = {funcn: call_ids[funcn] for funcn in curver['funcproto']} if instrument else {}
+		frag = _fragment(fragments, new_fragments, ['rs', info, curver, define_types, options] + ([version_ids] if instrument else []) + ([shared_loads[info['id']]] if shared else []), lambda: _on_version_end(info, curver))
+		for k in rs_global_streams:
+			outs_rs['global'][k].write(frag['global'][k])
+		outs_rs['global']['members'] += [(info['name'].lower(), info['class_name'])]
+		firstver_classname = info['firstver_classname']
+		rs_items += [frag['version']]
 
 	outs_rs['global']['struct'].write("}\n")
 
 	rs_global_members = outs_rs['global']['members']
 	first_member_name = rs_global_members[0][0]
 
+	if shared:
+		outs_rs['global']['impl'].write(f'/// One function pointer per unique symbol of every {OpenGL} and {OpenGL} ES version, the version structs of a context share it\n')
+		outs_rs['global']['impl'].write(f'{rust_derive}\n')
+		outs_rs['global']['impl'].write('pub struct GLProcs {\n')
+		for membername, funcn in shared_procs.items():
+			outs_rs['global']['impl'].write(f"\tpub {membername}: {rs_pfn(f'PFN{funcn.upper()}PROC')},\n")
+		outs_rs['global']['impl'].write('}\n')
+		outs_rs['global']['impl'].write('\n')
+		outs_rs['global']['impl'].write('impl GLProcs {\n')
+		outs_rs['global']['impl'].write(f'\t/// Resolve the functions of the versions after the first one up to `version`, of the {OpenGL} ES family if `es`\n')
+		outs_rs['global']['impl'].write("\tfn load_context(&mut self, es: bool, version: (u32, u32, u32), get_proc_address: &mut impl FnMut(&'static str) -> *const c_void) {\n")
+		for info, curver in _version_infos(versions):
+			if info['is_first_ver']: continue
+			es = 'es' if info['OpenGL'] == f'{OpenGL} ES' else '!es'
+			outs_rs['global']['impl'].write(f"\t\tif {es} && version >= ({info['major']}, {info['minor']}, {info['release']}) {{\n")
+			outs_rs['global']['impl'].write(f"\t\t\tself.load_{info['name'].lower()}(get_proc_address);\n")
+			outs_rs['global']['impl'].write('\t\t}\n')
+		outs_rs['global']['impl'].write('\t}\n')
+		outs_rs['global']['impl'].write('}\n')
+		outs_rs['global']['impl'].write('\n')
+		outs_rs['global']['impl'].write('impl Default for GLProcs {\n')
+		outs_rs['global']['impl'].write('\tfn default() -> Self {\n')
+		outs_rs['global']['impl'].write('\t\tSelf {\n')
+		for membername, funcn in shared_procs.items():
+			outs_rs['global']['impl'].write(f"\t\t\t{membername}: {'None' if nullcheck else f'dummy_pfn{funcn.lower()}proc'},\n")
+		outs_rs['global']['impl'].write('\t\t}\n')
+		outs_rs['global']['impl'].write('\t}\n')
+		outs_rs['global']['impl'].write('}\n')
+		outs_rs['global']['impl'].write('\n')
+		outs_rs['global']['impl'].write('impl Debug for GLProcs {\n')
+		outs_rs['global']['impl'].write('\tfn fmt(&self, f: &mut Formatter) -> fmt::Result {\n')
+		outs_rs['global']['impl'].write('\t\tf.debug_struct("GLProcs")\n')
+		for membername, funcn in shared_procs.items():
+			functype = f'PFN{funcn.upper()}PROC'
+			if nullcheck:
+				outs_rs['global']['impl'].write(f'\t\t.field("{membername}", &self.{membername})\n')
+				continue
+			outs_rs['global']['impl'].write(f'\t\t.field("{membername}", unsafe' + '{' + f'if transmute::<_, *const c_void>(self.{membername}) == (dummy_{functype.lower()} as *const c_void) ' + '{' + f'&null::<{functype}>()' + '} else {' + f'&self.{membername}' + '}})\n')
+		outs_rs['global']['impl'].write('\t\t.finish()\n')
+		outs_rs['global']['impl'].write('\t}\n')
+		outs_rs['global']['impl'].write('}\n')
+		outs_rs['global']['impl'].write('\n')
+
 	outs_rs['global']['impl'].write(f'impl {rs_global_struct_name} {{\n')
 	outs_rs['global']['impl'].write("\tpub fn new(mut get_proc_address: impl FnMut(&'static str) -> *const c_void) -> Result<Self> {\n")
 	outs_rs['global']['impl'].write(f'\t\tlet {first_member_name} = {firstver_classname}::new(&mut get_proc_address)?;\n')
@@ -1724,29 +3913,33 @@ def do_parse(parsefiles, glxml):
 	outs_rs['global']['impl'].write(f'\t\t\treturn Ok(Self::default());\n')
 	outs_rs['global']['impl'].write('\t\t}\n')
 	outs_rs['global']['impl'].write('\t\tOk(Self {\n')
-	outs_rs['global']['impl'].write(f'\t\t\t{first_member_name},\n')
+	if not shared:
+		outs_rs['global']['impl'].write(f'\t\t\t{first_member_name},\n')
 	for i in range(1, len(rs_global_members)):
 		name, type = rs_global_members[i]
-		outs_rs['global']['impl'].write(f'\t\t\t{name}: {type}::new({first_member_name}, &mut get_proc_address),\n')
+		if shared:
+			outs_rs['global']['impl'].write(f'\t\t\t{name}: {type}::new(&{first_member_name}),\n')
+		else:
+			outs_rs['global']['impl'].write(f'\t\t\t{name}: {type}::new({first_member_name}, &mut get_proc_address),\n')
+	if shared:
+		outs_rs['global']['impl'].write(f'\t\t\t{first_member_name},\n')
 	outs_rs['global']['impl'].write('\t\t})\n')
 	outs_rs['global']['impl'].write('\t}\n')
+	outs_rs['global']['impl'].write('\t/// Check `glGetError()` now, like at the end of a frame or a scope with `ErrorCheck::Deferred`. The error is attributed to the last function called without a check\n')
+	outs_rs['global']['impl'].write('\t#[cfg(feature = "diagnose")]\n')
+	outs_rs['global']['impl'].write('\tpub fn check_errors(&self) -> Result<()> {\n')
+	outs_rs['global']['impl'].write(f'\t\tself.{first_member_name}.check_errors()\n')
+	outs_rs['global']['impl'].write('\t}\n')
 	outs_rs['global']['impl'].write('}\n\n')
 
-	outs_hpp.write('};\n')
-	outs_cpp.write('};\n')
-	outs_csharp.write('};\n')
-	rs_items = []
-	for (key, ver) in outs_rs.items():
-		if key != 'global':
-			rs_items += [ver]
 	rs_global = outs_rs['global']
 	outs_rs = '\n'.join(
 		[rs_global['predef'].getvalue()] +
 		['\n'.join([
-			ver['predef'].getvalue(),
-			ver['trait'].getvalue(),
-			ver['struct'].getvalue(),
-			ver['impl'].getvalue()
+			ver['predef'],
+			ver['trait'],
+			ver['struct'],
+			ver['impl']
 		]) for ver in rs_items] +
 		[
 			rs_global['trait'].getvalue(),
@@ -1755,12 +3948,509 @@ def do_parse(parsefiles, glxml):
 		]
 	)
 
-	return outs_hpp.getvalue(), outs_cpp.getvalue(), outs_csharp.getvalue(), outs_rs.replace('\n\n\n', '\n')
+	if state_cache:
+		outs_sc = {k: io.StringIO() for k in ('predef', 'struct', 'impl')}
+		caches, invalidators = _state_cache_model(versions, registry)
+		groups = {cache['group']: cache['slots'] for cache in caches if cache['kind'] == 'keyed'}
+
+		def rs_params(arglist):
+			return [(rs_keyword_rename(argname), rs_argtype_conv(argtype)) for argtype, argname, haveconst in _c_params(arglist)]
+
+		def rs_tuple(items):
+			return f'({items[0]},)' if len(items) == 1 else f'({", ".join(items)})'
+
+		def write_invalidations(members, indent):
+			for member in members:
+				outs_sc['impl'].write(f'{indent}self.invalidate_{member.lower()}();\n')
+
+		outs_sc['predef'].write('/// The texture units of which `StateCache` caches the texture bindings\n')
+		outs_sc['predef'].write('pub const STATE_CACHE_TEXTURE_UNITS: usize = 32;\n')
+		outs_sc['predef'].write('\n')
+		for group, slots in groups.items():
+			outs_sc['predef'].write(f'/// The slot of a `{group}` value in the caches of `StateCache`\n')
+			outs_sc['predef'].write(f'fn state_cache_slot_{group.lower()}(value: GLenum) -> Option<usize> {{\n')
+			outs_sc['predef'].write('\tmatch value {\n')
+			for slot, (enum, value) in enumerate(slots):
+				outs_sc['predef'].write(f'\t\t{enum} => Some({slot}),\n')
+			outs_sc['predef'].write('\t\t_ => None,\n')
+			outs_sc['predef'].write('\t}\n')
+			outs_sc['predef'].write('}\n')
+			outs_sc['predef'].write('\n')
+
+		outs_sc['predef'].write('/// How many calls of each function `StateCache` dropped\n')
+		outs_sc['predef'].write('#[derive(Debug, Default)]\n')
+		outs_sc['predef'].write('pub struct StateCacheCounters {\n')
+		for cache in caches:
+			for funcn, arglist, value in cache['funcs']:
+				outs_sc['predef'].write(f'\tpub {funcn[len(prefix):].lower()}: Cell<u64>,\n')
+		outs_sc['predef'].write('}\n')
+		outs_sc['predef'].write('\n')
+
+		outs_sc['struct'].write(f'/// Drops the calls that would set the {OpenGL} state to what it already is, the other functions are reached through\n')
+		outs_sc['struct'].write('/// `Deref` to `GLCore`. The state starts unknown and each cache is filled by the first call to its functions. Call\n')
+		outs_sc['struct'].write('/// `invalidate_state_cache()` after the state was changed behind its back, like by another library or through `GLCore`.\n')
+		outs_sc['struct'].write('///\n')
+		outs_sc['struct'].write('/// The caches assume the calls succeed: after a call that fails, like binding a texture name to a second target,\n')
+		outs_sc['struct'].write("/// an identical call is dropped without raising the error again. Targets and capabilities that aren't in the enum\n")
+		outs_sc['struct'].write('/// group, and texture units past `STATE_CACHE_TEXTURE_UNITS`, are never cached.\n')
+		outs_sc['struct'].write('#[derive(Debug)]\n')
+		outs_sc['struct'].write('pub struct StateCache {\n')
+		outs_sc['struct'].write('\tgl: GLCore,\n')
+		for cache in caches:
+			member = cache['member'].lower()
+			if cache['kind'] == 'keyed':
+				valtype = 'bool' if cache['funcs'][0][2] is not None else 'GLuint'
+				slots = f"[Cell<Option<{valtype}>>; {len(cache['slots'])}]"
+				if cache['per_unit']:
+					slots = f'[{slots}; STATE_CACHE_TEXTURE_UNITS]'
+				outs_sc['struct'].write(f'\t{member}: {slots},\n')
+			else:
+				outs_sc['struct'].write(f"\t{member}: Cell<Option<{rs_tuple([argtype for argname, argtype in rs_params(cache['funcs'][0][1])])}>>,\n")
+		outs_sc['struct'].write('\t/// How many calls of each function were dropped\n')
+		outs_sc['struct'].write('\tpub filtered: StateCacheCounters,\n')
+		outs_sc['struct'].write('}\n')
+		outs_sc['struct'].write('\n')
+		outs_sc['struct'].write('impl std::ops::Deref for StateCache {\n')
+		outs_sc['struct'].write(f'\ttype Target = {rs_global_struct_name};\n')
+		outs_sc['struct'].write(f'\tfn deref(&self) -> &{rs_global_struct_name} {{\n')
+		outs_sc['struct'].write('\t\t&self.gl\n')
+		outs_sc['struct'].write('\t}\n')
+		outs_sc['struct'].write('}\n')
+		outs_sc['struct'].write('\n')
+
+		outs_sc['impl'].write('impl StateCache {\n')
+		outs_sc['impl'].write(f'\tpub fn new(gl: {rs_global_struct_name}) -> Self {{\n')
+		outs_sc['impl'].write('\t\tSelf {\n')
+		outs_sc['impl'].write('\t\t\tgl,\n')
+		for cache in caches:
+			member = cache['member'].lower()
+			if cache['kind'] == 'keyed' and cache['per_unit']:
+				outs_sc['impl'].write(f'\t\t\t{member}: std::array::from_fn(|_| std::array::from_fn(|_| Cell::new(None))),\n')
+			elif cache['kind'] == 'keyed':
+				outs_sc['impl'].write(f'\t\t\t{member}: std::array::from_fn(|_| Cell::new(None)),\n')
+			else:
+				outs_sc['impl'].write(f'\t\t\t{member}: Cell::new(None),\n')
+		outs_sc['impl'].write('\t\t\tfiltered: StateCacheCounters::default(),\n')
+		outs_sc['impl'].write('\t\t}\n')
+		outs_sc['impl'].write('\t}\n')
+		outs_sc['impl'].write(f'\t/// Get the `{rs_global_struct_name}` back\n')
+		outs_sc['impl'].write(f'\tpub fn into_inner(self) -> {rs_global_struct_name} {{\n')
+		outs_sc['impl'].write('\t\tself.gl\n')
+		outs_sc['impl'].write('\t}\n')
+		outs_sc['impl'].write('\t/// How many calls were dropped in total\n')
+		outs_sc['impl'].write('\tpub fn filtered_total(&self) -> u64 {\n')
+		outs_sc['impl'].write(f"\t\t{' + '.join(f'self.filtered.{funcn[len(prefix):].lower()}.get()' for cache in caches for funcn, arglist, value in cache['funcs'])}\n")
+		outs_sc['impl'].write('\t}\n')
+		outs_sc['impl'].write('\t/// Forget all of the cached state\n')
+		outs_sc['impl'].write('\tpub fn invalidate_state_cache(&self) {\n')
+		write_invalidations([cache['member'] for cache in caches], '\t\t')
+		outs_sc['impl'].write('\t}\n')
+		for cache in caches:
+			member = cache['member'].lower()
+			outs_sc['impl'].write(f"\t/// Forget the state cached for `{cache['funcs'][0][0]}()`\n")
+			outs_sc['impl'].write(f'\tpub fn invalidate_{member}(&self) {{\n')
+			if cache['kind'] == 'keyed':
+				outs_sc['impl'].write(f"\t\tself.{member}.iter(){'.flatten()' if cache['per_unit'] else ''}.for_each(|slot| slot.set(None));\n")
+			else:
+				outs_sc['impl'].write(f'\t\tself.{member}.set(None);\n')
+			outs_sc['impl'].write('\t}\n')
+
+		for cache in caches:
+			member = cache['member'].lower()
+			for funcn, arglist, value in cache['funcs']:
+				counter = f'self.filtered.{funcn[len(prefix):].lower()}'
+				params = rs_params(arglist)
+				dropped = invalidators.get(funcn, ((), []))[1]
+				outs_sc['impl'].write('\t#[inline(always)]\n')
+				outs_sc['impl'].write(f'\tpub fn {funcn}({rs_arg(arglist)}) -> Result<()> {{\n')
+				if cache['kind'] == 'keyed':
+					key, name = params[0][0], params[-1][0]
+					cached = f'Some({name})' if value is None else f'Some({"true" if value == 2 else "false"})'
+					if cache['per_unit']:
+						outs_sc['impl'].write(f'\t\tlet unit = self.activetexture.get().map(|(texture,)| texture.wrapping_sub({PREFIX_}TEXTURE0) as usize);\n')
+						outs_sc['impl'].write(f"\t\tlet slot = match (unit, state_cache_slot_{cache['group'].lower()}({key})) {{\n")
+						outs_sc['impl'].write(f'\t\t\t(Some(unit), Some(slot)) if unit < STATE_CACHE_TEXTURE_UNITS => Some(&self.{member}[unit][slot]),\n')
+						outs_sc['impl'].write('\t\t\t_ => None,\n')
+						outs_sc['impl'].write('\t\t};\n')
+					else:
+						outs_sc['impl'].write(f"\t\tlet slot = state_cache_slot_{cache['group'].lower()}({key}).map(|slot| &self.{member}[slot]);\n")
+					outs_sc['impl'].write(f'\t\tif slot.is_some_and(|slot| slot.get() == {cached}) {{\n')
+				else:
+					outs_sc['impl'].write(f'\t\tif self.{member}.get() == Some({rs_tuple([argname for argname, argtype in params])}) {{\n')
+				outs_sc['impl'].write(f'\t\t\t{counter}.set({counter}.get() + 1);\n')
+				outs_sc['impl'].write('\t\t\treturn Ok(());\n')
+				outs_sc['impl'].write('\t\t}\n')
+				outs_sc['impl'].write(f'\t\tself.gl.{funcn}({rs_call_arg(arglist)})?;\n')
+				if cache['kind'] == 'keyed':
+					outs_sc['impl'].write('\t\tif let Some(slot) = slot {\n')
+					outs_sc['impl'].write(f'\t\t\tslot.set({cached});\n')
+					if cache['per_unit']:
+						outs_sc['impl'].write('\t\t} else if unit.is_none() {\n')
+						outs_sc['impl'].write(f'\t\t\tself.invalidate_{member}();\n')
+					outs_sc['impl'].write('\t\t}\n')
+				elif funcn == f'{prefix}ActiveTexture':
+					# A unit past the cached ones may be out of range, caching it would hide the error of the next call
+					outs_sc['impl'].write(f'\t\tself.{member}.set((({params[0][0]}.wrapping_sub({PREFIX_}TEXTURE0) as usize) < STATE_CACHE_TEXTURE_UNITS).then_some({rs_tuple([argname for argname, argtype in params])}));\n')
+				else:
+					outs_sc['impl'].write(f'\t\tself.{member}.set(Some({rs_tuple([argname for argname, argtype in params])}));\n')
+				write_invalidations(dropped, '\t\t')
+				outs_sc['impl'].write('\t\tOk(())\n')
+				outs_sc['impl'].write('\t}\n')
+		cached_funcs = {funcn for cache in caches for funcn, arglist, value in cache['funcs']}
+		for funcn, (funcproto, dropped) in invalidators.items():
+			if funcn in cached_funcs: continue
+			outs_sc['impl'].write('\t#[inline(always)]\n')
+			outs_sc['impl'].write(f"\tpub fn {funcn}({rs_arg(funcproto['arglist'])}) -> Result<()> {{\n")
+			outs_sc['impl'].write(f"\t\tlet ret = self.gl.{funcn}({rs_call_arg(funcproto['arglist'])});\n")
+			write_invalidations(dropped, '\t\t')
+			outs_sc['impl'].write('\t\tret\n')
+			outs_sc['impl'].write('\t}\n')
+		outs_sc['impl'].write('}\n')
+		outs_sc['impl'].write('\n')
+
+		outs_rs += '\n'.join([outs_sc['predef'].getvalue(), outs_sc['struct'].getvalue(), outs_sc['impl'].getvalue()])
+
+	if len(extensions):
+		outs_ext = {k: io.StringIO() for k in ('predef', 'struct', 'loader')}
+		ext_defined = set()
+		ext_infos = list(_extension_infos(registry, extensions))
+
+		outs_ext['predef'].write(f'/// The {OpenGL} extensions, each one is only loaded when first asked for\n')
+		outs_ext['predef'].write('pub mod extensions {\n')
+		outs_ext['predef'].write('use super::*;\n')
+		outs_ext['predef'].write('use std::{\n')
+		outs_ext['predef'].write('\tcell::OnceCell,\n')
+		outs_ext['predef'].write('\tcollections::HashSet,\n')
+		outs_ext['predef'].write('\tffi::{c_void, CStr},\n')
+		outs_ext['predef'].write('\tmem::transmute,\n')
+		outs_ext['predef'].write('};\n')
+		outs_ext['predef'].write('\n')
+		for alias, target in (
+			('GLint64EXT', 'i64'),
+			('GLuint64EXT', 'u64'),
+			('GLeglImageOES', '*mut c_void'),
+			('GLDEBUGPROCARB', 'GLDEBUGPROC'),
+			('GLDEBUGPROCKHR', 'GLDEBUGPROC'),
+			('GLVULKANPROCNV', 'extern "system" fn()'),
+			('_cl_context', 'c_void'),
+			('_cl_event', 'c_void'),
+		):
+			outs_ext['predef'].write(f'/// Alias to `{target}`\n')
+			outs_ext['predef'].write(f'pub type {alias} = {target};\n')
+			outs_ext['predef'].write('\n')
+
+		for info, curext in ext_infos:
+			ext_name = info['id']
+			class_name = info['class_name']
+			for defn, defv in curext['define'].items():
+				if f'{PREFIX_}{defn}' in ext_defined: continue
+				ext_defined.add(f'{PREFIX_}{defn}')
+				outs_ext['predef'].write(f'/// Constant value defined from `{ext_name}`\n')
+				outs_ext['predef'].write(f"pub const {PREFIX_}{defn}: {_define_type(defn, defv, registry)} = {rs_const_value(defv)};\n")
+				outs_ext['predef'].write('\n')
+
+			outs_ext['struct'].write(f'/// Functions from `{ext_name}`\n')
+			outs_ext['struct'].write(f'{rust_derive}\n')
+			outs_ext['struct'].write(f'pub struct {class_name} {{\n')
+			outs_ext['struct'].write(f'\t/// Are all of the functions of `{ext_name}` available\n')
+			outs_ext['struct'].write('\tavailable: bool,\n')
+			for funcn, funcproto in curext['funcproto'].items():
+				functype = f'PFN{funcn.upper()}PROC'
+				rettype = funcproto['ret']
+				arglist = funcproto['arglist']
+				outs_ext['struct'].write('\n')
+				outs_ext['struct'].write(f'\t/// The function pointer to `{funcn}()`\n')
+				outs_ext['struct'].write(f'\tpub {funcn[len(prefix):].lower()}: {functype},\n')
+				if functype in ext_defined: continue
+				ext_defined.add(functype)
+				outs_ext['predef'].write(f'/// The prototype to the {OpenGL} function `{funcn[len(prefix):]}`\n')
+				outs_ext['predef'].write(f'pub type {functype} = extern "system" fn({rs_arg_fp(arglist)}){rs_ret(rettype, use_result = False)};\n')
+				outs_ext['predef'].write('\n')
+				outs_ext['predef'].write(f'/// The dummy function of `{funcn[len(prefix):]}()`\n')
+				outs_ext['predef'].write(f'extern "system" fn dummy_{functype.lower()} ({rs_arg(arglist, emit_argn = True, with_self = False)}){rs_ret(rettype, use_result = False)} {{\n')
+				outs_ext['predef'].write(f'\tpanic!("{OpenGL} function pointer `{funcn}()` is null.")\n')
+				outs_ext['predef'].write('}\n')
+				outs_ext['predef'].write('\n')
+			outs_ext['struct'].write('}\n')
+			outs_ext['struct'].write('\n')
+
+			outs_ext['struct'].write(f'impl {class_name} {{\n')
+			if len(curext['funcproto']):
+				outs_ext['struct'].write("\tpub fn new(mut get_proc_address: impl FnMut(&'static str) -> *const c_void) -> Self {\n")
+				outs_ext['struct'].write('\t\tlet mut available = true;\n')
+				outs_ext['struct'].write('\t\tSelf {\n')
+				for funcn in curext['funcproto'].keys():
+					functype = f'PFN{funcn.upper()}PROC'
+					outs_ext['struct'].write(f'\t\t\t{funcn[len(prefix):].lower()}: {{let proc = get_proc_address("{funcn}"); if proc.is_null() {{available = false; dummy_{functype.lower()}}} else {{unsafe{{transmute(proc)}}}}}},\n')
+				outs_ext['struct'].write('\t\t\tavailable,\n')
+				outs_ext['struct'].write('\t\t}\n')
+			else:
+				outs_ext['struct'].write("\tpub fn new(_get_proc_address: impl FnMut(&'static str) -> *const c_void) -> Self {\n")
+				outs_ext['struct'].write('\t\tSelf {\n')
+				outs_ext['struct'].write('\t\t\tavailable: true,\n')
+				outs_ext['struct'].write('\t\t}\n')
+			outs_ext['struct'].write('\t}\n')
+			outs_ext['struct'].write('\t#[inline(always)]\n')
+			outs_ext['struct'].write('\tpub fn get_available(&self) -> bool {\n')
+			outs_ext['struct'].write('\t\tself.available\n')
+			outs_ext['struct'].write('\t}\n')
+			outs_ext['struct'].write('}\n')
+			outs_ext['struct'].write('\n')
+
+		outs_ext['loader'].write('/// Gathers the extensions the context reports once, then loads each one on first use\n')
+		outs_ext['loader'].write('///\n')
+		outs_ext['loader'].write('/// `get_proc_address` must also return the OpenGL 1.0 and 1.1 functions `glGetIntegerv` and `glGetString`,\n')
+		outs_ext['loader'].write('/// on Windows that means falling back to the exports of opengl32.dll where `wglGetProcAddress()` returns null\n')
+		outs_ext['loader'].write('pub struct Extensions {\n')
+		outs_ext['loader'].write("\tget_proc_address: Box<dyn Fn(&'static str) -> *const c_void>,\n")
+		outs_ext['loader'].write('\tsupported: HashSet<String>,\n')
+		for info, curext in ext_infos:
+			outs_ext['loader'].write(f"\t{info['class_name'].lower()}: OnceCell<Option<{info['class_name']}>>,\n")
+		outs_ext['loader'].write('}\n')
+		outs_ext['loader'].write('\n')
+		outs_ext['loader'].write('impl Extensions {\n')
+		outs_ext['loader'].write("\tpub fn new(get_proc_address: impl Fn(&'static str) -> *const c_void + 'static) -> Self {\n")
+		outs_ext['loader'].write('\t\tlet mut supported = HashSet::new();\n')
+		outs_ext['loader'].write('\t\tlet get_integerv = get_proc_address("glGetIntegerv");\n')
+		outs_ext['loader'].write('\t\tlet get_stringi = get_proc_address("glGetStringi");\n')
+		outs_ext['loader'].write('\t\tif !get_integerv.is_null() && !get_stringi.is_null() {\n')
+		outs_ext['loader'].write('\t\t\tlet get_integerv: extern "system" fn(GLenum, *mut GLint) = unsafe{transmute(get_integerv)};\n')
+		outs_ext['loader'].write('\t\t\tlet get_stringi: extern "system" fn(GLenum, GLuint) -> *const GLubyte = unsafe{transmute(get_stringi)};\n')
+		outs_ext['loader'].write('\t\t\tlet mut num_extensions: GLint = 0;\n')
+		outs_ext['loader'].write(f'\t\t\tget_integerv({PREFIX_}NUM_EXTENSIONS, &mut num_extensions);\n')
+		outs_ext['loader'].write('\t\t\tfor i in 0..num_extensions.max(0) as GLuint {\n')
+		outs_ext['loader'].write(f'\t\t\t\tlet name = get_stringi({PREFIX_}EXTENSIONS, i);\n')
+		outs_ext['loader'].write('\t\t\t\tif !name.is_null() {\n')
+		outs_ext['loader'].write('\t\t\t\t\tsupported.insert(unsafe{CStr::from_ptr(name as *const i8)}.to_string_lossy().into_owned());\n')
+		outs_ext['loader'].write('\t\t\t\t}\n')
+		outs_ext['loader'].write('\t\t\t}\n')
+		outs_ext['loader'].write('\t\t} else {\n')
+		outs_ext['loader'].write(f'\t\t\t// Before {OpenGL} 3.0 the extensions come as one space separated string\n')
+		outs_ext['loader'].write('\t\t\tlet get_string = get_proc_address("glGetString");\n')
+		outs_ext['loader'].write('\t\t\tif !get_string.is_null() {\n')
+		outs_ext['loader'].write('\t\t\t\tlet get_string: extern "system" fn(GLenum) -> *const GLubyte = unsafe{transmute(get_string)};\n')
+		outs_ext['loader'].write(f'\t\t\t\tlet names = get_string({PREFIX_}EXTENSIONS);\n')
+		outs_ext['loader'].write('\t\t\t\tif !names.is_null() {\n')
+		outs_ext['loader'].write('\t\t\t\t\tsupported.extend(unsafe{CStr::from_ptr(names as *const i8)}.to_string_lossy().split_whitespace().map(String::from));\n')
+		outs_ext['loader'].write('\t\t\t\t}\n')
+		outs_ext['loader'].write('\t\t\t}\n')
+		outs_ext['loader'].write('\t\t}\n')
+		outs_ext['loader'].write('\t\tSelf {\n')
+		outs_ext['loader'].write('\t\t\tget_proc_address: Box::new(get_proc_address),\n')
+		outs_ext['loader'].write('\t\t\tsupported,\n')
+		for info, curext in ext_infos:
+			outs_ext['loader'].write(f"\t\t\t{info['class_name'].lower()}: OnceCell::new(),\n")
+		outs_ext['loader'].write('\t\t}\n')
+		outs_ext['loader'].write('\t}\n')
+		outs_ext['loader'].write('\t#[inline(always)]\n')
+		outs_ext['loader'].write('\tpub fn is_supported(&self, name: &str) -> bool {\n')
+		outs_ext['loader'].write('\t\tself.supported.contains(name)\n')
+		outs_ext['loader'].write('\t}\n')
+		for info, curext in ext_infos:
+			ext_name = info['id']
+			class_name = info['class_name']
+			outs_ext['loader'].write(f'\t/// Get `{ext_name}`, loading it on the first call. `None` if it\'s not supported or any of its functions is missing\n')
+			outs_ext['loader'].write(f'\tpub fn {class_name.lower()}(&self) -> Option<&{class_name}> {{\n')
+			outs_ext['loader'].write(f'\t\tself.{class_name.lower()}.get_or_init(|| {{\n')
+			outs_ext['loader'].write(f'\t\t\tif !self.is_supported("{ext_name}") {{\n')
+			outs_ext['loader'].write('\t\t\t\treturn None;\n')
+			outs_ext['loader'].write('\t\t\t}\n')
+			outs_ext['loader'].write(f'\t\t\tlet ext = {class_name}::new(|name| (self.get_proc_address)(name));\n')
+			outs_ext['loader'].write('\t\t\tif ext.get_available() {Some(ext)} else {None}\n')
+			outs_ext['loader'].write('\t\t}).as_ref()\n')
+			outs_ext['loader'].write('\t}\n')
+		outs_ext['loader'].write('}\n')
+		outs_ext['loader'].write('}\n')
+
+		outs_rs += '\n'.join([outs_ext['predef'].getvalue(), outs_ext['struct'].getvalue(), outs_ext['loader'].getvalue()])
+
+	return {f'{modname}.rs': outs_rs.replace('\n\n\n', '\n')}, new_fragments
+
+backends = {
+	'cpp': _gen_cpp,
+	'cs': _gen_cs,
+	'rs': _gen_rs,
+}
+
+def do_parse(versions, glxml, fragments = None, jobs = 1, targets = None, extensions = (), options = None):
+	"""Run the requested backends over the parsed model, in `jobs` worker processes if more than one.
+
+	`glxml` is either the `do_parse_glxml()` result or its `GLRegistry`. Returns a dict of output file name to content; backends not listed in
+	`targets` are not run at all. The names in `extensions` get their own lazily loaded classes after the versions.
+	`options` holds the generation modes, like `{'cpp_lazy': True}`.
+	"""
+	registry = glxml if isinstance(glxml, GLRegistry) else GLRegistry(glxml)
+	if targets is None: targets = backends.keys()
+	todo = {target: gen for target, gen in backends.items() if target in targets}
+	results = {}
+	if jobs > 1 and len(todo) > 1:
+		with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as executor:
+			futures = {target: executor.submit(gen, versions, registry, None if fragments is None else fragments.get(target, {}), extensions, options) for target, gen in todo.items()}
+			results = {target: future.result() for target, future in futures.items()}
+	else:
+		for target, gen in todo.items():
+			results[target] = gen(versions, registry, None if fragments is None else fragments.get(target, {}), extensions, options)
+	outputs = {}
+	for target, (outs, new_fragments) in results.items():
+		outputs |= outs
+		if fragments is not None: fragments[target] = new_fragments
+	return outputs
+
+def _collapse_pstats(stats):
+	"""Turn `pstats.Stats` into collapsed stacks (`a;b;c microseconds` per line) for flamegraph tools.
+
+	cProfile only records caller/callee pairs, so the time of a function called
+	from several places is split between its stacks in proportion to the time
+	spent under each caller.
+	"""
+	def label(func):
+		filename, line, name = func
+		if filename == '~': return name.replace(';', ':')
+		return f'{name} ({os.path.basename(filename)}:{line})'.replace(';', ':')
+	children = {}
+	for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+		for caller, edge in callers.items():
+			children.setdefault(caller, []).append((func, edge[3]))
+	collapsed = {}
+	todo = [((func,), (label(func),), 1.0) for func, (cc, nc, tt, ct, callers) in stats.stats.items() if not callers]
+	while todo:
+		path, labels, share = todo.pop()
+		func = path[-1]
+		selftime = int(stats.stats[func][2] * share * 1000000)
+		if selftime > 0:
+			stack = ';'.join(labels)
+			collapsed[stack] = collapsed.get(stack, 0) + selftime
+		for child, edge_time in children.get(func, []):
+			child_time = stats.stats[child][3]
+			if child in path or child_time <= 0: continue
+			child_share = share * edge_time / child_time
+			if child_time * child_share < 0.000001: continue
+			todo.append((path + (child,), labels + (label(child),), child_share))
+	return ''.join(f'{stack} {selftime}\n' for stack, selftime in sorted(collapsed.items()))
 
 if __name__ == '__main__':
-	glxml = do_parse_glxml('gl.xml')
-	hpp, cpp, cs, rs = do_parse(['glcore.h', 'gles32.h'], glxml)
-	with open(f'{modname}.hpp', 'wb') as f: f.write(hpp.encode('utf-8'))
-	with open(f'{modname}.cpp', 'wb') as f: f.write(cpp.encode('utf-8'))
-	with open(f'{modname}.cs', 'w') as f: f.write(cs)
-	with open(f'{modname}.rs', 'w') as f: f.write(rs)
+	glxml_targets = ['json', 'json-compact', 'bin']
+	all_targets = glxml_targets + list(backends.keys())
+	argparser = argparse.ArgumentParser(description='Generate the OpenGL bindings for C++, C# and Rust.')
+	argparser.add_argument('headers', nargs='*', default=['glcore.h', 'gles32.h'], help='the headers to parse, in version order (default: glcore.h gles32.h)')
+	argparser.add_argument('--glxml', default='gl.xml', help='the OpenGL registry to parse (default: gl.xml)')
+	argparser.add_argument('-t', '--targets', default='json,cpp,cs,rs', help=f'comma separated outputs to generate from: {", ".join(all_targets)} (default: json,cpp,cs,rs)')
+	argparser.add_argument('-o', '--out-dir', default='.', help='the directory to write the outputs to (default: the current directory)')
+	argparser.add_argument('-j', '--jobs', type=int, default=1, help='number of worker processes to run the backends in (default: 1)')
+	argparser.add_argument('--extensions', nargs='?', const='', metavar='LIST', help='also generate lazily loaded classes for these comma separated extensions, or for every core profile extension of gl.xml when no LIST is given (default: none)')
+	argparser.add_argument('--cpp-lazy', action='store_true', help='make each C++ function member look its symbol up on its first call instead of in the constructors')
+	argparser.add_argument('--cs-funcptr', action='store_true', help='make the C# functions blittable `delegate* unmanaged[Stdcall]` pointers with wrappers and `Span<T>` overloads instead of marshalling delegates')
+	argparser.add_argument('--rs-nullcheck', action='store_true', help='make the Rust function pointers `Option`s that return `GLCoreError::NullFunctionPointer` when missing, instead of dummy functions that panic and `catch_unwind()`')
+	argparser.add_argument('--state-cache', action='store_true', help='generate `StateCache`, a layer over the C++ version classes and the Rust `GLCore` that drops the binding, capability and state setting calls that change nothing')
+	argparser.add_argument('--command-buffer', action='store_true', help=f'generate the C++ `CommandBuffer` into `{modname}_commandbuffer.hpp` and `{modname}_commandbuffer.cpp`, which records the calls without a return value or output pointers into a byte buffer and replays them through a version class later')
+	argparser.add_argument('--instrument', action='store_true', help='generate the C++ `Instrumented` layer over the version classes and the Rust `instrument` feature, which count the calls and the time spent in each function')
+	argparser.add_argument('--rs-shared-table', action='store_true', help='make the Rust version structs views into one shared `GLProcs` table with a slot per unique symbol, resolving only the family of the context, desktop or ES')
+	argparser.add_argument('--cpp-split', action='store_true', help=f'also write the C++ header as one header per version, each including the one before it, with `{modname}_fwd.hpp` forward declaring the classes and `{modname}.hpp` including them all')
+	argparser.add_argument('--cpp-module', action='store_true', help=f'also write `{modname}.cppm`, a C++20 module interface unit that exports `{modname}.hpp` for `import {modname};` and compiles `{modname}.cpp` into its object file')
+	argparser.add_argument('--table-loader', action='store_true', help='load the functions of each version by one loop over a sorted name table into an array of slots (C++ without --cpp-lazy, and C#; the Rust output ignores it)')
+	argparser.add_argument('--check', action='store_true', help='check the overload classifier against the original linear scan for every command of the registry first, and exit with 1 on a mismatch')
+	argparser.add_argument('--profile', nargs='?', const=modname, metavar='NAME', help=f'profile a full, uncached, single process run into NAME.pstats and NAME.collapsed, and print the hottest functions (default NAME: {modname})')
+	args = argparser.parse_args()
+
+	targets = [t.strip() for t in args.targets.split(',') if t.strip()]
+	for target in targets:
+		if target not in all_targets:
+			argparser.error(f'unknown target `{target}`, expected some of: {", ".join(all_targets)}')
+	target_outputs = {
+		'json': ['json'],
+		'json-compact': ['min.json'],
+		'bin': ['bin'],
+		'cpp': ['hpp', 'cpp'],
+		'cs': ['cs'],
+		'rs': ['rs'],
+	}
+	outputs = [os.path.join(args.out_dir, f'{modname}.{ext}') for target in targets for ext in target_outputs[target]]
+
+	glxmlfile = args.glxml
+	parsefiles = args.headers
+	generator_key = _hash_files([__file__])
+	glxml_key = _hash_files([glxmlfile], generator_key)
+	headers_key = _hash_files(parsefiles, generator_key)
+	options = {}
+	if args.cpp_lazy: options['cpp_lazy'] = True
+	if args.table_loader: options['table_loader'] = True
+	if args.cs_funcptr: options['cs_funcptr'] = True
+	if args.rs_nullcheck: options['rs_nullcheck'] = True
+	if args.state_cache: options['state_cache'] = True
+	if args.command_buffer: options['command_buffer'] = True
+	if args.instrument: options['instrument'] = True
+	if args.rs_shared_table: options['rs_shared_table'] = True
+	if args.cpp_split: options['cpp_split'] = True
+	if args.cpp_module: options['cpp_module'] = True
+	outputs_key = hashlib.sha256(f'{glxml_key}{headers_key}{args.extensions}{json.dumps(options, sort_keys=True)}'.encode('utf-8')).hexdigest()
+	# The fragments don't depend on the inputs, each one is keyed by its own content
+	fragments_key = hashlib.sha256(f'{generator_key}{args.extensions}{json.dumps(options, sort_keys=True)}'.encode('utf-8')).hexdigest()
+
+	use_cache = args.profile is None
+	jobs = args.jobs if use_cache else 1
+
+	def load_glxml():
+		glxml = _cache_load('glxml', glxml_key) if use_cache else None
+		if glxml is None:
+			glxml = do_parse_glxml(glxmlfile)
+			if use_cache: _cache_store('glxml', glxml_key, glxml)
+		return glxml
+
+	def run(glxml = None):
+		# Nothing changed since the last run and the outputs are still intact
+		manifest = _cache_load('outputs', outputs_key) if use_cache else None
+		if manifest is not None and all(os.path.exists(f) and _hash_files([f]) == manifest.get(f) for f in [*outputs, *manifest]):
+			return
+
+		if glxml is None: glxml = load_glxml()
+		results = {}
+		if 'json' in targets:
+			results[f'{modname}.json'] = dump_glxml_json(glxml)
+		if 'json-compact' in targets:
+			results[f'{modname}.min.json'] = dump_glxml_compact(glxml)
+		if 'bin' in targets:
+			results[f'{modname}.bin'] = dump_glxml_binary(glxml)
+		if any(target in backends for target in targets):
+			versions = _cache_load('versions', headers_key) if use_cache else None
+			if versions is None:
+				versions = do_parse_headers(parsefiles)
+				if use_cache: _cache_store('versions', headers_key, versions)
+			registry = GLRegistry(glxml)
+			extensions = ()
+			if args.extensions is not None:
+				core_extensions = [extname for extname in registry.ext_names if 'glcore' in registry.ext_supported[registry.ext_ids[extname]]]
+				extensions = [e.strip() for e in args.extensions.split(',') if e.strip()] or core_extensions
+				for extname in extensions:
+					if extname not in core_extensions:
+						argparser.error(f'`{extname}` is not a core profile extension in `{glxmlfile}`')
+			fragments = (_cache_load('fragments', fragments_key) or {}) if use_cache else None
+			results |= do_parse(versions, registry, fragments, jobs = jobs, targets = targets, extensions = extensions, options = options)
+			if use_cache: _cache_store('fragments', fragments_key, fragments)
+
+		os.makedirs(args.out_dir, exist_ok=True)
+		for filename, data in results.items():
+			_write_if_changed(os.path.join(args.out_dir, filename), data)
+		# The manifest also covers the outputs whose names depend on the inputs, like the per-version C++ headers
+		written = [os.path.join(args.out_dir, filename) for filename in results]
+		if use_cache: _cache_store('outputs', outputs_key, {f: _hash_files([f]) for f in dict.fromkeys(outputs + written)})
+
+	# The parse of the check is handed to `run()`, which then doesn't parse gl.xml a second time
+	checked_glxml = None
+	if args.check:
+		checked_glxml = load_glxml()
+		mismatches = check_overloads(checked_glxml)
+		for membername, expected, got in mismatches:
+			print(f'Overload check mismatch for `{membername}`: expected {expected}, got {got}', file=sys.stderr)
+		if len(mismatches):
+			sys.exit(1)
+
+	if args.profile is None:
+		run(checked_glxml)
+	else:
+		profile = cProfile.Profile()
+		profile.runcall(run)
+		stats = pstats.Stats(profile)
+		stats.dump_stats(f'{args.profile}.pstats')
+		with open(f'{args.profile}.collapsed', 'w', encoding='utf-8') as f:
+			f.write(_collapse_pstats(stats))
+		stats.sort_stats('tottime').print_stats(20)
@@ -1,3 +1,3 @@
 @echo off
-python glparse.py
+python glparse.py --check
 pause